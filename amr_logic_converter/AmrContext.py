@@ -1,20 +1,16 @@
 from __future__ import annotations
 from collections import defaultdict
 from dataclasses import dataclass, field
+from time import perf_counter
 from typing import Callable, Iterable, Optional
 
-from penman.tree import Node, Tree
+from penman.tree import Branch, Node, Tree
 
-from amr_logic_converter.extract_instances_from_amr_tree import (
-    extract_instances_from_amr_tree,
-)
-from amr_logic_converter.find_instance_depths import find_instance_depths
-from amr_logic_converter.find_coreferent_instances import find_coreferent_instances
-from amr_logic_converter.map_instances_lca import map_instances_lca
-from amr_logic_converter.map_instances_to_nodes import map_instances_to_nodes
+from amr_logic_converter.analyze_amr_tree import AmrTreeAnalysis, analyze_amr_tree
+from amr_logic_converter.conversion_metrics import ConversionMetrics
 
 
-@dataclass
+@dataclass(slots=True)
 class OverrideIsProjectiveCallbackInfo:
     """Metadata passed to the OverrideIsProjectiveCallback wtih info about the node being processed"""
 
@@ -45,35 +41,31 @@ class AmrContext:
     # a map of the scope (instance name of the node in the tree this variable should be scoped) to a list of instances
     # `None` as the scope means the instance should be scoped around the entire tree
     scope_instance_map: dict[str | None, set[str]]
+    # the position of each instance in the tree walk order, used to order instances projected at the same scope
+    instance_projection_order: dict[str, int] = field(default_factory=dict)
+    # the edges of each instance in the order they're converted, without any :polarity - edge
+    instance_edges_map: dict[str, list[Branch]] = field(default_factory=dict)
+    # instances with a :polarity - edge
+    negated_instances: frozenset[str] = frozenset()
     rendered_instances: set[str] = field(default_factory=set)
     quantified_instances: set[str] = field(default_factory=set)
+    # timings and counts of the conversion, if the converter is recording them
+    metrics: Optional[ConversionMetrics] = None
 
     @classmethod
     def from_amr_tree(
         cls,
         amr_tree: Tree,
         override_is_projective: Optional[OverrideIsProjectiveCallback] = None,
+        edge_priority: Optional[Callable[[Branch], int]] = None,
+        maximally_hoist_coreferences: bool = False,
+        metrics: Optional[ConversionMetrics] = None,
     ) -> AmrContext:
-        instances = extract_instances_from_amr_tree(amr_tree)
-        coreferent_instances = find_coreferent_instances(amr_tree, instances)
-        instance_node_map = map_instances_to_nodes(amr_tree, instances)
-        instance_depths_map = find_instance_depths(amr_tree, instances)
-        instance_lca_map = map_instances_lca(amr_tree, instances)
-        scope_instance_map = _build_scope_instance_map(
-            amr_tree=amr_tree,
-            instance_lca_map=instance_lca_map,
-            instance_depths_map=instance_depths_map,
-            instance_node_map=instance_node_map,
-            coreferent_instances=coreferent_instances,
-            override_is_projective_callback=override_is_projective,
-        )
-        return cls(
-            amr_tree=amr_tree,
-            instances=instances,
-            coreferent_instances=coreferent_instances,
-            instance_node_map=instance_node_map,
-            instance_depths_map=instance_depths_map,
-            scope_instance_map=scope_instance_map,
+        return SharedAmrAnalysis(amr_tree, metrics).context(
+            override_is_projective=override_is_projective,
+            edge_priority=edge_priority,
+            maximally_hoist_coreferences=maximally_hoist_coreferences,
+            metrics=metrics,
         )
 
     def mark_instance_rendered(self, instance_name: str) -> None:
@@ -87,6 +79,13 @@ class AmrContext:
     def get_node_for_instance(self, instance_name: str) -> Node:
         return self.instance_node_map[instance_name]
 
+    def get_edges_for_instance(self, instance_name: str) -> list[Branch]:
+        """Get the edges of the instance in conversion order, without any :polarity - edge"""
+        return self.instance_edges_map[instance_name]
+
+    def is_instance_negated(self, instance_name: str) -> bool:
+        return instance_name in self.negated_instances
+
     def is_instance_rendered(self, instance_name: str) -> bool:
         return instance_name in self.rendered_instances
 
@@ -100,41 +99,200 @@ class AmrContext:
         # None as the node means the widest possible scope
         return self.scope_instance_map[node[0] if node else None]
 
+    def get_projected_instances_at_scope(self, scope: Node | None) -> list[str]:
+        """Get the instances projected at the given scope, in the order they appear in the tree"""
+        instances = self.get_instances_at_scope(scope)
+        if len(instances) <= 1:
+            return list(instances)
+        return sorted(instances, key=self.instance_projection_order.__getitem__)
+
     def get_instances_to_quantify_at_scope(self, scope: Node | None) -> set[str]:
         """Get the instances that should be quantified at the given scope."""
         instances = self.get_instances_at_scope(scope)
         return instances - self.quantified_instances
 
 
+class SharedAmrAnalysis:
+    """
+    The analysis of an AMR tree shared by the contexts for converting it with different options.
+    The parts of a context that depend on the options are computed once per distinct option value.
+    """
+
+    amr_tree: Tree
+    analysis: AmrTreeAnalysis
+
+    def __init__(
+        self, amr_tree: Tree, metrics: Optional[ConversionMetrics] = None
+    ) -> None:
+        if metrics is not None:
+            start = perf_counter()
+        self.amr_tree = amr_tree
+        self.analysis = analyze_amr_tree(amr_tree)
+        if metrics is not None:
+            metrics.add_stage_time("analyze", start)
+        # keyed by maximally_hoist_coreferences
+        self._scope_instance_maps: dict[bool, dict[str | None, set[str]]] = {}
+        # keyed by edge_priority
+        self._instance_edges: dict[
+            Optional[Callable[[Branch], int]],
+            tuple[dict[str, list[Branch]], frozenset[str]],
+        ] = {}
+        self._projection_orders: dict[
+            Optional[Callable[[Branch], int]], dict[str, int]
+        ] = {}
+
+    def context(
+        self,
+        override_is_projective: Optional[OverrideIsProjectiveCallback] = None,
+        edge_priority: Optional[Callable[[Branch], int]] = None,
+        maximally_hoist_coreferences: bool = False,
+        metrics: Optional[ConversionMetrics] = None,
+    ) -> AmrContext:
+        """A new context for converting the tree with the given options"""
+        analysis = self.analysis
+        if metrics is not None:
+            metrics.count_analysis(analysis)
+            start = perf_counter()
+        if override_is_projective is not None:
+            # the callback can decide differently each time, so its scopes aren't shared
+            if metrics is not None:
+                override_is_projective = metrics.wrap_callback(
+                    "override_is_projective", override_is_projective
+                )
+            scope_instance_map = _build_scope_instance_map(
+                amr_tree=self.amr_tree,
+                analysis=analysis,
+                override_is_projective_callback=override_is_projective,
+                maximally_hoist_coreferences=maximally_hoist_coreferences,
+            )
+        else:
+            shared_scope_instance_map = self._scope_instance_maps.get(
+                maximally_hoist_coreferences
+            )
+            if shared_scope_instance_map is None:
+                shared_scope_instance_map = _build_scope_instance_map(
+                    amr_tree=self.amr_tree,
+                    analysis=analysis,
+                    override_is_projective_callback=None,
+                    maximally_hoist_coreferences=maximally_hoist_coreferences,
+                )
+                self._scope_instance_maps[
+                    maximally_hoist_coreferences
+                ] = shared_scope_instance_map
+            scope_instance_map = shared_scope_instance_map
+        if metrics is not None:
+            start = metrics.add_stage_time("scope", start)
+        instance_edges = self._instance_edges.get(edge_priority)
+        if instance_edges is None:
+            instance_edges = _map_instance_edges(
+                analysis.instance_node_map, edge_priority
+            )
+            self._instance_edges[edge_priority] = instance_edges
+        instance_edges_map, negated_instances = instance_edges
+        if metrics is not None:
+            start = metrics.add_stage_time("edges", start)
+        # ordering only matters if some instances are hoisted to share a scope
+        instance_projection_order: dict[str, int] = {}
+        if any(len(instances) > 1 for instances in scope_instance_map.values()):
+            projection_order = self._projection_orders.get(edge_priority)
+            if projection_order is None:
+                projection_order = _map_instances_projection_order(
+                    self.amr_tree, edge_priority
+                )
+                self._projection_orders[edge_priority] = projection_order
+            instance_projection_order = projection_order
+            if metrics is not None:
+                metrics.add_stage_time("projection_order", start)
+        return AmrContext(
+            amr_tree=self.amr_tree,
+            instances=analysis.instances,
+            coreferent_instances=analysis.coreferent_instances,
+            instance_node_map=analysis.instance_node_map,
+            instance_depths_map=analysis.instance_depths_map,
+            scope_instance_map=scope_instance_map,
+            instance_projection_order=instance_projection_order,
+            instance_edges_map=instance_edges_map,
+            negated_instances=negated_instances,
+            metrics=metrics,
+        )
+
+
 def _build_scope_instance_map(
     amr_tree: Tree,
-    instance_lca_map: dict[str, str],
-    instance_depths_map: dict[str, int],
-    instance_node_map: dict[str, Node],
-    coreferent_instances: frozenset[str],
+    analysis: AmrTreeAnalysis,
     override_is_projective_callback: Optional[OverrideIsProjectiveCallback],
+    maximally_hoist_coreferences: bool = False,
 ) -> dict[str | None, set[str]]:
     """
     Build a map of the scope (instance name of the node in the tree this variable should be scoped) to a list of instances
-    Takes into account any overrides provided by the override_is_projective_callback
+    Coreferent instances are hoisted to the widest scope if maximally_hoist_coreferences is set,
+    and the override_is_projective_callback can override whether any instance is hoisted
     """
-    instance_scope_map = {}
-    for instance, lca in instance_lca_map.items():
-        scope: str | None = lca
-        if override_is_projective_callback:
-            info = OverrideIsProjectiveCallbackInfo(
-                instance_name=instance,
-                node=instance_node_map[instance],
-                depth=instance_depths_map[instance],
-                is_coreferent=instance in coreferent_instances,
-                is_default_hoisted=lca != instance,
-                amr_tree=amr_tree,
-            )
-            if override_is_projective_callback(info) is True:
-                scope = None
-        instance_scope_map[instance] = scope
-
     scope_instance_map: dict[str | None, set[str]] = defaultdict(set)
-    for instance, scope in instance_scope_map.items():
-        scope_instance_map[scope].add(instance)
+    coreferent_instances = analysis.coreferent_instances
+    for instance, lca in analysis.instance_lca_map.items():
+        is_projective = (
+            maximally_hoist_coreferences and instance in coreferent_instances
+        )
+        if override_is_projective_callback is not None:
+            override = override_is_projective_callback(
+                OverrideIsProjectiveCallbackInfo(
+                    amr_tree=amr_tree,
+                    instance_name=instance,
+                    node=analysis.instance_node_map[instance],
+                    depth=analysis.instance_depths_map[instance],
+                    is_coreferent=instance in coreferent_instances,
+                    is_default_hoisted=lca != instance,
+                )
+            )
+            if override is not None:
+                is_projective = override
+        scope_instance_map[None if is_projective is True else lca].add(instance)
     return scope_instance_map
+
+
+def _map_instance_edges(
+    instance_node_map: dict[str, Node],
+    edge_priority: Optional[Callable[[Branch], int]],
+) -> tuple[dict[str, list[Branch]], frozenset[str]]:
+    """
+    Order the edges of each instance for conversion by descending priority once up front,
+    separating out the :polarity - edges which mark the instance as negated
+    """
+    instance_edges_map: dict[str, list[Branch]] = {}
+    negated_instances: set[str] = set()
+    for instance, node in instance_node_map.items():
+        edges = node[1][1:]
+        if edge_priority is not None:
+            edges = sorted(edges, key=edge_priority, reverse=True)
+        ordered_edges: list[Branch] = []
+        for edge in edges:
+            if _is_negation(edge):
+                negated_instances.add(instance)
+            else:
+                ordered_edges.append(edge)
+        instance_edges_map[instance] = ordered_edges
+    return instance_edges_map, frozenset(negated_instances)
+
+
+def _is_negation(edge: Branch) -> bool:
+    role, target = edge
+    return role == ":polarity" and isinstance(target, str) and target[0] == "-"
+
+
+def _map_instances_projection_order(
+    amr_tree: Tree, edge_priority: Optional[Callable[[Branch], int]]
+) -> dict[str, int]:
+    """Map each instance to its position in a preorder walk of the tree, visiting edges by ascending priority"""
+    projection_order: dict[str, int] = {}
+    nodes: list[Node] = [amr_tree.node]
+    while nodes:
+        instance, instance_info = nodes.pop()
+        projection_order.setdefault(instance, len(projection_order))
+        edges = instance_info[1:]
+        if edge_priority is not None:
+            edges = sorted(edges, key=edge_priority)
+        for _role, target in reversed(edges):
+            if type(target) is tuple:
+                nodes.append(target)
+    return projection_order
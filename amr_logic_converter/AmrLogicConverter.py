@@ -1,33 +1,60 @@
 from __future__ import annotations
 from dataclasses import dataclass
 
-from functools import reduce
-from typing import Any, Callable, Optional, Union, cast
+from time import perf_counter
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    Optional,
+    Union,
+    cast,
+    overload,
+)
+from typing_extensions import Literal
 
 import penman
-from penman.tree import Tree, Node, Branch
+from penman.tree import Branch, Tree, Node
 from penman.graph import Graph
 
 from amr_logic_converter.AmrContext import (
     AmrContext,
     OverrideIsProjectiveCallback,
-    OverrideIsProjectiveCallbackInfo,
+    SharedAmrAnalysis,
+)
+from amr_logic_converter.ConversionPlan import (
+    ConversionPlan,
+    LogicBuilder,
+    compile_conversion_plan,
+)
+
+# determine_const_type used to live here, so keep it importable from this module
+from amr_logic_converter.ConversionPlan import (  # noqa: F401
+    determine_const_type as determine_const_type,
 )
+from amr_logic_converter.InternTable import InternTable, ParseCacheInfo
+from amr_logic_converter.configure_graph import configure_graph
+from amr_logic_converter.conversion_metrics import ConversionMetrics, MetricsSink
+from amr_logic_converter.LazyConversion import LazyConversion
+from amr_logic_converter.LogicColumns import LogicColumns
+from amr_logic_converter.convert_many import (
+    AmrInput,
+    ConversionResult,
+    convert_many,
+)
+from amr_logic_converter.result_cache import ResultCache, make_result_cache_key
 from amr_logic_converter.types import (
-    And,
     Constant,
-    ConstantType,
-    Exists,
     Clause,
-    Implies,
-    Not,
     Predicate,
+    Term,
     Variable,
     Atom,
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class OverrideQuantificationCallbackInfo:
     """Metadata passed to the OverrideQuantificationCallback wtih info about the node being processed"""
 
@@ -44,7 +71,7 @@ OverrideQuantificationCallback = Callable[
 ]
 
 
-@dataclass
+@dataclass(slots=True)
 class OverrideConjunctionCallbackInfo:
     """Metadata passed to the OverrideConjunctionCallback wtih info about the node being processed"""
 
@@ -72,8 +99,17 @@ def normalize_atom(atom: Atom) -> Atom:
     return atom
 
 
-def determine_const_type(value: str) -> ConstantType:
-    return "string" if value.startswith('"') else "symbol"
+# options the compiled conversion plan depends on
+_PLAN_OPTIONS = frozenset(
+    [
+        "intern_table",
+        "invert_relations",
+        "existentially_quantify_instances",
+        "use_variables_for_instances",
+        "capitalize_variables",
+        "use_implies_for_conditions",
+    ]
+)
 
 
 class AmrLogicConverter:
@@ -99,6 +135,11 @@ class AmrLogicConverter:
     override_is_projective: Optional[OverrideIsProjectiveCallback]
     override_quantification: Optional[OverrideQuantificationCallback]
     override_conjunction: Optional[OverrideConjunctionCallback]
+    intern_table: InternTable
+    result_cache: Optional[ResultCache]
+    cache_key: Optional[str]
+    metrics_sink: Optional[MetricsSink]
+    _plan: Optional[ConversionPlan] = None
 
     def __init__(
         self,
@@ -111,6 +152,10 @@ class AmrLogicConverter:
         override_is_projective: Optional[OverrideIsProjectiveCallback] = None,
         override_quantification: Optional[OverrideQuantificationCallback] = None,
         override_conjunction: Optional[OverrideConjunctionCallback] = None,
+        intern_table: Optional[InternTable] = None,
+        result_cache: Optional[ResultCache] = None,
+        cache_key: Optional[str] = None,
+        metrics_sink: Optional[MetricsSink] = None,
     ) -> None:
         self.invert_relations = invert_relations
         self.capitalize_variables = capitalize_variables
@@ -121,267 +166,458 @@ class AmrLogicConverter:
         self.override_is_projective = override_is_projective
         self.override_quantification = override_quantification
         self.override_conjunction = override_conjunction
-
-    def _get_bound_instance(self, instance_name: str) -> Variable | Constant:
-        use_variables_for_instances = (
-            self.existentially_quantify_instances or self.use_variables_for_instances
+        # symbols are shared between all conversions by this converter, or any converters sharing the table
+        self.intern_table = intern_table if intern_table is not None else InternTable()
+        self.result_cache = result_cache
+        # identifies the behavior of any override callbacks, which can't be hashed into the cache key
+        self.cache_key = cache_key
+        # receives the timings and counts of each conversion, which are only recorded if it's set
+        self.metrics_sink = metrics_sink
+        self._check_cacheable()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        # recompile the conversion plan the next time it's needed if an option it depends on changes
+        if name in _PLAN_OPTIONS:
+            super().__setattr__("_plan", None)
+
+    def __getstate__(self) -> dict[str, Any]:
+        # compiled plans are made of closures, which can't be pickled
+        return {**self.__dict__, "_plan": None}
+
+    def _get_plan(self) -> ConversionPlan:
+        plan = self._plan
+        if plan is None:
+            plan = self._compile_plan()
+            super().__setattr__("_plan", plan)
+        return plan
+
+    def _compile_plan(self, builder: Optional[LogicBuilder] = None) -> ConversionPlan:
+        return compile_conversion_plan(
+            intern_table=self.intern_table,
+            invert_relations=self.invert_relations,
+            existentially_quantify_instances=self.existentially_quantify_instances,
+            use_variables_for_instances=self.use_variables_for_instances,
+            capitalize_variables=self.capitalize_variables,
+            use_implies_for_conditions=self.use_implies_for_conditions,
+            builder=builder,
         )
-        bound_instance: Variable | Constant = (
-            Variable(self._var_name(instance_name))
-            if use_variables_for_instances
-            else Constant(instance_name, "instance")
-        )
-        return bound_instance
-
-    def _reprioritize_edge(self, edge: Branch) -> int:
-        """Reprioritize edges to make it possible to change where in the tree coreferenced instances are defined"""
-        role = edge[0]
-        # make sure :condition is processed first if we're rewriting using Implies
-        if self.use_implies_for_conditions and role == ":condition":
-            return 1
-        return 0
-
-    def _sort_edges(self, edges: list[Branch], reverse: bool = True) -> list[Branch]:
-        """Sort edges by reprioritized edge priority"""
-        return sorted(edges, key=self._reprioritize_edge, reverse=reverse)
 
-    def _var_name(self, name: str) -> str:
-        return name.capitalize() if self.capitalize_variables else name
+    def parse_cache_info(self) -> ParseCacheInfo:
+        """Hit, miss and size statistics of the cache used to parse AMR symbols and alignments"""
+        return self.intern_table.parse_cache_info()
 
-    def _convert_amr_assertive(
+    def _convert_nodes(
         self,
         ctx: AmrContext,
-        instance_name: str,
-        closure: Optional[Callable[[str], Clause | None]] = None,
+        plan: ConversionPlan,
+        root: _Frame,
+        subtree_results: Optional[dict[str, Clause]] = None,
     ) -> Clause | None:
+        """
+        Run the ↓/↑ translation from the root frame as a work-list of frame records on an explicit stack,
+        so deeply nested AMRs don't hit the recursion limit. A frame returns the frame it needs the result
+        of next, or None once its own result is set.
+
+        If subtree_results is given, child nodes in the tree whose instance is already in it aren't
+        converted, using the result stored there instead, and the results of the other child nodes are added.
+        """
+        stack: list[_Frame] = [root]
+        # the result of the last finished frame, sent to the frame below it
+        result: Any = None
+        while True:
+            frame = stack[-1]
+            if isinstance(frame, _AssertiveFrame):
+                child = self._advance_assertive(
+                    ctx, plan, frame, result, subtree_results
+                )
+            elif isinstance(frame, _ConvertFrame):
+                child = self._advance_convert(ctx, plan, frame, result)
+            else:
+                child = _advance_projective(frame, result)
+            if child is not None:
+                stack.append(child)
+                result = None
+            else:
+                stack.pop()
+                result = frame.result
+                if not stack:
+                    return result
+
+    def _advance_assertive(
+        self,
+        ctx: AmrContext,
+        plan: ConversionPlan,
+        frame: _AssertiveFrame,
+        result: Any,
+        subtree_results: Optional[dict[str, Clause]],
+    ) -> _Frame | None:
         # handle 7.2, 7.6-7.8 from "Expressive Power of Abstract Meaning Representations"
         # ∥x,φ∥↓ = φ(x)
         # ∥(x\P),φ∥↓ = φ(x)
         # ∥(x\P :RiAi),φ∥↓ = φ(x)
         # ∥(x\P :RiAi :polarity–),φ∥↓ = φ(x)
-        if ctx.is_instance_rendered(instance_name):
-            return None if closure is None else closure(instance_name)
-        node = ctx.get_node_for_instance(instance_name)
-        instance_predicate, *edges = node[1]
-        bound_instance = self._get_bound_instance(instance_name)
-        predicate = Predicate.from_amr_str(instance_predicate[1])
-        predicate_term = predicate(bound_instance)
-        closure_term = closure(instance_name) if closure is not None else None
-        subterms: list[Clause] = []
-        condition_term: Clause | None = None
-
-        ctx.mark_instance_rendered(instance_name)
-        for (role, target) in self._sort_edges(edges):
-
-            def sub_closure(u: str) -> Atom:
-                target: Variable | Constant = self._get_bound_instance(u)
-                sub_predicate = Predicate.from_amr_str(role)
-                atom = sub_predicate(bound_instance, target)
-                return normalize_atom(atom) if self.invert_relations else atom
-
-            # don't include the :condition relation in the logic if we're turning it into an implication
-            target_closure: Callable[[str], Atom] | None = sub_closure
-            if role == ":condition" and self.use_implies_for_conditions:
-                target_closure = None
-
+        instance_name = frame.instance_name
+        if frame.edges is None:
+            if ctx.is_instance_rendered(instance_name):
+                frame.result = _apply_closure(plan, frame.closure, instance_name)
+                return None
+            ctx.mark_instance_rendered(instance_name)
+            # :polarity - edges are left out, as negation is handled in quantification
+            frame.edges = ctx.get_edges_for_instance(instance_name)
+            frame.bound_instance = plan.bound_instance(instance_name)
+        else:
+            # the result of the target of the last edge
+            role, target = frame.edges[frame.next_edge - 1]
+            if subtree_results is not None and type(target) is tuple:
+                subtree_results[target[0]] = result
+            _add_subterm(frame, role, result)
+
+        edges = frame.edges
+        bound_instance = frame.bound_instance
+        while frame.next_edge < len(edges):
+            role, target = edges[frame.next_edge]
+            frame.next_edge += 1
             target_instance = _get_instance_name(target, ctx)
-            subterm: Clause | None = None
-            # special case for the :polarity - attribute.
-            # skip polarity as is handled in quantification
-            if _is_negation(role, target):
-                continue
-            elif target_instance is not None:
-                target_node = ctx.get_node_for_instance(target_instance)
-                subterm = self._convert_amr(ctx, target_node, target_closure)
-            else:
-                sub_predicate = Predicate.from_amr_str(role)
-                sub_atom = sub_predicate(
-                    bound_instance, Constant(target, determine_const_type(target))
+            if target_instance is not None:
+                if (
+                    subtree_results is not None
+                    and type(target) is tuple
+                    and target_instance in subtree_results
+                ):
+                    _add_subterm(frame, role, subtree_results[target_instance])
+                    continue
+                # don't include the :condition relation in the logic if we're turning it into an implication
+                target_closure = (
+                    None
+                    if role == plan.implication_role
+                    else _RoleClosure(role, bound_instance)
                 )
-                subterm = (
-                    normalize_atom(sub_atom) if self.invert_relations else sub_atom
+                return _ConvertFrame(
+                    ctx.get_node_for_instance(target_instance), target_closure
                 )
-            if role == ":condition":
-                condition_term = subterm
-            else:
-                subterms.append(subterm)
+            _add_subterm(
+                frame, role, plan.role_atom(role, bound_instance, plan.constant(target))
+            )
 
+        node = ctx.get_node_for_instance(instance_name)
+        predicate_term = plan.concept_atom(node[1][0][1], bound_instance)
+        closure_term = _apply_closure(plan, frame.closure, instance_name)
         if self.override_conjunction is not None:
             info = OverrideConjunctionCallbackInfo(
                 predicate_term=predicate_term,
                 closure_term=closure_term,
-                subterms=subterms,
-                condition_term=condition_term,
+                subterms=frame.subterms,
+                condition_term=frame.condition_term,
                 instance_name=instance_name,
                 bound_instance=bound_instance,
-                depth=ctx.get_instance_depth(instance_name),
                 node=node,
+                depth=ctx.get_instance_depth(instance_name),
                 amr_tree=ctx.amr_tree,
             )
-            override_result = self.override_conjunction(info)
+            if ctx.metrics is None:
+                override_result = self.override_conjunction(info)
+            else:
+                override_result = ctx.metrics.call_callback(
+                    "override_conjunction", self.override_conjunction, info
+                )
             if override_result is not None:
-                return override_result
-
-        pre_terms = []
-        if closure_term is not None:
-            pre_terms.append(closure_term)
-        if condition_term is not None and not self.use_implies_for_conditions:
-            pre_terms.append(condition_term)
-        pre_terms.append(predicate_term)
-        conjunction = And(*(pre_terms + subterms))
-        if condition_term is not None and self.use_implies_for_conditions:
-            return Implies(condition_term, conjunction)
-        return conjunction
+                frame.result = override_result
+                return None
+        frame.result = plan.conjoin(
+            closure_term, frame.condition_term, predicate_term, frame.subterms
+        )
+        return None
+
+    def _advance_convert(
+        self,
+        ctx: AmrContext,
+        plan: ConversionPlan,
+        frame: _ConvertFrame,
+        result: Any,
+    ) -> _Frame | None:
+        # ∥A∥ = quantify(∥A∥↑(∥A∥↓))
+        stage = frame.stage
+        frame.stage += 1
+        if stage == 0:
+            frame.instances_to_quantify = ctx.get_instances_to_quantify_at_scope(
+                frame.node
+            )
+            ctx.mark_instances_quantified(frame.instances_to_quantify)
+            return _AssertiveFrame(frame.node[0], frame.closure)
+        if stage == 1:
+            return _ProjectiveFrame(
+                ctx.get_projected_instances_at_scope(frame.node), result
+            )
+        frame.result = self._quanitfy_formula(
+            ctx, plan, result, frame.instances_to_quantify
+        )
+        return None
 
     def _quantify_instance(
         self,
         ctx: AmrContext,
+        plan: ConversionPlan,
         instance_name: str,
-    ) -> Callable[[Clause], Clause]:
-        node = ctx.get_node_for_instance(instance_name)
-        _instance_predicate, *edges = node[1]
-        bound_instance = self._get_bound_instance(instance_name)
-        polarity = True
-        for role, target in self._sort_edges(edges):
-            if _is_negation(role, target):
-                polarity = False
-
-        def quantification_closure(clause: Clause) -> Clause:
-            if self.override_quantification is not None:
-                override_expr = self.override_quantification(
+        clause: Clause,
+    ) -> Clause:
+        bound_instance = plan.bound_instance(instance_name)
+        is_negated = ctx.is_instance_negated(instance_name)
+        if self.override_quantification is not None:
+            info = OverrideQuantificationCallbackInfo(
+                instance_name=instance_name,
+                bound_instance=bound_instance,
+                node=ctx.get_node_for_instance(instance_name),
+                depth=ctx.get_instance_depth(instance_name),
+                amr_tree=ctx.amr_tree,
+                is_negated=is_negated,
+            )
+            if ctx.metrics is None:
+                override_expr = self.override_quantification(clause, info)
+            else:
+                override_expr = ctx.metrics.call_callback(
+                    "override_quantification",
+                    self.override_quantification,
                     clause,
-                    OverrideQuantificationCallbackInfo(
-                        node=node,
-                        instance_name=instance_name,
-                        bound_instance=bound_instance,
-                        depth=ctx.get_instance_depth(instance_name),
-                        amr_tree=ctx.amr_tree,
-                        is_negated=not polarity,
-                    ),
+                    info,
                 )
-                if override_expr is not None:
-                    return override_expr
-            expr = clause
-            if self.existentially_quantify_instances:
-                expr = Exists(cast(Variable, bound_instance), body=clause)
-            return expr if polarity else Not(expr)
-
-        return quantification_closure
+            if override_expr is not None:
+                return override_expr
+        return plan.quantify(clause, bound_instance, not is_negated)
 
     def _quanitfy_formula(
-        self, ctx: AmrContext, formula: Clause, instances: set[str]
+        self,
+        ctx: AmrContext,
+        plan: ConversionPlan,
+        formula: Clause,
+        instances: set[str],
     ) -> Clause:
         """Wrap the formula in quantifiers for all instances in the list"""
+        if not instances:
+            return formula
         sorted_instances = sorted(
             sorted(instances),  # sort alphabetically as a tie-breaker
-            key=lambda instance: ctx.get_instance_depth(instance),
+            key=ctx.get_instance_depth,
             reverse=True,
         )
+        for instance_name in sorted_instances:
+            formula = self._quantify_instance(ctx, plan, instance_name, formula)
+        return formula
+
+    def _check_cacheable(self) -> None:
+        if self.result_cache is None or self.cache_key is not None:
+            return
+        if (
+            self.override_is_projective is not None
+            or self.override_quantification is not None
+            or self.override_conjunction is not None
+        ):
+            raise ValueError(
+                "A cache_key identifying the override callbacks must be provided to use a result_cache with them"
+            )
 
-        return reduce(
-            lambda formula, instance_name: self._quantify_instance(ctx, instance_name)(
-                formula
-            ),
-            sorted_instances,
-            formula,
+    def _result_cache_key(self, amr_tree: Tree) -> str:
+        self._check_cacheable()
+        options = (
+            self.invert_relations,
+            self.existentially_quantify_instances,
+            self.use_variables_for_instances,
+            self.maximally_hoist_coreferences,
+            self.capitalize_variables,
+            self.use_implies_for_conditions,
+            self.cache_key,
         )
+        return make_result_cache_key(amr_tree, options)
 
-    def _convert_amr_projective(
+    def convert_amr_tree(self, amr_tree: Tree) -> Clause:
+        return self._convert_shared_amr_tree(amr_tree)
+
+    def _convert_shared_amr_tree(
+        self, amr_tree: Tree, shared_analysis: Optional[SharedAmrAnalysis] = None
+    ) -> Clause:
+        """Convert the tree like convert_amr_tree, reusing the analysis of the tree if it's given"""
+        if self.metrics_sink is not None:
+            return self._convert_amr_tree_with_metrics(
+                amr_tree, ConversionMetrics(), shared_analysis
+            )
+        if self.result_cache is None:
+            return self._convert_amr_tree(amr_tree, shared_analysis=shared_analysis)
+        key = self._result_cache_key(amr_tree)
+        logic = self.result_cache.get(key)
+        if logic is None:
+            logic = self._convert_amr_tree(amr_tree, shared_analysis=shared_analysis)
+            self.result_cache.set(key, logic)
+        return logic
+
+    def _convert_amr_tree_with_metrics(
         self,
-        ctx: AmrContext,
-        node: Node,
-        context_node: Node | None,
-    ) -> Callable[[Clause | None], Clause | None]:
-        instance_name, instance_info = node
-        # only project instances at their specific scope
-        projections_for_context = ctx.get_instances_at_scope(context_node)
-
-        edges = instance_info[1:]
-        cur_closure = lambda x: x
-        if instance_name in projections_for_context:
-            # handle 8.6-8.8 from "Expressive Power of Abstract Meaning Representations"
-            # ∥(x\P :RiAi)∥↑ = λp.∥(x/P :RiAi),λx.p∥↓
-            cur_closure = lambda u: self._convert_amr_assertive(
-                ctx, instance_name, lambda x: u
+        amr_tree: Tree,
+        metrics: ConversionMetrics,
+        shared_analysis: Optional[SharedAmrAnalysis] = None,
+    ) -> Clause:
+        """Convert the tree like convert_amr_tree, recording the metrics and sending them to the sink"""
+        if self.result_cache is None:
+            logic = self._convert_amr_tree(
+                amr_tree, metrics=metrics, shared_analysis=shared_analysis
             )
+        else:
+            start = perf_counter()
+            key = self._result_cache_key(amr_tree)
+            cached_logic = self.result_cache.get(key)
+            metrics.add_stage_time("cache_get", start)
+            metrics.cache_hit = cached_logic is not None
+            if cached_logic is not None:
+                logic = cached_logic
+            else:
+                logic = self._convert_amr_tree(
+                    amr_tree, metrics=metrics, shared_analysis=shared_analysis
+                )
+                start = perf_counter()
+                self.result_cache.set(key, logic)
+                metrics.add_stage_time("cache_set", start)
+        cast(MetricsSink, self.metrics_sink).record(metrics)
+        return logic
 
-        def args_closure(p: Clause | None) -> Clause | None:
-            # handle 8.3-8.5 from "Expressive Power of Abstract Meaning Representations"
-            # ∥(x/P :RiAi)∥↑ = λp.∥A1∥↑(∥A2∥↑( ...∥An∥↑(p)))
-            # don't need to worry about iterating over non-nodes since those are just λp.p
-            result = cur_closure(p)
-            for edge in self._sort_edges(edges, reverse=False):
-                if type(edge[1]) is tuple:
-                    sub_closure = self._convert_amr_projective(
-                        ctx, edge[1], context_node
-                    )
-                    result = sub_closure(result)
-            return result
-
-        return args_closure
-
-    def _convert_amr(
+    def _convert_amr_tree(
         self,
-        ctx: AmrContext,
-        node: Node,
-        assertive_closure: Optional[Callable[[str], Clause]] = None,
+        amr_tree: Tree,
+        subtree_results: Optional[dict[str, Clause]] = None,
+        plan: Optional[ConversionPlan] = None,
+        metrics: Optional[ConversionMetrics] = None,
+        shared_analysis: Optional[SharedAmrAnalysis] = None,
     ) -> Clause:
-        instances_to_quantify = ctx.get_instances_to_quantify_at_scope(node)
-        ctx.mark_instances_quantified(instances_to_quantify)
-        projective_closure = self._convert_amr_projective(ctx, node, node)
-        base_formula = cast(
-            Clause,
-            projective_closure(
-                self._convert_amr_assertive(ctx, node[0], assertive_closure)
-            ),
+        if plan is None:
+            plan = self._get_plan()
+        if shared_analysis is None:
+            shared_analysis = SharedAmrAnalysis(amr_tree, metrics)
+        ctx = shared_analysis.context(
+            override_is_projective=self.override_is_projective,
+            edge_priority=plan.edge_priority,
+            maximally_hoist_coreferences=self.maximally_hoist_coreferences,
+            metrics=metrics,
         )
-        return self._quanitfy_formula(ctx, base_formula, instances_to_quantify)
+        if metrics is not None:
+            start = perf_counter()
 
-    def _maximally_project_amr(
-        self, ctx: AmrContext, node: Node
-    ) -> Callable[[Clause], Clause]:
-        return cast(
-            Callable[[Clause], Clause], self._convert_amr_projective(ctx, node, None)
+        formula = self._convert_nodes(
+            ctx, plan, _ConvertFrame(amr_tree.node, None), subtree_results
         )
-
-    def _override_is_projective(
-        self, info: OverrideIsProjectiveCallbackInfo
-    ) -> bool | None:
-        override: bool | None = None
-        if self.maximally_hoist_coreferences and info.is_coreferent:
-            override = True
-        if self.override_is_projective is not None:
-            callback_res = self.override_is_projective(info)
-            if callback_res is not None:
-                override = callback_res
-        return override
-
-    def convert_amr_tree(self, amr_tree: Tree) -> Clause:
-        ctx = AmrContext.from_amr_tree(
-            amr_tree, override_is_projective=self._override_is_projective
-        )
-
+        if subtree_results is not None:
+            subtree_results[amr_tree.node[0]] = cast(Clause, formula)
         # special case to handle maximally projected instances
-        maximal_projection = self._maximally_project_amr(ctx, amr_tree.node)
-        formula = maximal_projection(self._convert_amr(ctx, amr_tree.node))
+        maximal_formula = self._convert_nodes(
+            ctx,
+            plan,
+            _ProjectiveFrame(ctx.get_projected_instances_at_scope(None), formula),
+        )
         maximum_scope_instances = ctx.get_instances_at_scope(None)
-        return self._quanitfy_formula(ctx, formula, maximum_scope_instances)
+        logic = self._quanitfy_formula(
+            ctx, plan, cast(Clause, maximal_formula), maximum_scope_instances
+        )
+        if metrics is not None:
+            metrics.add_stage_time("convert", start)
+        return logic
 
     def convert_amr_str(self, amr_str: str) -> Clause:
-        return self.convert_amr_tree(penman.parse(amr_str))
-
-    def convert(self, amr: str | Tree | Graph) -> Clause:
+        if self.metrics_sink is None:
+            return self.convert_amr_tree(penman.parse(amr_str))
+        metrics = ConversionMetrics()
+        start = perf_counter()
+        amr_tree = penman.parse(amr_str)
+        metrics.add_stage_time("parse", start)
+        return self._convert_amr_tree_with_metrics(amr_tree, metrics)
+
+    def _convert_graph(self, graph: Graph) -> Clause:
+        if self.metrics_sink is None:
+            return self.convert_amr_tree(configure_graph(graph))
+        metrics = ConversionMetrics()
+        start = perf_counter()
+        amr_tree = configure_graph(graph)
+        metrics.add_stage_time("configure", start)
+        return self._convert_amr_tree_with_metrics(amr_tree, metrics)
+
+    @overload
+    def convert(self, amr: str | Tree | Graph, lazy: Literal[False] = False) -> Clause:
+        ...
+
+    @overload
+    def convert(self, amr: str | Tree | Graph, lazy: Literal[True]) -> LazyConversion:
+        ...
+
+    def convert(
+        self, amr: str | Tree | Graph, lazy: bool = False
+    ) -> Clause | LazyConversion:
+        """
+        Convert an AMR to logic. With lazy=True, return a LazyConversion handle instead,
+        which only builds the parts of the logic that are read from it. Lazy conversions
+        don't use the result cache or record metrics to the metrics sink.
+        """
+        if lazy:
+            return LazyConversion(self, _to_amr_tree(amr))
         if isinstance(amr, str):
             return self.convert_amr_str(amr)
         elif isinstance(amr, Tree):
             return self.convert_amr_tree(amr)
         elif isinstance(amr, Graph):
-            return self.convert_amr_tree(penman.configure(amr))
+            return self._convert_graph(amr)
         else:
             raise TypeError(
                 f"Expected amr to be a string, Tree, or Graph. Got {type(amr)}"
             )
 
+    def convert_many(
+        self,
+        amrs: Iterable[AmrInput],
+        workers: int = 1,
+        chunksize: int = 64,
+        ordered: bool = True,
+    ) -> Iterator[ConversionResult]:
+        """
+        Convert a stream of AMRs, optionally in parallel worker processes.
+        Yields a ConversionResult per AMR with either the logic or the error raised converting it,
+        so a single bad AMR doesn't abort the batch.
+        """
+        return convert_many(
+            self, amrs, workers=workers, chunksize=chunksize, ordered=ordered
+        )
+
+    def convert_to_columns(
+        self, amrs: Iterable[str | Tree | Graph], columns: Optional[LogicColumns] = None
+    ) -> LogicColumns:
+        """
+        Convert AMRs straight into the columnar tables of a LogicColumns, for bulk loading,
+        without building the logic as Clauses. The rows are appended to columns if it's given.
+        Converting to columns doesn't use the result cache or record metrics to the metrics sink.
+        """
+        if (
+            self.override_quantification is not None
+            or self.override_conjunction is not None
+        ):
+            raise ValueError(
+                "Converting to columns can't be used with override_quantification or override_conjunction callbacks"
+            )
+        if columns is None:
+            columns = LogicColumns()
+        plan = self._compile_plan(builder=columns)
+        for amr in amrs:
+            try:
+                formula = self._convert_amr_tree(_to_amr_tree(amr), plan=plan)
+            except BaseException:
+                columns._discard_amr()
+                raise
+            columns._finish_amr(cast(Any, formula))
+        return columns
+
+
+def _to_amr_tree(amr: str | Tree | Graph) -> Tree:
+    if isinstance(amr, str):
+        return penman.parse(amr)
+    elif isinstance(amr, Tree):
+        return amr
+    elif isinstance(amr, Graph):
+        return configure_graph(amr)
+    raise TypeError(f"Expected amr to be a string, Tree, or Graph. Got {type(amr)}")
+
 
 def _get_instance_name(target: Node | str, ctx: AmrContext) -> str | None:
     if type(target) is tuple:
@@ -391,5 +627,103 @@ def _get_instance_name(target: Node | str, ctx: AmrContext) -> str | None:
     return None
 
 
-def _is_negation(role: str, target: Any) -> bool:
-    return role == ":polarity" and isinstance(target, str) and target[0] == "-"
+class _RoleClosure:
+    """λu.R(x, u), closing over the role R and the bound source instance x of an edge"""
+
+    __slots__ = ("role", "source")
+
+    def __init__(self, role: str, source: Term) -> None:
+        self.role = role
+        self.source = source
+
+
+# a closure φ applied to an instance in the ↓ translation is either a role closure, or λu.p for a
+# constant clause p, represented by the clause itself (with None for no closure at all)
+_Closure = Union[_RoleClosure, Clause, None]
+
+
+def _apply_closure(
+    plan: ConversionPlan, closure: _Closure, instance_name: str
+) -> Clause | None:
+    if isinstance(closure, _RoleClosure):
+        return plan.role_atom(
+            closure.role, closure.source, plan.bound_instance(instance_name)
+        )
+    return closure
+
+
+class _ConvertFrame:
+    """Converting the subtree at a node: ↓ first, then ↑ over the result, then quantification"""
+
+    __slots__ = ("node", "closure", "stage", "instances_to_quantify", "result")
+
+    def __init__(self, node: Node, closure: _Closure) -> None:
+        self.node = node
+        self.closure = closure
+        self.stage = 0
+        self.instances_to_quantify: set[str] = set()
+        self.result: Clause | None = None
+
+
+class _AssertiveFrame:
+    """The ↓ translation of an instance, converting the targets of its edges one at a time"""
+
+    __slots__ = (
+        "instance_name",
+        "closure",
+        "edges",
+        "next_edge",
+        "bound_instance",
+        "subterms",
+        "condition_term",
+        "result",
+    )
+
+    def __init__(self, instance_name: str, closure: _Closure) -> None:
+        self.instance_name = instance_name
+        self.closure = closure
+        # None until the instance is first visited
+        self.edges: list[Branch] | None = None
+        self.next_edge = 0
+        self.bound_instance: Variable | Constant
+        self.subterms: list[Clause] = []
+        self.condition_term: Clause | None = None
+        self.result: Clause | None = None
+
+
+class _ProjectiveFrame:
+    """
+    The ↑ translation at a scope: ∥(x/P :RiAi)∥↑ = λp.∥A1∥↑(∥A2∥↑( ...∥An∥↑(p))), and
+    ∥(x\\P :RiAi)∥↑ = λp.∥(x/P :RiAi),λx.p∥↓. Only instances projected at this scope are anything
+    other than λp.p, so it jumps straight to those in tree order instead of walking the whole subtree.
+    """
+
+    __slots__ = ("instances", "next_instance", "result")
+
+    def __init__(self, instances: list[str], formula: Clause | None) -> None:
+        self.instances = instances
+        self.next_instance = 0
+        self.result = formula
+
+
+_Frame = Union[_ConvertFrame, _AssertiveFrame, _ProjectiveFrame]
+
+
+def _advance_projective(
+    frame: _ProjectiveFrame, result: Clause | None
+) -> _Frame | None:
+    if frame.next_instance > 0:
+        frame.result = result
+    if frame.next_instance < len(frame.instances):
+        instance_name = frame.instances[frame.next_instance]
+        frame.next_instance += 1
+        # the formula so far is the constant closure for the projected instance
+        return _AssertiveFrame(instance_name, frame.result)
+    return None
+
+
+def _add_subterm(frame: _AssertiveFrame, role: str, subterm: Clause) -> None:
+    if role == ":condition":
+        frame.condition_term = subterm
+    else:
+        frame.subterms.append(subterm)
@@ -0,0 +1,181 @@
+from __future__ import annotations
+import asyncio
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+import os
+from typing import Any, Callable, Optional, Union
+
+from penman.graph import Graph
+from penman.tree import Tree
+from typing_extensions import Literal
+
+from amr_logic_converter.AmrLogicConverter import AmrLogicConverter
+from amr_logic_converter.convert_many import AmrInput, _make_picklable
+from amr_logic_converter.types import Clause
+
+
+# the default timeout of the converter, as None means no timeout
+_DEFAULT_TIMEOUT: Any = object()
+
+
+class AsyncAmrLogicConverter:
+    """
+    Convert AMRs from asyncio code without blocking the event loop, by running the conversions
+    in a thread or process pool.
+
+    At most `max_concurrency` conversions are submitted to the pool at a time, and further calls
+    wait for a free slot, so a burst of requests can't queue up unbounded work in the pool.
+    Concurrent calls converting the same AMR string share a single conversion.
+    Each call gives up after `timeout` seconds, raising `asyncio.TimeoutError`. A conversion
+    is cancelled once every call waiting for it gives up, if it hasn't started running yet.
+
+    usage:
+    async with AsyncAmrLogicConverter(AmrLogicConverter(), executor="process") as converter:
+        logic = await converter.convert(amr_str)
+    """
+
+    converter: AmrLogicConverter
+    max_concurrency: int
+    timeout: Optional[float]
+
+    def __init__(
+        self,
+        converter: Optional[AmrLogicConverter] = None,
+        executor: Union[Literal["thread", "process"], Executor] = "thread",
+        max_workers: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> None:
+        """
+        `executor` is "thread" or "process" to create a pool of `max_workers` owned by this converter,
+        or an existing executor, which is used as is and isn't shut down by `close`. Converting in a
+        thread keeps the event loop responsive, but only a process pool converts AMRs in parallel.
+        """
+        self.converter = converter if converter is not None else AmrLogicConverter()
+        if max_workers is not None and max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError(
+                f"max_concurrency must be at least 1, got {max_concurrency}"
+            )
+        num_workers = max_workers or os.cpu_count() or 1
+        self._owns_executor = not isinstance(executor, Executor)
+        # workers of a pool created here already have the converter, so it isn't sent with every AMR
+        self._convert_fn: Callable[[AmrInput], Clause] = (
+            _convert_in_worker if executor == "process" else self.converter.convert
+        )
+        if executor == "thread":
+            self._executor: Executor = ThreadPoolExecutor(
+                max_workers=num_workers, thread_name_prefix="amr-logic-converter"
+            )
+        elif executor == "process":
+            self._executor = ProcessPoolExecutor(
+                max_workers=num_workers,
+                initializer=_init_worker,
+                initargs=(self.converter,),
+            )
+        elif isinstance(executor, Executor):
+            self._executor = executor
+        else:
+            raise ValueError(
+                f'Expected executor to be "thread", "process" or an Executor. Got {executor!r}'
+            )
+        # allow a few conversions per worker to wait in the pool, so workers don't sit idle
+        self.max_concurrency = max_concurrency or 2 * num_workers
+        self.timeout = timeout
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        # the shared conversion of each AMR string in flight
+        self._in_flight: dict[str, asyncio.Task[Clause]] = {}
+        # the number of calls waiting for each conversion in flight
+        self._num_waiting: dict[asyncio.Task[Clause], int] = {}
+        self._closed = False
+
+    @property
+    def num_in_flight(self) -> int:
+        """The number of distinct conversions waiting for a slot or running in the pool"""
+        return len(self._num_waiting)
+
+    async def convert(
+        self, amr: str | Tree | Graph, timeout: Optional[float] = _DEFAULT_TIMEOUT
+    ) -> Clause:
+        """
+        Convert an AMR to logic in the pool. `timeout` overrides the converter's timeout for this call.
+        Errors raised converting the AMR are raised here.
+        """
+        if self._closed:
+            raise RuntimeError("Can't convert with a closed AsyncAmrLogicConverter")
+        if timeout is _DEFAULT_TIMEOUT:
+            timeout = self.timeout
+        key = amr if isinstance(amr, str) else None
+        task = self._in_flight.get(key) if key is not None else None
+        if task is None:
+            task = asyncio.create_task(self._run(amr))
+            self._num_waiting[task] = 0
+            task.add_done_callback(partial(self._forget, key))
+            if key is not None:
+                self._in_flight[key] = task
+        self._num_waiting[task] += 1
+        try:
+            # shield the shared task, so one call giving up doesn't cancel it for the others
+            return await asyncio.wait_for(asyncio.shield(task), timeout)
+        finally:
+            if not task.done():
+                self._num_waiting[task] -= 1
+                if self._num_waiting[task] == 0:
+                    # later calls for the same AMR start a new conversion rather than join a cancelled one
+                    self._forget(key, task)
+                    task.cancel()
+
+    async def close(self) -> None:
+        """Stop accepting conversions, and shut down the pool if this converter created it"""
+        self._closed = True
+        if self._owns_executor:
+            await asyncio.get_running_loop().run_in_executor(
+                None, self._executor.shutdown
+            )
+
+    async def __aenter__(self) -> AsyncAmrLogicConverter:
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def _run(self, amr: AmrInput) -> Clause:
+        loop = asyncio.get_running_loop()
+        await self._semaphore.acquire()
+        try:
+            future: Future[Clause] = self._executor.submit(self._convert_fn, amr)
+        except BaseException:
+            self._semaphore.release()
+            raise
+        # the slot is only freed once the pool is done with the conversion, even if this task is cancelled
+        future.add_done_callback(partial(self._release_slot, loop))
+        return await asyncio.wrap_future(future)
+
+    def _release_slot(
+        self, loop: asyncio.AbstractEventLoop, _future: Future[Clause]
+    ) -> None:
+        if not loop.is_closed():
+            loop.call_soon_threadsafe(self._semaphore.release)
+
+    def _forget(self, key: Optional[str], task: asyncio.Task[Clause]) -> None:
+        self._num_waiting.pop(task, None)
+        if key is not None and self._in_flight.get(key) is task:
+            del self._in_flight[key]
+
+
+_worker_converter: Optional[AmrLogicConverter] = None
+
+
+def _init_worker(converter: AmrLogicConverter) -> None:
+    # the converter is sent once per worker process rather than with every AMR
+    global _worker_converter
+    _worker_converter = converter
+
+
+def _convert_in_worker(amr: AmrInput) -> Clause:
+    assert _worker_converter is not None
+    try:
+        return _worker_converter.convert(amr)
+    except Exception as error:
+        raise _make_picklable(error) from None
@@ -0,0 +1,223 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, Protocol, cast
+
+from penman.tree import Branch
+
+from amr_logic_converter.InternTable import InternTable
+from amr_logic_converter.types import (
+    And,
+    Atom,
+    Clause,
+    Constant,
+    ConstantType,
+    Exists,
+    Implies,
+    Not,
+    Predicate,
+    Term,
+    Variable,
+)
+
+
+class LogicBuilder(Protocol):
+    """
+    Builds the logic of a conversion out of its parts, instead of the default Clause types.
+    Whatever the builder returns is passed back into it as the parts of bigger formulas.
+    """
+
+    def atom(self, predicate: Predicate, terms: tuple[Term, ...]) -> Any:
+        ...
+
+    def conjunction(self, args: list[Any]) -> Any:
+        ...
+
+    def negation(self, body: Any) -> Any:
+        ...
+
+    def existential(self, variable: Variable, body: Any) -> Any:
+        ...
+
+    def implication(self, antecedent: Any, consequent: Any) -> Any:
+        ...
+
+
+@dataclass(frozen=True)
+class ConversionPlan:
+    """
+    Conversion routines specialized on a converter's options when it's configured, so converting
+    doesn't need to check the options again for every node and edge.
+    """
+
+    # the predicate for a concept or role
+    predicate: Callable[[str], Predicate]
+    # the term an instance is bound to: a variable, or a constant
+    bound_instance: Callable[[str], Variable | Constant]
+    # the constant for an attribute value
+    constant: Callable[[str], Constant]
+    # the atom for the concept of an instance, like `dog~3`, given its bound instance
+    concept_atom: Callable[[str, Term], Atom]
+    # the atom for an edge from source to target, flipping :ARGX-of(x,y) to :ARGX(y,x) if inverting relations
+    role_atom: Callable[[str, Term, Term], Atom]
+    # the priority of an edge in the conversion order, highest first, or None if edges are converted in tree order
+    edge_priority: Optional[Callable[[Branch], int]]
+    # the role whose relation is left out of the logic, as it's turned into an implication instead
+    implication_role: Optional[str]
+    # combine the closure, condition, predicate and edge terms of a node into a single clause
+    conjoin: Callable[[Optional[Clause], Optional[Clause], Atom, list[Clause]], Clause]
+    # quantify a clause over a bound instance, negating it if the instance has negative polarity
+    quantify: Callable[[Clause, Variable | Constant, bool], Clause]
+
+
+def compile_conversion_plan(
+    intern_table: InternTable,
+    invert_relations: bool,
+    existentially_quantify_instances: bool,
+    use_variables_for_instances: bool,
+    capitalize_variables: bool,
+    use_implies_for_conditions: bool,
+    builder: Optional[LogicBuilder] = None,
+) -> ConversionPlan:
+    """
+    Compile the conversion routines for the options, building Clauses, or building the logic
+    with the builder if one is given
+    """
+    variable = intern_table.variable
+    constant = intern_table.constant
+    predicate = intern_table.predicate
+    inverted_predicate = intern_table.inverted_predicate
+
+    bound_instance: Callable[[str], Variable | Constant]
+    if existentially_quantify_instances or use_variables_for_instances:
+        if capitalize_variables:
+            bound_instance = lambda name: variable(name.capitalize())  # noqa: E731
+        else:
+            bound_instance = variable
+    else:
+        bound_instance = lambda name: constant(name, "instance")  # noqa: E731
+
+    make_atom: Callable[[Predicate, tuple[Term, ...]], Atom] = Atom
+    conjoin: Callable[
+        [Optional[Clause], Optional[Clause], Atom, list[Clause]], Clause
+    ] = (_conjoin_implying if use_implies_for_conditions else _conjoin)
+    quantify: Callable[[Clause, Variable | Constant, bool], Clause] = (
+        _quantify_existentially
+        if existentially_quantify_instances
+        else _quantify_polarity
+    )
+    if builder is not None:
+        make_atom = builder.atom
+        conjoin, quantify = _compile_builder_routines(
+            builder, existentially_quantify_instances, use_implies_for_conditions
+        )
+
+    def concept_atom(concept: str, bound_instance: Term) -> Atom:
+        return make_atom(predicate(concept), (bound_instance,))
+
+    def role_atom(role: str, source: Term, target: Term) -> Atom:
+        return make_atom(predicate(role), (source, target))
+
+    def inverting_role_atom(role: str, source: Term, target: Term) -> Atom:
+        role_predicate = predicate(role)
+        if role_predicate.symbol.endswith("-of"):
+            return make_atom(inverted_predicate(role), (target, source))
+        return make_atom(role_predicate, (source, target))
+
+    return ConversionPlan(
+        predicate=predicate,
+        bound_instance=bound_instance,
+        constant=lambda value: constant(value, determine_const_type(value)),
+        concept_atom=concept_atom,
+        role_atom=inverting_role_atom if invert_relations else role_atom,
+        edge_priority=_condition_priority if use_implies_for_conditions else None,
+        implication_role=":condition" if use_implies_for_conditions else None,
+        conjoin=conjoin,
+        quantify=quantify,
+    )
+
+
+def _compile_builder_routines(
+    builder: LogicBuilder,
+    existentially_quantify_instances: bool,
+    use_implies_for_conditions: bool,
+) -> tuple[
+    Callable[[Optional[Clause], Optional[Clause], Atom, list[Clause]], Clause],
+    Callable[[Clause, Variable | Constant, bool], Clause],
+]:
+    """The same as the conjoin and quantify routines below, but with the builder's formulas"""
+
+    def conjoin(
+        closure_term: Optional[Clause],
+        condition_term: Optional[Clause],
+        predicate_term: Atom,
+        subterms: list[Clause],
+    ) -> Clause:
+        args: list[Any] = []
+        if closure_term is not None:
+            args.append(closure_term)
+        if condition_term is not None and not use_implies_for_conditions:
+            args.append(condition_term)
+        args.append(predicate_term)
+        args.extend(subterms)
+        conjunction = builder.conjunction(args)
+        if condition_term is not None and use_implies_for_conditions:
+            return builder.implication(condition_term, conjunction)
+        return conjunction
+
+    def quantify(
+        clause: Clause, bound_instance: Variable | Constant, polarity: bool
+    ) -> Clause:
+        if existentially_quantify_instances:
+            clause = builder.existential(cast(Variable, bound_instance), clause)
+        return clause if polarity else builder.negation(clause)
+
+    return conjoin, quantify
+
+
+def determine_const_type(value: str) -> ConstantType:
+    return "string" if value.startswith('"') else "symbol"
+
+
+def _condition_priority(edge: Branch) -> int:
+    # make sure :condition is processed first if we're rewriting using Implies
+    return 1 if edge[0] == ":condition" else 0
+
+
+def _conjoin(
+    closure_term: Optional[Clause],
+    condition_term: Optional[Clause],
+    predicate_term: Atom,
+    subterms: list[Clause],
+) -> Clause:
+    pre_terms: list[Clause] = []
+    if closure_term is not None:
+        pre_terms.append(closure_term)
+    if condition_term is not None:
+        pre_terms.append(condition_term)
+    pre_terms.append(predicate_term)
+    return And(*pre_terms, *subterms)
+
+
+def _conjoin_implying(
+    closure_term: Optional[Clause],
+    condition_term: Optional[Clause],
+    predicate_term: Atom,
+    subterms: list[Clause],
+) -> Clause:
+    conjunction = _conjoin(closure_term, None, predicate_term, subterms)
+    if condition_term is not None:
+        return Implies(condition_term, conjunction)
+    return conjunction
+
+
+def _quantify_polarity(
+    clause: Clause, _bound_instance: Variable | Constant, polarity: bool
+) -> Clause:
+    return clause if polarity else Not(clause)
+
+
+def _quantify_existentially(
+    clause: Clause, bound_instance: Variable | Constant, polarity: bool
+) -> Clause:
+    expr = Exists(cast(Variable, bound_instance), body=clause)
+    return expr if polarity else Not(expr)
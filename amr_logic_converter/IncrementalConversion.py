@@ -0,0 +1,324 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Any, Optional, cast
+
+from penman.graph import Graph
+from penman.tree import Branch, Node, Tree
+
+from amr_logic_converter.AmrContext import _is_negation
+from amr_logic_converter.AmrLogicConverter import AmrLogicConverter, _to_amr_tree
+from amr_logic_converter.types import Clause
+
+
+# the parent instance and role of the edge into a node, or None for the root
+EdgeIntoNode = Optional[tuple[str, str]]
+
+
+@dataclass
+class _SubtreeResult:
+    node: Node
+    edge_into_node: EdgeIntoNode
+    logic: Clause
+
+
+class IncrementalConversion:
+    """
+    Convert an AMR, then cheaply reconvert it after each local edit: changing a concept or polarity,
+    or adding or removing an edge.
+
+    The logic of every subtree that doesn't share any instances with the rest of the tree is kept
+    from the last conversion, and reused until the subtree or the edge into it changes, so only the
+    subtrees around an edit are converted again. The logic is always the same as converting the
+    edited tree from scratch.
+
+    basic usage:
+    conversion = IncrementalConversion(AmrLogicConverter(), "(d / dog :ARG0-of (b / bark-01))")
+    conversion.set_polarity("b", False)
+    print(conversion.logic)
+    """
+
+    converter: AmrLogicConverter
+
+    def __init__(self, converter: AmrLogicConverter, amr: str | Tree | Graph) -> None:
+        if (
+            converter.override_is_projective is not None
+            or converter.override_quantification is not None
+            or converter.override_conjunction is not None
+        ):
+            raise ValueError(
+                "Incremental conversion can't be used with override callbacks, as they can depend on the whole tree"
+            )
+        self.converter = converter
+        self._tree = _to_amr_tree(amr)
+        self._logic: Optional[Clause] = None
+        # the logic of closed subtrees from earlier conversions, by the instance of their root
+        self._subtree_results: dict[str, _SubtreeResult] = {}
+        self._options: Optional[tuple[Any, ...]] = None
+
+    @property
+    def tree(self) -> Tree:
+        """The AMR tree with all edits so far applied"""
+        return self._tree
+
+    @property
+    def logic(self) -> Clause:
+        """The logic for the current tree, reconverting it if it's been edited"""
+        if self._logic is None:
+            self._logic = self._reconvert()
+        return self._logic
+
+    def set_concept(self, instance_name: str, concept: str) -> None:
+        """Change the concept of an instance, like `dog` or `dog~3`"""
+        path = self._find_path(instance_name)
+        _, branches = path[-1]
+        self._replace_node(path, [("/", concept), *branches[1:]])
+
+    def set_polarity(self, instance_name: str, polarity: bool) -> None:
+        """Add a :polarity - edge to the instance if polarity is False, or remove it if True"""
+        path = self._find_path(instance_name)
+        _, branches = path[-1]
+        new_branches = [edge for edge in branches if not _is_negation(edge)]
+        if not polarity:
+            new_branches.append((":polarity", "-"))
+        self._replace_node(path, new_branches)
+
+    def add_edge(self, instance_name: str, role: str, target: str | Node) -> None:
+        """
+        Add an edge from the instance to a constant, a reference to an existing instance,
+        or a new node whose instances aren't in the tree yet
+        """
+        if type(target) is tuple:
+            instances = _list_instances(self._tree.node)
+            for new_instance in _list_instances(target):
+                if new_instance in instances:
+                    raise ValueError(f"Instance {new_instance} is already in the tree")
+        path = self._find_path(instance_name)
+        _, branches = path[-1]
+        self._replace_node(path, [*branches, (role, target)])
+
+    def remove_edge(
+        self, instance_name: str, role: str, target: Optional[str] = None
+    ) -> None:
+        """
+        Remove the first edge with the role from the instance, only matching edges to the given
+        constant or instance if target is set
+        """
+        path = self._find_path(instance_name)
+        _, branches = path[-1]
+        for index, (edge_role, edge_target) in enumerate(branches):
+            if index == 0 or edge_role != role:
+                continue
+            if target is None or target == (
+                edge_target[0] if type(edge_target) is tuple else edge_target
+            ):
+                self._replace_node(path, branches[:index] + branches[index + 1 :])
+                return
+        raise ValueError(f"Instance {instance_name} has no {role} edge to remove")
+
+    def _find_path(self, instance_name: str) -> list[Node]:
+        """The nodes from the root down to the node of the instance"""
+        parents: dict[str, Node] = {}
+        nodes: list[Node] = [self._tree.node]
+        while nodes:
+            node = nodes.pop()
+            if node[0] == instance_name:
+                path = [node]
+                while path[-1][0] in parents:
+                    path.append(parents[path[-1][0]])
+                path.reverse()
+                return path
+            for _role, target in node[1]:
+                if type(target) is tuple:
+                    parents[target[0]] = node
+                    nodes.append(target)
+        raise ValueError(f"Instance {instance_name} is not in the tree")
+
+    def _replace_node(self, path: list[Node], branches: list[Branch]) -> None:
+        """
+        Replace the last node in the path with one with new branches, copying its ancestors
+        so every unchanged subtree is still the same object
+        """
+        node = path[-1]
+        new_node = cast(Node, (node[0], branches))
+        for parent in reversed(path[:-1]):
+            parent_branches = [
+                (role, new_node if target is node else target)
+                for role, target in parent[1]
+            ]
+            node, new_node = parent, cast(Node, (parent[0], parent_branches))
+        self._tree = Tree(new_node, metadata=self._tree.metadata)
+        self._logic = None
+
+    def _reconvert(self) -> Clause:
+        converter = self.converter
+        plan = converter._get_plan()
+        options = (plan, converter.maximally_hoist_coreferences)
+        if options != self._options:
+            self._subtree_results.clear()
+            self._options = options
+        root = self._tree.node
+        edges_into_nodes, open_instances = _find_open_subtrees(
+            root, converter.maximally_hoist_coreferences
+        )
+        previous_results = self._subtree_results
+
+        def reusable_result(node: Node) -> Optional[Clause]:
+            instance_name = node[0]
+            previous = previous_results.get(instance_name)
+            if (
+                previous is None
+                or previous.node is not node
+                or instance_name in open_instances
+                or previous.edge_into_node != edges_into_nodes[instance_name]
+            ):
+                return None
+            return previous.logic
+
+        root_result = reusable_result(root)
+        if root_result is not None:
+            # the whole tree is closed, so nothing is hoisted above the root
+            return root_result
+
+        # replace subtrees whose logic can be reused by a node with just their concept,
+        # so the context is only built for the parts of the tree being converted again
+        subtree_results: dict[str, Clause] = {}
+        converted_nodes: dict[str, Node] = {}
+        preorder: list[Node] = []
+        nodes: list[Node] = [root]
+        while nodes:
+            node = nodes.pop()
+            converted_nodes[node[0]] = node
+            preorder.append(node)
+            for _role, target in node[1]:
+                if type(target) is tuple:
+                    logic = reusable_result(target)
+                    if logic is None:
+                        nodes.append(target)
+                    else:
+                        subtree_results[target[0]] = logic
+        pruned_root = root
+        if subtree_results:
+            pruned_root = _prune_tree(preorder, subtree_results)
+
+        logic = converter._convert_amr_tree(Tree(pruned_root), subtree_results)
+
+        for instance_name, node in converted_nodes.items():
+            if instance_name not in open_instances:
+                previous_results[instance_name] = _SubtreeResult(
+                    node=node,
+                    edge_into_node=edges_into_nodes[instance_name],
+                    logic=subtree_results[instance_name],
+                )
+        # drop results of subtrees which were edited or removed once they're the majority
+        if len(previous_results) > 2 * len(edges_into_nodes):
+            self._subtree_results = {
+                instance_name: result
+                for instance_name, result in previous_results.items()
+                if _is_current(result, edges_into_nodes, converted_nodes)
+            }
+        return logic
+
+
+def _prune_tree(preorder: list[Node], subtree_results: dict[str, Clause]) -> Node:
+    """Copy the nodes, replacing the subtrees with known results by a node with just their concept"""
+    pruned_nodes: dict[str, Node] = {}
+    for node in reversed(preorder):
+        pruned_nodes[node[0]] = cast(
+            Node,
+            (
+                node[0],
+                [
+                    (role, _prune_target(target, pruned_nodes))
+                    for role, target in node[1]
+                ],
+            ),
+        )
+    return pruned_nodes[preorder[0][0]]
+
+
+def _prune_target(target: Node | str, pruned_nodes: dict[str, Node]) -> Node | str:
+    if type(target) is not tuple:
+        return target
+    pruned_node = pruned_nodes.get(target[0])
+    if pruned_node is not None:
+        return pruned_node
+    # the logic of this subtree is reused, so only its concept is needed
+    return cast(Node, (target[0], target[1][:1]))
+
+
+def _list_instances(node: Node) -> set[str]:
+    instances: set[str] = set()
+    nodes = [node]
+    while nodes:
+        instance_name, branches = nodes.pop()
+        instances.add(instance_name)
+        nodes.extend(target for _role, target in branches if type(target) is tuple)
+    return instances
+
+
+def _find_open_subtrees(
+    root: Node, maximally_hoist_coreferences: bool
+) -> tuple[dict[str, EdgeIntoNode], set[str]]:
+    """
+    Find the edge into each node, and the nodes whose subtrees aren't closed. A subtree is closed
+    if none of its instances are referenced from outside it and it doesn't reference any instances
+    outside it, so its logic only depends on the subtree and the edge into it.
+    """
+    edges_into_nodes: dict[str, EdgeIntoNode] = {root[0]: None}
+    parents: dict[str, str] = {}
+    preorder: list[str] = []
+    references: list[tuple[str, str]] = []
+    nodes: list[Node] = [root]
+    while nodes:
+        instance_name, branches = nodes.pop()
+        preorder.append(instance_name)
+        for role, target in branches[1:]:
+            if type(target) is tuple:
+                edges_into_nodes[target[0]] = (instance_name, role)
+                parents[target[0]] = instance_name
+                nodes.append(target)
+            else:
+                references.append((instance_name, target))
+
+    # a subtree is the span of its root and descendants in the preorder walk
+    positions = {instance_name: i for i, instance_name in enumerate(preorder)}
+    sizes = dict.fromkeys(preorder, 1)
+    for instance_name in reversed(preorder[1:]):
+        sizes[parents[instance_name]] += sizes[instance_name]
+
+    def contains(subtree: str, instance_name: str) -> bool:
+        start = positions[subtree]
+        return start <= positions[instance_name] < start + sizes[subtree]
+
+    open_instances: set[str] = set()
+    for source, target in references:
+        if target not in positions:
+            # a constant, not a reference
+            continue
+        # every subtree containing just one end of the reference is open, up to their common ancestor
+        for start, end in ((source, target), (target, source)):
+            instance_name = start
+            while not contains(instance_name, end):
+                open_instances.add(instance_name)
+                instance_name = parents[instance_name]
+        if maximally_hoist_coreferences:
+            # coreferent instances are hoisted out of every subtree to the top of the logic
+            instance_name = target
+            open_instances.add(instance_name)
+            while instance_name in parents:
+                instance_name = parents[instance_name]
+                open_instances.add(instance_name)
+    return edges_into_nodes, open_instances
+
+
+def _is_current(
+    result: _SubtreeResult,
+    edges_into_nodes: dict[str, EdgeIntoNode],
+    converted_nodes: dict[str, Node],
+) -> bool:
+    instance_name = result.node[0]
+    if instance_name not in edges_into_nodes:
+        return False
+    # nodes which weren't walked are inside reused subtrees, which are unchanged
+    node = converted_nodes.get(instance_name)
+    return node is None or node is result.node
@@ -0,0 +1,110 @@
+from __future__ import annotations
+from functools import lru_cache
+from typing import Any, Callable, NamedTuple, Optional, TypeVar
+
+from amr_logic_converter.parse_symbol_and_alignment import parse_symbol_and_alignment
+from amr_logic_converter.types import Constant, ConstantType, Predicate, Variable
+
+
+T = TypeVar("T")
+
+
+class ParseCacheInfo(NamedTuple):
+    """Hit, miss and size statistics of a symbol parsing cache"""
+
+    hits: int
+    misses: int
+    maxsize: Optional[int]
+    currsize: int
+
+
+class InternTable:
+    """
+    Share a single Predicate, Variable or Constant object between all equal symbols, keyed by the
+    raw AMR string they're built from, so repeated roles, concepts and instances aren't re-parsed
+    or re-allocated. The logic types are immutable, so sharing them between formulas is safe.
+
+    Once `max_size` symbols are stored, the oldest are evicted first. `max_size=None` never evicts,
+    and `max_size=0` disables interning entirely.
+
+    Symbols that aren't interned yet are split into their value and alignment through an LRU cache
+    of `parse_cache_size` entries (`None` for unbounded, 0 to disable), so strings aren't re-parsed
+    even when interning is disabled or they've been evicted.
+    """
+
+    max_size: Optional[int]
+    parse_cache_size: Optional[int]
+
+    def __init__(
+        self,
+        max_size: Optional[int] = 100_000,
+        parse_cache_size: Optional[int] = 4096,
+    ) -> None:
+        if max_size is not None and max_size < 0:
+            raise ValueError(f"max_size must be at least 0, got {max_size}")
+        if parse_cache_size is not None and parse_cache_size < 0:
+            raise ValueError(
+                f"parse_cache_size must be at least 0, got {parse_cache_size}"
+            )
+        self.max_size = max_size
+        self.parse_cache_size = parse_cache_size
+        self._symbols: dict[tuple[str, ...], Any] = {}
+        self._parse = lru_cache(maxsize=parse_cache_size)(parse_symbol_and_alignment)
+
+    def predicate(self, amr_str: str) -> Predicate:
+        """The predicate for an AMR concept or role, like `dog~3` or `:ARG0`"""
+        return self._intern(
+            ("predicate", amr_str), lambda: Predicate(*self._parse(amr_str))
+        )
+
+    def inverted_predicate(self, amr_str: str) -> Predicate:
+        """The predicate for an inverted AMR role, like `:ARG0` for `:ARG0-of`"""
+        return self._intern(
+            ("inverted_predicate", amr_str),
+            lambda: _invert_predicate(self.predicate(amr_str)),
+        )
+
+    def variable(self, name: str) -> Variable:
+        return self._intern(("variable", name), lambda: Variable(name))
+
+    def constant(self, element: str, type: ConstantType) -> Constant:
+        def build_constant() -> Constant:
+            value, alignment = self._parse(element)
+            return Constant.from_parsed(value, type, alignment)
+
+        return self._intern(("constant", type, element), build_constant)
+
+    def parse_cache_info(self) -> ParseCacheInfo:
+        """Hit, miss and size statistics of the symbol parsing cache"""
+        return ParseCacheInfo(*self._parse.cache_info())
+
+    def clear(self) -> None:
+        """Remove all interned symbols and cached parses, resetting the parse cache statistics"""
+        self._symbols.clear()
+        self._parse.cache_clear()
+
+    def __len__(self) -> int:
+        return len(self._symbols)
+
+    def __reduce__(
+        self,
+    ) -> tuple[Callable[..., InternTable], tuple[Optional[int], Optional[int]]]:
+        # don't ship the interned symbols to worker processes along with the converter
+        return (InternTable, (self.max_size, self.parse_cache_size))
+
+    def _intern(self, key: tuple[str, ...], factory: Callable[[], T]) -> T:
+        symbol = self._symbols.get(key)
+        if symbol is not None:
+            return symbol
+        symbol = factory()
+        if self.max_size is None or len(self._symbols) < self.max_size:
+            self._symbols[key] = symbol
+        elif self.max_size > 0:
+            # dicts keep insertion order, so the first key is the oldest
+            self._symbols.pop(next(iter(self._symbols)), None)
+            self._symbols[key] = symbol
+        return symbol
+
+
+def _invert_predicate(predicate: Predicate) -> Predicate:
+    return Predicate(predicate.symbol[:-3], predicate.alignment)
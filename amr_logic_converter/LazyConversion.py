@@ -0,0 +1,271 @@
+from __future__ import annotations
+from collections import Counter
+from copy import copy
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Iterator, Optional
+
+from penman.surface import Alignment
+from penman.tree import Node, Tree
+
+from amr_logic_converter.AmrContext import AmrContext, _is_negation
+from amr_logic_converter.ConversionPlan import ConversionPlan
+from amr_logic_converter.types import (
+    All,
+    And,
+    Atom,
+    Clause,
+    Constant,
+    Exists,
+    Implies,
+    Not,
+    Or,
+    Predicate,
+    Variable,
+)
+
+if TYPE_CHECKING:
+    from amr_logic_converter.AmrLogicConverter import (
+        AmrLogicConverter,
+        OverrideQuantificationCallbackInfo,
+    )
+
+
+@dataclass(frozen=True)
+class Quantification:
+    """The quantifier or negation wrapped around the logic of a scope for an instance"""
+
+    instance_name: str
+    bound_instance: Variable | Constant
+    # the instance of the node whose logic is wrapped, or None for the whole formula
+    scope: Optional[str]
+    is_existential: bool
+    is_negated: bool
+
+
+class LazyConversion:
+    """
+    A handle on the logic for an AMR, returned by `AmrLogicConverter.convert(amr, lazy=True)`.
+    Each part of the logic is only built the first time it's read, so reading the atoms or the
+    quantifiers doesn't build the nested formula.
+
+    The converter only keeps the last :condition of an instance with several, so for AMRs like that
+    the formula is built to find which atoms and quantifiers are kept.
+
+    Override conjunction and quantification callbacks can change any part of the formula,
+    so converters using them can't convert lazily.
+    """
+
+    converter: AmrLogicConverter
+    amr_tree: Tree
+
+    def __init__(self, converter: AmrLogicConverter, amr_tree: Tree) -> None:
+        if (
+            converter.override_quantification is not None
+            or converter.override_conjunction is not None
+        ):
+            raise ValueError(
+                "Lazy conversion can't be used with override_quantification or override_conjunction callbacks"
+            )
+        self.converter = converter
+        self.amr_tree = amr_tree
+        self._clause: Optional[Clause] = None
+        self._atoms: Optional[list[Atom]] = None
+        self._quantifier_prefix: Optional[list[Quantification]] = None
+
+    @property
+    def clause(self) -> Clause:
+        """The full logic formula, the same as converting without lazy=True"""
+        if self._clause is None:
+            self._clause = self.converter.convert_amr_tree(self.amr_tree)
+        return self._clause
+
+    @property
+    def atoms(self) -> list[Atom]:
+        """
+        Every atom in the formula, once for each time it appears there. Atoms are listed in tree
+        order, with each instance's concept before the atoms of its edges.
+        """
+        if self._atoms is None:
+            preorder = _preorder_nodes(self.amr_tree)
+            atoms = _collect_atoms(preorder, self.converter._get_plan())
+            if _has_dropped_conditions(preorder):
+                atoms = _keep_atoms_in_clause(atoms, self.clause)
+            self._atoms = atoms
+        return self._atoms
+
+    @property
+    def predicate_symbols(self) -> frozenset[str]:
+        """The symbols of all the predicates used in the formula"""
+        return frozenset(atom.predicate.symbol for atom in self.atoms)
+
+    @property
+    def alignments(self) -> list[tuple[Predicate | Constant, Alignment]]:
+        """Each aligned predicate and constant in the atoms with its alignment, in the order of the atoms"""
+        alignments: list[tuple[Predicate | Constant, Alignment]] = []
+        seen: set[Predicate | Constant] = set()
+        for atom in self.atoms:
+            for symbol in (atom.predicate, *atom.terms):
+                if (
+                    isinstance(symbol, Variable)
+                    or symbol.alignment is None
+                    or symbol in seen
+                ):
+                    continue
+                seen.add(symbol)
+                alignments.append((symbol, symbol.alignment))
+        return alignments
+
+    @property
+    def quantifier_prefix(self) -> list[Quantification]:
+        """
+        The quantifiers and negations wrapped around the logic of each scope: the whole formula first,
+        then the nodes' scopes in tree order, with the outermost first within each scope. Instances
+        which are neither existentially quantified nor negated aren't included.
+        """
+        if self._quantifier_prefix is None:
+            self._quantifier_prefix = self._find_quantifier_prefix()
+        return self._quantifier_prefix
+
+    def _find_quantifier_prefix(self) -> list[Quantification]:
+        converter = self.converter
+        plan = converter._get_plan()
+        preorder = _preorder_nodes(self.amr_tree)
+        kept_instances: Optional[set[str]] = None
+        if _has_dropped_conditions(preorder):
+            kept_instances = self._convert_finding_quantified_instances()
+        ctx = AmrContext.from_amr_tree(
+            self.amr_tree,
+            override_is_projective=converter.override_is_projective,
+            edge_priority=plan.edge_priority,
+            maximally_hoist_coreferences=converter.maximally_hoist_coreferences,
+        )
+        is_existential = converter.existentially_quantify_instances
+        prefix: list[Quantification] = []
+        for scope in [None, *(node[0] for node in preorder)]:
+            instances = ctx.scope_instance_map.get(scope)
+            if not instances:
+                continue
+            # the converter applies quantifiers from the deepest instance outwards
+            innermost_first = sorted(
+                sorted(instances), key=ctx.get_instance_depth, reverse=True
+            )
+            for instance_name in reversed(innermost_first):
+                is_negated = ctx.is_instance_negated(instance_name)
+                if kept_instances is not None and instance_name not in kept_instances:
+                    continue
+                if is_existential or is_negated:
+                    prefix.append(
+                        Quantification(
+                            instance_name=instance_name,
+                            bound_instance=plan.bound_instance(instance_name),
+                            scope=scope,
+                            is_existential=is_existential,
+                            is_negated=is_negated,
+                        )
+                    )
+        return prefix
+
+    def _convert_finding_quantified_instances(self) -> set[str]:
+        """Build the formula, returning the instances whose quantifiers are kept in it"""
+        plan = self.converter._get_plan()
+        quantifications: list[tuple[str, Clause]] = []
+
+        def record_quantification(
+            clause: Clause, info: OverrideQuantificationCallbackInfo
+        ) -> Clause:
+            quantified = plan.quantify(clause, info.bound_instance, not info.is_negated)
+            quantifications.append((info.instance_name, quantified))
+            return quantified
+
+        recording_converter = copy(self.converter)
+        recording_converter.override_quantification = record_quantification
+        self._clause = recording_converter._convert_amr_tree(self.amr_tree)
+        # the recorded formulas are still referenced, so their ids can't be reused
+        kept_ids = {id(subformula) for subformula in _iter_subformulas(self._clause)}
+        return {
+            instance_name
+            for instance_name, quantified in quantifications
+            if id(quantified) in kept_ids
+        }
+
+
+def _preorder_nodes(amr_tree: Tree) -> list[Node]:
+    preorder: list[Node] = []
+    nodes: list[Node] = [amr_tree.node]
+    while nodes:
+        node = nodes.pop()
+        preorder.append(node)
+        for _role, target in reversed(node[1]):
+            if type(target) is tuple:
+                nodes.append(target)
+    return preorder
+
+
+def _collect_atoms(preorder: list[Node], plan: ConversionPlan) -> list[Atom]:
+    """
+    Build the atoms the converter would put in the formula, without building the formula: a concept
+    atom per instance, and an atom per edge other than :polarity - and the implication role
+    """
+    instances = {
+        instance_name
+        for instance_name, branches in preorder
+        if branches and branches[0][0] == "/" and len(branches[0]) == 2
+    }
+    bound_instance = plan.bound_instance
+    role_atom = plan.role_atom
+    implication_role = plan.implication_role
+    atoms: list[Atom] = []
+    for instance_name, branches in preorder:
+        bound_source = bound_instance(instance_name)
+        atoms.append(plan.predicate(branches[0][1])(bound_source))
+        for edge in branches[1:]:
+            role, target = edge
+            if type(target) is tuple or target in instances:
+                if role != implication_role:
+                    target_instance = target[0] if type(target) is tuple else target
+                    atoms.append(
+                        role_atom(role, bound_source, bound_instance(target_instance))
+                    )
+            elif not _is_negation(edge):
+                atoms.append(role_atom(role, bound_source, plan.constant(target)))
+    return atoms
+
+
+def _has_dropped_conditions(preorder: list[Node]) -> bool:
+    """Check if any instance has several :condition edges, all but the last of which are dropped"""
+    for _instance_name, branches in preorder:
+        num_conditions = 0
+        for role, _target in branches:
+            if role == ":condition":
+                num_conditions += 1
+        if num_conditions > 1:
+            return True
+    return False
+
+
+def _keep_atoms_in_clause(atoms: list[Atom], clause: Clause) -> list[Atom]:
+    counts = Counter(
+        subformula
+        for subformula in _iter_subformulas(clause)
+        if isinstance(subformula, Atom)
+    )
+    kept_atoms: list[Atom] = []
+    for atom in atoms:
+        if counts[atom] > 0:
+            counts[atom] -= 1
+            kept_atoms.append(atom)
+    return kept_atoms
+
+
+def _iter_subformulas(clause: Clause) -> Iterator[Clause]:
+    clauses: list[Clause] = [clause]
+    while clauses:
+        current = clauses.pop()
+        yield current
+        if isinstance(current, (And, Or)):
+            clauses.extend(current.args)
+        elif isinstance(current, (Not, Exists, All)):
+            clauses.append(current.body)
+        elif isinstance(current, Implies):
+            clauses.append(current.antecedent)
+            clauses.append(current.consequent)
@@ -0,0 +1,55 @@
+from __future__ import annotations
+from bisect import bisect_right
+
+
+class LcaTracker:
+    """
+    Track the lowest common ancestor (LCA) of every occurrence of each name in a tree while it's
+    walked depth-first, without storing ancestor sets.
+
+    Every occurrence gets an increasing preorder id. A node on the current root path is an ancestor
+    of an earlier visited node exactly when its id is not greater than that node's id, and the ids on
+    the path are sorted, so the LCA of a name's previous occurrences and the current position is found
+    with a single bisect of the path. This makes the walk O(n + r·log(depth)) for r re-entrancies.
+    """
+
+    def __init__(self) -> None:
+        self._next_id = 0
+        # ids and names of the nodes on the path from the root to the current node
+        self._path_ids: list[int] = []
+        self._path_names: list[str] = []
+        # the running LCA of each name, as (preorder id, name)
+        self._lcas: dict[str, tuple[int, str]] = {}
+
+    def enter(self, name: str) -> None:
+        """Record an occurrence of a node with the given name and descend into it"""
+        self._path_ids.append(self._next_id)
+        self._path_names.append(name)
+        self._record(name)
+
+    def leave(self) -> None:
+        """Ascend back out of the most recently entered node"""
+        self._path_ids.pop()
+        self._path_names.pop()
+
+    def visit(self, name: str) -> None:
+        """Record an occurrence of a leaf with the given name under the current node"""
+        self._record(name)
+
+    def lca(self, name: str) -> str:
+        """The name of the LCA node of all occurrences of the given name recorded so far"""
+        return self._lcas[name][1]
+
+    def _record(self, name: str) -> None:
+        occurrence_id = self._next_id
+        self._next_id += 1
+        previous_lca = self._lcas.get(name)
+        if previous_lca is None:
+            self._lcas[name] = (occurrence_id, name)
+            return
+        previous_lca_id = previous_lca[0]
+        path_ids = self._path_ids
+        # the deepest node on the path opened no later than the previous LCA
+        pos = bisect_right(path_ids, previous_lca_id) - 1
+        if path_ids[pos] != previous_lca_id:
+            self._lcas[name] = (path_ids[pos], self._path_names[pos])
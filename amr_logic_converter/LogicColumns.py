@@ -0,0 +1,303 @@
+from __future__ import annotations
+from array import array
+import csv
+import os
+from typing import Any, Sequence
+
+from amr_logic_converter.types import Predicate, Term, Variable
+
+
+# a fragment of logic being built is a list of items: an atom row as 2 * row, or a scope row as 2 * row + 1
+_Fragment = list[int]
+
+
+class LogicColumns:
+    """
+    Logic for many AMRs written straight into columnar tables, for bulk loading into a database
+    or dataframe, built with `AmrLogicConverter.convert_to_columns(amrs)` without building any
+    Atom, And or other Clause objects.
+
+    - predicates: predicate_id, symbol, alignment
+    - terms: term_id, value, kind (variable, instance, symbol or string), alignment
+    - atoms: atom_id, amr_index, scope_id, predicate_id, arity, arg0_term_id, arg1_term_id, is_negated
+    - scopes: scope_id, amr_index, parent_scope_id, kind, term_id
+
+    Each atom and scope is in the scope of its parent, or -1 if it's conjoined at the top of its AMR's
+    formula. Scope kinds are "not", "exists" (binding term_id), and "implies", whose child scopes are
+    an "antecedent" and a "consequent". Atoms are negated if they're inside an odd number of "not" scopes.
+    Missing ids are -1 and missing alignments are empty strings.
+    """
+
+    def __init__(self) -> None:
+        self.num_amrs = 0
+        self._predicates: list[Predicate] = []
+        self._predicate_ids: dict[Predicate, int] = {}
+        # interned symbols are looked up by identity first, as hashing them is slower
+        self._predicate_ids_by_ref: dict[int, int] = {}
+        self._terms: list[Term] = []
+        self._term_ids: dict[Term, int] = {}
+        self._term_ids_by_ref: dict[int, int] = {}
+        # every symbol looked up by identity is kept alive, so its id isn't reused
+        self._symbol_refs: list[Predicate | Term] = []
+        self.atom_amr_index = array("q")
+        self.atom_scope_id = array("q")
+        self.atom_predicate_id = array("q")
+        self.atom_arity = array("q")
+        self.atom_arg0_term_id = array("q")
+        self.atom_arg1_term_id = array("q")
+        self.atom_is_negated = array("b")
+        self.scope_amr_index = array("q")
+        self.scope_parent_scope_id = array("q")
+        self.scope_kind: list[str] = []
+        self.scope_term_id = array("q")
+        # the first rows of the AMR being converted
+        self._amr_atom_start = 0
+        self._amr_scope_start = 0
+
+    @property
+    def num_atoms(self) -> int:
+        return len(self.atom_predicate_id)
+
+    @property
+    def num_scopes(self) -> int:
+        return len(self.scope_kind)
+
+    def atom(self, predicate: Predicate, terms: tuple[Term, ...]) -> _Fragment:
+        predicate_id = self._predicate_ids_by_ref.get(id(predicate))
+        if predicate_id is None:
+            predicate_id = self._add_predicate(predicate)
+        arity = len(terms)
+        if arity > 2:
+            raise ValueError(f"Atoms can have at most 2 terms, got {arity}")
+        row = len(self.atom_predicate_id)
+        self.atom_amr_index.append(self.num_amrs)
+        self.atom_scope_id.append(-1)
+        self.atom_predicate_id.append(predicate_id)
+        self.atom_arity.append(arity)
+        self.atom_arg0_term_id.append(self._term_id(terms[0]) if arity > 0 else -1)
+        self.atom_arg1_term_id.append(self._term_id(terms[1]) if arity > 1 else -1)
+        self.atom_is_negated.append(0)
+        return [2 * row]
+
+    def conjunction(self, args: list[_Fragment]) -> _Fragment:
+        items: _Fragment = []
+        for arg in args:
+            items += arg
+        return items
+
+    def negation(self, body: _Fragment) -> _Fragment:
+        return [2 * self._add_scope("not", -1, body) + 1]
+
+    def existential(self, variable: Variable, body: _Fragment) -> _Fragment:
+        return [2 * self._add_scope("exists", self._term_id(variable), body) + 1]
+
+    def implication(self, antecedent: _Fragment, consequent: _Fragment) -> _Fragment:
+        antecedent_scope = self._add_scope("antecedent", -1, antecedent)
+        consequent_scope = self._add_scope("consequent", -1, consequent)
+        implies_scope = self._add_scope(
+            "implies", -1, [2 * antecedent_scope + 1, 2 * consequent_scope + 1]
+        )
+        return [2 * implies_scope + 1]
+
+    def to_dict(self) -> dict[str, dict[str, Sequence[Any]]]:
+        """
+        The columns of each table by name, as int arrays and lists of strings,
+        which can be passed to `pyarrow.table()` or `pandas.DataFrame()`
+        """
+        return {
+            "predicates": {
+                "predicate_id": array("q", range(len(self._predicates))),
+                "symbol": [predicate.symbol for predicate in self._predicates],
+                "alignment": [
+                    _alignment_str(predicate) for predicate in self._predicates
+                ],
+            },
+            "terms": {
+                "term_id": array("q", range(len(self._terms))),
+                "value": [_term_value(term) for term in self._terms],
+                "kind": [_term_kind(term) for term in self._terms],
+                "alignment": [_alignment_str(term) for term in self._terms],
+            },
+            "atoms": {
+                "atom_id": array("q", range(self.num_atoms)),
+                "amr_index": self.atom_amr_index,
+                "scope_id": self.atom_scope_id,
+                "predicate_id": self.atom_predicate_id,
+                "arity": self.atom_arity,
+                "arg0_term_id": self.atom_arg0_term_id,
+                "arg1_term_id": self.atom_arg1_term_id,
+                "is_negated": [bool(negated) for negated in self.atom_is_negated],
+            },
+            "scopes": {
+                "scope_id": array("q", range(self.num_scopes)),
+                "amr_index": self.scope_amr_index,
+                "parent_scope_id": self.scope_parent_scope_id,
+                "kind": self.scope_kind,
+                "term_id": self.scope_term_id,
+            },
+        }
+
+    def write_csv(self, directory: str | os.PathLike[str]) -> None:
+        """Write each table to a CSV file with a header row in the directory, like `atoms.csv`"""
+        os.makedirs(directory, exist_ok=True)
+        for table_name, columns in self.to_dict().items():
+            path = os.path.join(directory, f"{table_name}.csv")
+            with open(path, "w", newline="", encoding="utf-8") as csv_file:
+                writer = csv.writer(csv_file)
+                writer.writerow(columns.keys())
+                writer.writerows(zip(*columns.values()))
+
+    def _add_predicate(self, predicate: Predicate) -> int:
+        predicate_id = self._predicate_ids.get(predicate)
+        if predicate_id is None:
+            predicate_id = len(self._predicates)
+            self._predicate_ids[predicate] = predicate_id
+            self._predicates.append(predicate)
+        self._symbol_refs.append(predicate)
+        self._predicate_ids_by_ref[id(predicate)] = predicate_id
+        return predicate_id
+
+    def _term_id(self, term: Term) -> int:
+        term_id = self._term_ids_by_ref.get(id(term))
+        if term_id is None:
+            term_id = self._term_ids.get(term)
+            if term_id is None:
+                term_id = len(self._terms)
+                self._term_ids[term] = term_id
+                self._terms.append(term)
+            self._symbol_refs.append(term)
+            self._term_ids_by_ref[id(term)] = term_id
+        return term_id
+
+    def _finish_amr(self, formula: _Fragment) -> None:
+        """Finish the rows of the AMR being converted, given the items in its whole formula"""
+        atom_start = self._amr_atom_start
+        scope_start = self._amr_scope_start
+        num_top_items = self.atom_scope_id[atom_start:].count(-1)
+        num_top_items += self.scope_parent_scope_id[scope_start:].count(-1)
+        if num_top_items != len(formula):
+            # some built fragments were left out of the formula, like all but the last :condition
+            self._remove_unused_rows(formula)
+        # scopes are always added after the scopes in their body, so parents come after children
+        scope_kind = self.scope_kind
+        scope_parent_scope_id = self.scope_parent_scope_id
+        scope_negated = [False] * (len(scope_kind) - scope_start)
+        for row in range(len(scope_kind) - 1, scope_start - 1, -1):
+            parent = scope_parent_scope_id[row]
+            negated = parent != -1 and scope_negated[parent - scope_start]
+            scope_negated[row - scope_start] = negated != (scope_kind[row] == "not")
+        atom_is_negated = self.atom_is_negated
+        atom_scope_id = self.atom_scope_id
+        for row in range(atom_start, len(atom_scope_id)):
+            scope = atom_scope_id[row]
+            if scope != -1 and scope_negated[scope - scope_start]:
+                atom_is_negated[row] = 1
+        self.num_amrs += 1
+        self._amr_atom_start = len(atom_scope_id)
+        self._amr_scope_start = len(scope_kind)
+
+    def _discard_amr(self) -> None:
+        """Remove the rows of the AMR being converted, after converting it failed"""
+        self._truncate(self._amr_atom_start, self._amr_scope_start)
+
+    def _truncate(self, num_atoms: int, num_scopes: int) -> None:
+        for atom_column in self._atom_columns():
+            del atom_column[num_atoms:]
+        for scope_column in self._scope_columns():
+            del scope_column[num_scopes:]
+
+    def _remove_unused_rows(self, formula: _Fragment) -> None:
+        atom_start = self._amr_atom_start
+        scope_start = self._amr_scope_start
+        top_items = set(formula)
+        # walk the scopes from the top down, keeping those in the formula, and renumbering them
+        scope_ids: dict[int, int] = {}
+        kept_scopes: list[int] = []
+        for row in range(self.num_scopes - 1, scope_start - 1, -1):
+            parent = self.scope_parent_scope_id[row]
+            if parent == -1:
+                is_kept = 2 * row + 1 in top_items
+            else:
+                is_kept = parent in scope_ids
+            if is_kept:
+                # the new id is set below, once the number of kept scopes is known
+                scope_ids[row] = -1
+                kept_scopes.append(row)
+        kept_scopes.reverse()
+        for new_row, row in enumerate(kept_scopes, scope_start):
+            scope_ids[row] = new_row
+        kept_atoms: list[int] = []
+        for row in range(atom_start, self.num_atoms):
+            scope = self.atom_scope_id[row]
+            if scope == -1:
+                is_kept = 2 * row in top_items
+            else:
+                is_kept = scope in scope_ids
+            if is_kept:
+                kept_atoms.append(row)
+        atom_rows = [
+            [column[row] for row in kept_atoms] for column in self._atom_columns()
+        ]
+        scope_rows = [
+            [column[row] for row in kept_scopes] for column in self._scope_columns()
+        ]
+        self._truncate(atom_start, scope_start)
+        for column, values in zip(self._atom_columns(), atom_rows):
+            column.extend(values)
+        for column, values in zip(self._scope_columns(), scope_rows):
+            column.extend(values)
+        for atom_row in range(atom_start, self.num_atoms):
+            self.atom_scope_id[atom_row] = scope_ids.get(
+                self.atom_scope_id[atom_row], -1
+            )
+        for scope_row in range(scope_start, self.num_scopes):
+            self.scope_parent_scope_id[scope_row] = scope_ids.get(
+                self.scope_parent_scope_id[scope_row], -1
+            )
+
+    def _atom_columns(self) -> list[Any]:
+        return [
+            self.atom_amr_index,
+            self.atom_scope_id,
+            self.atom_predicate_id,
+            self.atom_arity,
+            self.atom_arg0_term_id,
+            self.atom_arg1_term_id,
+            self.atom_is_negated,
+        ]
+
+    def _scope_columns(self) -> list[Any]:
+        return [
+            self.scope_amr_index,
+            self.scope_parent_scope_id,
+            self.scope_kind,
+            self.scope_term_id,
+        ]
+
+    def _add_scope(self, kind: str, term_id: int, body: _Fragment) -> int:
+        row = len(self.scope_kind)
+        self.scope_amr_index.append(self.num_amrs)
+        self.scope_parent_scope_id.append(-1)
+        self.scope_kind.append(kind)
+        self.scope_term_id.append(term_id)
+        atom_scope_id = self.atom_scope_id
+        scope_parent_scope_id = self.scope_parent_scope_id
+        for item in body:
+            if item & 1:
+                scope_parent_scope_id[item >> 1] = row
+            else:
+                atom_scope_id[item >> 1] = row
+        return row
+
+
+def _alignment_str(symbol: Predicate | Term) -> str:
+    alignment = getattr(symbol, "alignment", None)
+    return "" if alignment is None else str(alignment)
+
+
+def _term_value(term: Term) -> str:
+    return term.name if isinstance(term, Variable) else term.value
+
+
+def _term_kind(term: Term) -> str:
+    return "variable" if isinstance(term, Variable) else term.type
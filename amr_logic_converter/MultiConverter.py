@@ -0,0 +1,41 @@
+from __future__ import annotations
+from typing import Mapping
+
+from penman.graph import Graph
+from penman.tree import Tree
+
+from amr_logic_converter.AmrContext import SharedAmrAnalysis
+from amr_logic_converter.AmrLogicConverter import AmrLogicConverter, _to_amr_tree
+from amr_logic_converter.types import Clause
+
+
+class MultiConverter:
+    """
+    Convert each AMR with several converters, like the option sets of an ablation, parsing and
+    analyzing it only once. Only the parts of the analysis that depend on the options, like the scopes
+    of instances under maximally_hoist_coreferences, are computed again, once per distinct option value.
+
+    usage:
+    converter = MultiConverter({
+        "default": AmrLogicConverter(),
+        "quantified": AmrLogicConverter(existentially_quantify_instances=True),
+    })
+    logic = converter.convert(amr_str)
+    print(logic["quantified"])
+    """
+
+    converters: dict[str, AmrLogicConverter]
+
+    def __init__(self, converters: Mapping[str, AmrLogicConverter]) -> None:
+        if not converters:
+            raise ValueError("At least one converter must be given")
+        self.converters = dict(converters)
+
+    def convert(self, amr: str | Tree | Graph) -> dict[str, Clause]:
+        """The logic of the AMR from each converter, keyed by the converter's name"""
+        amr_tree = _to_amr_tree(amr)
+        shared_analysis = SharedAmrAnalysis(amr_tree)
+        return {
+            name: converter._convert_shared_amr_tree(amr_tree, shared_analysis)
+            for name, converter in self.converters.items()
+        }
@@ -1,6 +1,29 @@
 __version__ = "0.11.3"
 
 from .AmrLogicConverter import AmrLogicConverter
+from .AsyncAmrLogicConverter import AsyncAmrLogicConverter
+from .IncrementalConversion import IncrementalConversion
+from .LazyConversion import LazyConversion, Quantification
+from .LogicColumns import LogicColumns
+from .MultiConverter import MultiConverter
+from .binary_clause import (
+    ClauseFileReader,
+    ClauseFileWriter,
+    SymbolTable,
+    decode_clause,
+    encode_clause,
+)
+from .conversion_metrics import ConversionMetrics, MetricsCollector, MetricsSink
+from .convert_many import ConversionResult
+from .parse_clause import parse_clause
+from .result_cache import MemoryResultCache, ResultCache, SqliteResultCache
+from .serialize_clause import (
+    ASCII_SYMBOLS,
+    UNICODE_SYMBOLS,
+    LogicSymbols,
+    serialize_clause,
+    write_clause,
+)
 from .types import (
     All,
     And,
@@ -18,6 +41,30 @@ from .types import (
 
 __all__ = [
     "AmrLogicConverter",
+    "AsyncAmrLogicConverter",
+    "IncrementalConversion",
+    "LazyConversion",
+    "Quantification",
+    "LogicColumns",
+    "MultiConverter",
+    "ClauseFileReader",
+    "ClauseFileWriter",
+    "SymbolTable",
+    "decode_clause",
+    "encode_clause",
+    "ConversionMetrics",
+    "MetricsCollector",
+    "MetricsSink",
+    "ConversionResult",
+    "parse_clause",
+    "MemoryResultCache",
+    "ResultCache",
+    "SqliteResultCache",
+    "ASCII_SYMBOLS",
+    "UNICODE_SYMBOLS",
+    "LogicSymbols",
+    "serialize_clause",
+    "write_clause",
     "All",
     "And",
     "Atom",
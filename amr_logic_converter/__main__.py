@@ -0,0 +1,5 @@
+import sys
+
+from amr_logic_converter.cli import main
+
+sys.exit(main())
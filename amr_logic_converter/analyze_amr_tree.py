@@ -0,0 +1,99 @@
+from __future__ import annotations
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import cast
+
+from penman.tree import Node, Tree
+
+from amr_logic_converter.LcaTracker import LcaTracker
+
+
+@dataclass
+class AmrTreeAnalysis:
+    """Structural information about an AMR tree, collected in a single traversal"""
+
+    instances: frozenset[str]
+    coreferent_instances: frozenset[str]
+    instance_node_map: dict[str, Node]
+    instance_depths_map: dict[str, int]
+    instance_lca_map: dict[str, str]
+
+
+def analyze_amr_tree(amr_tree: Tree) -> AmrTreeAnalysis:
+    """
+    Collect instances, coreferences, first nodes, minimum depths and lowest common ancestors
+    of every instance in the tree in a single walk.
+    """
+    state = _AnalysisState()
+    _analyze_nodes_inplace(amr_tree.node, state)
+    instances = frozenset(state.instances)
+    # string targets are only references if they turn out to be instances
+    names = [
+        name
+        for name in state.occurrences
+        if name in state.node_names or name in instances
+    ]
+    return AmrTreeAnalysis(
+        instances=instances,
+        coreferent_instances=frozenset(
+            name for name in names if state.occurrences[name] > 1
+        ),
+        instance_node_map={name: state.first_nodes[name] for name in names},
+        instance_depths_map=defaultdict(
+            int, ((name, state.depths[name]) for name in names)
+        ),
+        instance_lca_map={name: state.lca_tracker.lca(name) for name in names},
+    )
+
+
+@dataclass
+class _AnalysisState:
+    instances: set[str] = field(default_factory=set)
+    node_names: set[str] = field(default_factory=set)
+    occurrences: dict[str, int] = field(default_factory=dict)
+    first_nodes: dict[str, Node] = field(default_factory=dict)
+    depths: dict[str, int] = field(default_factory=dict)
+    lca_tracker: LcaTracker = field(default_factory=LcaTracker)
+
+
+def _analyze_nodes_inplace(root: Node, state: _AnalysisState) -> None:
+    """Record an occurrence of the root and all its descendants, updating the state inplace"""
+    # a node means entering that node, a string is a reference, and None means leaving the last node entered
+    steps: list[tuple[Node | str | None, int]] = [(root, 0)]
+    while steps:
+        step, depth = steps.pop()
+        if step is None:
+            state.lca_tracker.leave()
+        elif isinstance(step, str):
+            _record_occurrence(step, None, depth, state)
+            state.lca_tracker.visit(step)
+        else:
+            instance, instance_info = step
+            predicate_branch, *edges = instance_info
+            if predicate_branch[0] == "/" and len(predicate_branch) == 2:
+                state.instances.add(instance)
+            state.node_names.add(instance)
+            _record_occurrence(instance, step, depth, state)
+            state.lca_tracker.enter(instance)
+            steps.append((None, depth))
+            for _role, target in reversed(edges):
+                steps.append((target, depth + 1))
+
+
+def _record_occurrence(
+    name: str, node: Node | None, depth: int, state: _AnalysisState
+) -> None:
+    """
+    Record the count, first node and depth of a single occurrence of the name.
+    A `None` node means the name is a reference to an instance defined elsewhere.
+    """
+    if name not in state.occurrences:
+        state.occurrences[name] = 1
+        state.first_nodes[name] = (
+            node if node is not None else cast(Node, (name, ("",)))
+        )
+        state.depths[name] = depth
+    else:
+        state.occurrences[name] += 1
+        if depth < state.depths[name]:
+            state.depths[name] = depth
@@ -0,0 +1,430 @@
+from __future__ import annotations
+from array import array
+import json
+import mmap
+import os
+import struct
+import sys
+from typing import Any, BinaryIO, Iterator, Optional, Union
+
+from penman.surface import Alignment, RoleAlignment
+
+from amr_logic_converter.types import (
+    All,
+    And,
+    Atom,
+    Clause,
+    Constant,
+    Exists,
+    Implies,
+    Not,
+    Or,
+    Predicate,
+    Term,
+    Variable,
+)
+
+
+# opcodes of the prefix-order stream, each followed by its operands:
+# ATOM predicate_id arity term_id..., AND/OR num_args, NOT, EXISTS/ALL variable_id, IMPLIES
+_ATOM = 0
+_AND = 1
+_OR = 2
+_NOT = 3
+_EXISTS = 4
+_ALL = 5
+_IMPLIES = 6
+
+# codes are stored in the narrowest of these unsigned int types that fits them all
+_CODE_TYPECODES = ("B", "H", "I", "Q")
+_TYPECODE_WIDTHS = {typecode: array(typecode).itemsize for typecode in _CODE_TYPECODES}
+_NEEDS_BYTESWAP = sys.byteorder == "big"
+
+Symbol = Union[Predicate, Term]
+
+
+class SymbolTable:
+    """
+    The predicates, variables and constants referenced by encoded clauses by id, with the alignments
+    of the predicates and constants kept in a side table, so each is only stored once.
+    """
+
+    def __init__(self) -> None:
+        self.symbols: list[Symbol] = []
+        self._symbol_ids: dict[Symbol, int] = {}
+        self.alignments: list[Alignment] = []
+        self._alignment_ids: dict[tuple[Any, ...], int] = {}
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def symbol_id(self, symbol: Symbol) -> int:
+        """The id of the symbol, adding it to the table if it's new"""
+        symbol_id = self._symbol_ids.get(symbol)
+        if symbol_id is None:
+            symbol_id = len(self.symbols)
+            self.symbols.append(symbol)
+            self._symbol_ids[symbol] = symbol_id
+            alignment = getattr(symbol, "alignment", None)
+            if alignment is not None:
+                self._alignment_id(alignment)
+        return symbol_id
+
+    def to_bytes(self, start: int = 0, alignment_start: int = 0) -> bytes:
+        """Encode the symbols and alignments from the given ids onwards, to be added to another table"""
+        alignments = [
+            [
+                alignment.prefix,
+                list(alignment.indices),
+                type(alignment) is RoleAlignment,
+            ]
+            for alignment in self.alignments[alignment_start:]
+        ]
+        symbols: list[list[Any]] = []
+        for symbol in self.symbols[start:]:
+            if isinstance(symbol, Variable):
+                symbols.append(["v", symbol.name])
+            elif isinstance(symbol, Predicate):
+                symbols.append(
+                    ["p", symbol.symbol, self._alignment_ref(symbol.alignment)]
+                )
+            else:
+                symbols.append(
+                    [
+                        "c",
+                        symbol.value,
+                        symbol.type,
+                        self._alignment_ref(symbol.alignment),
+                    ]
+                )
+        return json.dumps({"alignments": alignments, "symbols": symbols}).encode()
+
+    def add_from_bytes(self, data: bytes) -> None:
+        """Add the symbols and alignments encoded by `to_bytes` to the table"""
+        encoded = json.loads(data)
+        for prefix, indices, is_role in encoded["alignments"]:
+            alignment_type = RoleAlignment if is_role else Alignment
+            self._alignment_id(alignment_type(tuple(indices), prefix=prefix))
+        for kind, *fields in encoded["symbols"]:
+            if kind == "v":
+                self.symbol_id(Variable(fields[0]))
+            elif kind == "p":
+                self.symbol_id(Predicate(fields[0], self._alignment_at(fields[1])))
+            else:
+                self.symbol_id(
+                    _build_constant(fields[0], fields[1], self._alignment_at(fields[2]))
+                )
+
+    def _alignment_id(self, alignment: Alignment) -> int:
+        key = (type(alignment), alignment.indices, alignment.prefix)
+        alignment_id = self._alignment_ids.get(key)
+        if alignment_id is None:
+            alignment_id = len(self.alignments)
+            self.alignments.append(alignment)
+            self._alignment_ids[key] = alignment_id
+        return alignment_id
+
+    def _alignment_ref(self, alignment: Optional[Alignment]) -> int:
+        return -1 if alignment is None else self._alignment_id(alignment)
+
+    def _alignment_at(self, alignment_id: int) -> Optional[Alignment]:
+        return None if alignment_id == -1 else self.alignments[alignment_id]
+
+
+def encode_clause(clause: Clause, symbols: SymbolTable) -> bytes:
+    """
+    Encode a clause as a prefix-order stream of opcodes and symbol ids, adding any new symbols
+    to the table. Decoding it needs a table with the same symbols.
+    """
+    codes: list[int] = []
+    push_codes = codes.extend
+    symbol_id = symbols.symbol_id
+    stack: list[Any] = [clause]
+    while stack:
+        item = stack.pop()
+        item_type = type(item)
+        if item_type is Atom:
+            terms = item.terms
+            push_codes((_ATOM, symbol_id(item.predicate), len(terms)))
+            push_codes([symbol_id(term) for term in terms])
+        elif item_type is And or item_type is Or:
+            args = item.args
+            push_codes((_AND if item_type is And else _OR, len(args)))
+            stack.extend(reversed(args))
+        elif item_type is Not:
+            codes.append(_NOT)
+            stack.append(item.body)
+        elif item_type is Exists or item_type is All:
+            push_codes(
+                (_EXISTS if item_type is Exists else _ALL, symbol_id(item.param))
+            )
+            stack.append(item.body)
+        elif item_type is Implies:
+            codes.append(_IMPLIES)
+            stack.append(item.consequent)
+            stack.append(item.antecedent)
+        else:
+            raise TypeError(f"Can't encode {item_type.__name__} as a clause")
+    max_code = max(codes)
+    typecode_index = 0
+    while max_code >= 1 << (8 * _TYPECODE_WIDTHS[_CODE_TYPECODES[typecode_index]]):
+        typecode_index += 1
+    encoded = array(_CODE_TYPECODES[typecode_index], codes)
+    if _NEEDS_BYTESWAP:
+        encoded.byteswap()
+    return bytes((typecode_index,)) + encoded.tobytes()
+
+
+def decode_clause(data: bytes | memoryview, symbols: SymbolTable) -> Clause:
+    """Decode a clause encoded by `encode_clause` with the same symbols"""
+    codes = array(_CODE_TYPECODES[data[0]])
+    codes.frombytes(data[1:])
+    if _NEEDS_BYTESWAP:
+        codes.byteswap()
+    table: list[Any] = symbols.symbols
+    # the compound clauses whose args are still being decoded: [opcode, variable, args, num_args]
+    stack: list[list[Any]] = []
+    i = 0
+    while True:
+        opcode = codes[i]
+        value: Any
+        if opcode == _ATOM:
+            arity = codes[i + 2]
+            value = Atom(
+                table[codes[i + 1]],
+                tuple([table[term_id] for term_id in codes[i + 3 : i + 3 + arity]]),
+            )
+            i += 3 + arity
+        elif opcode == _AND or opcode == _OR:
+            num_args = codes[i + 1]
+            i += 2
+            if num_args > 0:
+                stack.append([opcode, None, [], num_args])
+                continue
+            value = And() if opcode == _AND else Or()
+        elif opcode == _NOT or opcode == _IMPLIES:
+            stack.append([opcode, None, [], 1 if opcode == _NOT else 2])
+            i += 1
+            continue
+        elif opcode == _EXISTS or opcode == _ALL:
+            stack.append([opcode, table[codes[i + 1]], [], 1])
+            i += 2
+            continue
+        else:
+            raise ValueError(f"Unknown opcode {opcode} at position {i}")
+        # pass the finished clause up to the compound clauses it completes
+        while stack:
+            frame = stack[-1]
+            args = frame[2]
+            args.append(value)
+            if len(args) < frame[3]:
+                break
+            stack.pop()
+            value = _build_compound(frame[0], frame[1], args)
+        else:
+            return value
+
+
+def _build_compound(opcode: int, variable: Any, args: list[Any]) -> Clause:
+    if opcode == _AND:
+        return And(*args)
+    if opcode == _OR:
+        return Or(*args)
+    if opcode == _NOT:
+        return Not(args[0])
+    if opcode == _EXISTS:
+        return Exists(variable, args[0])
+    if opcode == _ALL:
+        return All(variable, args[0])
+    return Implies(args[0], args[1])
+
+
+def _build_constant(value: str, type: Any, alignment: Optional[Alignment]) -> Constant:
+    # set the fields directly, as the value was already unquoted when the constant was built
+    constant = object.__new__(Constant)
+    object.__setattr__(constant, "value", value)
+    object.__setattr__(constant, "type", type)
+    object.__setattr__(constant, "alignment", alignment)
+    return constant
+
+
+# a clause file is the magic bytes followed by chunks, each a kind byte, a length and the data:
+# symbols added to the table, encoded clauses, and an index of both written when the file is closed
+_MAGIC = b"AMRLOGIC1"
+_CHUNK_HEADER = struct.Struct("<cQ")
+_SYMBOLS_CHUNK = b"S"
+_RECORD_CHUNK = b"R"
+_INDEX_CHUNK = b"I"
+# the end of a closed file: the position of the index chunk, then the magic bytes again
+_TRAILER = struct.Struct(f"<Q{len(_MAGIC)}s")
+
+
+class ClauseFileWriter:
+    """
+    Append clauses to a binary clause file one at a time, sharing a symbol table between them.
+    If the file already exists, clauses are appended after the ones in it. The file must be closed
+    to write its index, so it can be read without scanning it first.
+
+    basic usage:
+    with ClauseFileWriter("logic.bin") as writer:
+        for amr in amrs:
+            writer.append(converter.convert(amr))
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self.symbols = SymbolTable()
+        self._record_offsets: list[int] = []
+        self._symbols_offsets: list[int] = []
+        if os.path.exists(path) and os.path.getsize(path) > 0:
+            with ClauseFileReader(path) as reader:
+                self.symbols = reader.symbols
+                self._record_offsets = list(reader._record_offsets)
+                self._symbols_offsets = list(reader._symbols_offsets)
+                end = reader._data_end
+            self._file: BinaryIO = open(path, "r+b")
+            # the index is written again when this writer is closed
+            self._file.seek(end)
+            self._file.truncate()
+        else:
+            self._file = open(path, "w+b")
+            self._file.write(_MAGIC)
+        self._num_alignments = len(self.symbols.alignments)
+
+    def __len__(self) -> int:
+        return len(self._record_offsets)
+
+    def append(self, clause: Clause) -> int:
+        """Append a clause to the file, returning its index"""
+        num_symbols = len(self.symbols)
+        data = encode_clause(clause, self.symbols)
+        if len(self.symbols) > num_symbols:
+            self._symbols_offsets.append(self._file.tell())
+            self._write_chunk(
+                _SYMBOLS_CHUNK,
+                self.symbols.to_bytes(num_symbols, self._num_alignments),
+            )
+            self._num_alignments = len(self.symbols.alignments)
+        self._record_offsets.append(self._file.tell())
+        self._write_chunk(_RECORD_CHUNK, data)
+        return len(self._record_offsets) - 1
+
+    def close(self) -> None:
+        if self._file.closed:
+            return
+        index_offset = self._file.tell()
+        self._write_chunk(
+            _INDEX_CHUNK,
+            _encode_offsets(self._record_offsets)
+            + _encode_offsets(self._symbols_offsets),
+        )
+        self._file.write(_TRAILER.pack(index_offset, _MAGIC))
+        self._file.close()
+
+    def __enter__(self) -> ClauseFileWriter:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def _write_chunk(self, kind: bytes, data: bytes) -> None:
+        self._file.write(_CHUNK_HEADER.pack(kind, len(data)))
+        self._file.write(data)
+
+
+class ClauseFileReader:
+    """
+    Read the clauses in a binary clause file by index, memory-mapping the file so only the
+    clauses read are decoded. Files which weren't closed after writing are scanned to find
+    the clauses in them.
+
+    basic usage:
+    with ClauseFileReader("logic.bin") as reader:
+        print(len(reader), reader[1000])
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self.symbols = SymbolTable()
+        with open(path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mmap[: len(_MAGIC)] != _MAGIC:
+            self._mmap.close()
+            raise ValueError(f"{path} is not a clause file")
+        if not self._read_index():
+            self._scan_chunks()
+        for offset in self._symbols_offsets:
+            self.symbols.add_from_bytes(self._chunk_data(offset))
+
+    def __len__(self) -> int:
+        return len(self._record_offsets)
+
+    def __getitem__(self, index: int) -> Clause:
+        return decode_clause(
+            self._chunk_data(self._record_offsets[index]), self.symbols
+        )
+
+    def __iter__(self) -> Iterator[Clause]:
+        for offset in self._record_offsets:
+            yield decode_clause(self._chunk_data(offset), self.symbols)
+
+    def close(self) -> None:
+        self._mmap.close()
+
+    def __enter__(self) -> ClauseFileReader:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def _chunk_data(self, offset: int) -> bytes:
+        _kind, length = _CHUNK_HEADER.unpack_from(self._mmap, offset)
+        start = offset + _CHUNK_HEADER.size
+        return self._mmap[start : start + length]
+
+    def _read_index(self) -> bool:
+        size = len(self._mmap)
+        if size < len(_MAGIC) + _TRAILER.size:
+            return False
+        index_offset, magic = _TRAILER.unpack_from(self._mmap, size - _TRAILER.size)
+        if magic != _MAGIC:
+            return False
+        index = self._chunk_data(index_offset)
+        self._record_offsets, end = _decode_offsets(index, 0)
+        self._symbols_offsets, _ = _decode_offsets(index, end)
+        self._data_end = index_offset
+        return True
+
+    def _scan_chunks(self) -> None:
+        self._record_offsets = array("q")
+        self._symbols_offsets = array("q")
+        offset = len(_MAGIC)
+        size = len(self._mmap)
+        while offset + _CHUNK_HEADER.size <= size:
+            kind, length = _CHUNK_HEADER.unpack_from(self._mmap, offset)
+            end = offset + _CHUNK_HEADER.size + length
+            if end > size or kind not in (_SYMBOLS_CHUNK, _RECORD_CHUNK):
+                # a chunk cut off while it was being written
+                break
+            if kind == _RECORD_CHUNK:
+                self._record_offsets.append(offset)
+            else:
+                self._symbols_offsets.append(offset)
+            offset = end
+        self._data_end = offset
+
+
+def _encode_offsets(offsets: list[int]) -> bytes:
+    encoded = array("q", offsets)
+    if _NEEDS_BYTESWAP:
+        encoded.byteswap()
+    return struct.pack("<Q", len(offsets)) + encoded.tobytes()
+
+
+def _decode_offsets(data: bytes, start: int) -> tuple[array[int], int]:
+    (num_offsets,) = struct.unpack_from("<Q", data, start)
+    start += 8
+    end = start + 8 * num_offsets
+    offsets = array("q")
+    offsets.frombytes(data[start:end])
+    if _NEEDS_BYTESWAP:
+        offsets.byteswap()
+    return offsets, end
@@ -0,0 +1,230 @@
+from __future__ import annotations
+import argparse
+import json
+import re
+import sys
+from time import perf_counter
+from typing import Iterable, Iterator, Optional, Sequence, TextIO
+
+from amr_logic_converter.AmrLogicConverter import AmrLogicConverter
+from amr_logic_converter.convert_many import ConversionResult
+from amr_logic_converter.serialize_clause import (
+    ASCII_SYMBOLS,
+    UNICODE_SYMBOLS,
+    LogicSymbols,
+    serialize_clause,
+)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Stream AMRs from a PENMAN file (or stdin) graph by graph, writing the logic for each
+    as a line of text or JSON as soon as it's converted.
+    """
+    args = _build_parser().parse_args(argv)
+    converter = AmrLogicConverter(
+        invert_relations=not args.no_invert_relations,
+        existentially_quantify_instances=args.existentially_quantify_instances,
+        use_variables_for_instances=args.use_variables_for_instances,
+        maximally_hoist_coreferences=args.maximally_hoist_coreferences,
+        capitalize_variables=not args.no_capitalize_variables,
+        use_implies_for_conditions=args.use_implies_for_conditions,
+    )
+    input_file = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8")
+    output_file = (
+        sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    )
+    try:
+        graphs = _GraphStream(input_file)
+        results = converter.convert_many(
+            graphs.split(),
+            workers=args.workers,
+            chunksize=args.chunksize,
+        )
+        num_errors = _write_results(
+            results,
+            graphs,
+            output_file,
+            args.format,
+            ASCII_SYMBOLS if args.ascii else UNICODE_SYMBOLS,
+            args.progress_every,
+        )
+    finally:
+        if input_file is not sys.stdin:
+            input_file.close()
+        if output_file is not sys.stdout:
+            output_file.close()
+    return 1 if num_errors > 0 else 0
+
+
+class _GraphStream:
+    """
+    Lazily split the input into the PENMAN string of each graph, remembering the ::id metadata of graphs
+    still being converted. The graphs are parsed as they're converted, so a graph that fails to parse is
+    reported like any other conversion error, and doesn't stop the graphs after it from being read.
+    """
+
+    def __init__(self, input_file: TextIO) -> None:
+        self._input_file = input_file
+        self._ids: dict[int, str | None] = {}
+
+    def split(self) -> Iterator[str]:
+        for index, graph_str in enumerate(_split_graphs(self._input_file)):
+            self._ids[index] = _read_id(graph_str)
+            yield graph_str
+
+    def pop_id(self, index: int) -> str | None:
+        return self._ids.pop(index)
+
+
+# the tokens that matter for finding where a graph ends: strings and comments can contain parentheses
+_GRAPH_TOKEN_RE = re.compile(r'"(?:[^"\\]|\\.)*"|#.*|[()]')
+
+
+def _split_graphs(lines: Iterable[str]) -> Iterator[str]:
+    """
+    Split PENMAN text into the string of each graph, with the comments before it, by balancing
+    parentheses. A line starting with a parenthesis or comment while a graph is still open starts
+    a new graph, so a graph missing closing parentheses doesn't swallow the graphs after it.
+    Anything else between graphs is skipped, like penman skips anything after the graph it parses.
+    """
+    parts: list[str] = []
+    depth = 0
+    for line in lines:
+        if depth > 0 and line[:1] in ("(", "#"):
+            yield "".join(parts)
+            parts = []
+            depth = 0
+        start = 0
+        for match in _GRAPH_TOKEN_RE.finditer(line):
+            token = match.group()
+            if depth == 0:
+                # comments between graphs hold the metadata of the next graph
+                if token.startswith("#"):
+                    parts.append(token + "\n")
+                elif token == "(":
+                    start = match.start()
+                    depth = 1
+            elif token == "(":
+                depth += 1
+            elif token == ")":
+                depth -= 1
+                if depth == 0:
+                    parts.append(line[start : match.end()])
+                    yield "".join(parts)
+                    parts = []
+        if depth > 0:
+            parts.append(line[start:])
+    if depth > 0:
+        yield "".join(parts)
+
+
+def _read_id(graph_str: str) -> str | None:
+    """Read the ::id metadata from the comments before a graph, like penman does when parsing it"""
+    amr_id = None
+    for line in graph_str.splitlines():
+        comment = line.strip()
+        if not comment:
+            continue
+        if not comment.startswith("#"):
+            break
+        while comment:
+            comment, found, meta = comment.rpartition("::")
+            if found:
+                key, _, value = meta.partition(" ")
+                if key == "id":
+                    amr_id = value.rstrip()
+    return amr_id
+
+
+def _write_results(
+    results: Iterator[ConversionResult],
+    graphs: _GraphStream,
+    output_file: TextIO,
+    output_format: str,
+    symbols: LogicSymbols,
+    progress_every: int,
+) -> int:
+    """Write each result as soon as it's available, returning the number of errors"""
+    start = perf_counter()
+    num_converted = 0
+    num_errors = 0
+    for result in results:
+        amr_id = graphs.pop_id(result.index)
+        if result.error is not None:
+            num_errors += 1
+            print(
+                f"error converting AMR {amr_id or result.index}: {result.error}",
+                file=sys.stderr,
+            )
+        logic = (
+            None if result.logic is None else serialize_clause(result.logic, symbols)
+        )
+        if output_format == "jsonl":
+            record = {"index": result.index, "id": amr_id, "logic": logic}
+            if result.error is not None:
+                record["error"] = str(result.error)
+            output_file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        else:
+            # keep one line per input graph, even if it failed to convert
+            output_file.write((logic or "") + "\n")
+        num_converted += 1
+        if progress_every > 0 and num_converted % progress_every == 0:
+            _report_progress(num_converted, num_errors, perf_counter() - start)
+    if progress_every > 0:
+        _report_progress(num_converted, num_errors, perf_counter() - start)
+    return num_errors
+
+
+def _report_progress(num_converted: int, num_errors: int, elapsed: float) -> None:
+    throughput = num_converted / elapsed if elapsed > 0 else 0.0
+    print(
+        f"converted {num_converted} AMRs ({num_errors} errors) in {elapsed:.1f}s, {throughput:.1f} AMRs/s",
+        file=sys.stderr,
+    )
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="amr-logic-converter",
+        description="Convert a file of PENMAN-serialized AMRs into first-order logic, one line per AMR.",
+    )
+    parser.add_argument(
+        "input", nargs="?", default="-", help="PENMAN file to read, or - for stdin"
+    )
+    parser.add_argument(
+        "-o", "--output", default="-", help="file to write to, or - for stdout"
+    )
+    parser.add_argument(
+        "--format",
+        choices=["logic", "jsonl"],
+        default="logic",
+        help="write plain logic strings, or JSON objects with the index, ::id and logic of each AMR",
+    )
+    parser.add_argument(
+        "--ascii",
+        action="store_true",
+        help="write logic with ASCII operators (&, |, ~, ->, exists, all) instead of unicode",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=1, help="number of worker processes"
+    )
+    parser.add_argument(
+        "--chunksize",
+        type=int,
+        default=64,
+        help="number of AMRs sent to a worker at a time",
+    )
+    parser.add_argument(
+        "--progress-every",
+        type=int,
+        default=1000,
+        help="report progress and throughput to stderr every N AMRs, or 0 to disable",
+    )
+    parser.add_argument("--existentially-quantify-instances", action="store_true")
+    parser.add_argument("--use-variables-for-instances", action="store_true")
+    parser.add_argument("--maximally-hoist-coreferences", action="store_true")
+    parser.add_argument("--use-implies-for-conditions", action="store_true")
+    parser.add_argument("--no-capitalize-variables", action="store_true")
+    parser.add_argument("--no-invert-relations", action="store_true")
+    return parser
@@ -0,0 +1,105 @@
+from __future__ import annotations
+from typing import Any, Optional
+
+import penman
+from penman.graph import Graph
+from penman.layout import Pop, Push
+from penman.tree import Branch, Node, Tree
+
+
+_CONCEPT_ROLE = ":instance"
+
+
+def configure_graph(graph: Graph) -> Tree:
+    """
+    Lay out a graph as a tree exactly like `penman.configure(graph)`, in a single pass over its triples
+    without recursion. This handles graphs whose layout markers describe a whole tree, like any graph
+    decoded from PENMAN, and falls back to `penman.configure` for any graph it would need to improvise on.
+    """
+    node = _configure_from_markers(graph)
+    if node is None:
+        return penman.configure(graph)
+    return Tree(node, metadata=graph.metadata)
+
+
+def _configure_from_markers(graph: Graph) -> Optional[Node]:
+    """
+    Follow the Push and Pop markers of the graph to build the tree, mirroring the first pass of
+    `penman.layout.configure` with the default model, or return None if that pass leaves anything
+    that penman would need to improvise on, or would log a warning about
+    """
+    triples = graph.triples
+    top = graph.top
+    if not triples or top is None:
+        return None
+    epidata = graph.epidata
+    root: Node = (top, [])
+    # the variable and branches of each node being configured, from the top down
+    stack: list[tuple[Any, list[Branch]]] = [(top, root[1])]
+    var, edges = stack[-1]
+    pushed: set[Any] = set()
+    for triple in triples:
+        source, role, target = triple
+        push = False
+        num_pops = 0
+        # role and target epidata like alignments, appended to them as strings
+        role_suffix = ""
+        target_suffix: Optional[str] = None
+        for epi in epidata.get(triple, ()):
+            if isinstance(epi, Push):
+                push_var = epi.variable
+                if (
+                    push_var in pushed
+                    or push_var not in (source, target)
+                    or role == _CONCEPT_ROLE
+                ):
+                    return None
+                if push_var == source:
+                    source, role, target = target, _invert_role(role), source
+                pushed.add(push_var)
+                push = True
+            elif isinstance(epi, Pop):
+                num_pops += 1
+            elif epi.mode == 1:
+                role_suffix += str(epi)
+            elif epi.mode == 2:
+                target_suffix = (target_suffix or "") + str(epi)
+            else:
+                return None
+        if not stack:
+            # penman would have to find a place for any triples after the top node is popped
+            return None
+        if source != var:
+            if target == var and role != _CONCEPT_ROLE:
+                # an unexpected inversion, which penman accepts without pushing the target
+                source, role, target = target, _invert_role(role), source
+                push = False
+            else:
+                # penman would pop nodes until one fits, and improvise if none does
+                return None
+        if target_suffix is not None:
+            if push:
+                return None
+            target = f"{target!s}{target_suffix}"
+        if role == _CONCEPT_ROLE:
+            # penman prefers (a) over (a /) when the concept is missing
+            if triple[2]:
+                edges.insert(0, ("/" + role_suffix, target))
+        elif push:
+            child: Node = (target, [])
+            edges.append((role + role_suffix, child))
+            stack.append((target, child[1]))
+        else:
+            edges.append((role + role_suffix, target))
+        for _ in range(num_pops):
+            if not stack:
+                break
+            stack.pop()
+        if stack:
+            var, edges = stack[-1]
+    return root
+
+
+def _invert_role(role: str) -> str:
+    # the default penman model doesn't know any roles, so every role is inverted by its -of suffix
+    return role[:-3] if role.endswith("-of") else role + "-of"
@@ -0,0 +1,140 @@
+from __future__ import annotations
+from dataclasses import dataclass, field
+from threading import Lock
+from time import perf_counter
+from typing import Any, Callable, Optional, Protocol, TypeVar
+
+from amr_logic_converter.analyze_amr_tree import AmrTreeAnalysis
+
+
+_Result = TypeVar("_Result")
+
+
+@dataclass
+class ConversionMetrics:
+    """
+    Timings and counts recorded while converting a single AMR, passed to the converter's metrics_sink.
+
+    Stage times are in seconds, keyed by stage: "parse" or "configure", "cache_get", "analyze", "scope",
+    "edges", "projection_order", "convert" and "cache_set". Stages that don't run aren't included.
+    Time spent in override callbacks is also counted in the stage that called them.
+    """
+
+    stage_seconds: dict[str, float] = field(default_factory=dict)
+    num_nodes: int = 0
+    num_edges: int = 0
+    num_instances: int = 0
+    num_coreferent_instances: int = 0
+    callback_calls: dict[str, int] = field(default_factory=dict)
+    callback_seconds: dict[str, float] = field(default_factory=dict)
+    # None if the converter has no result cache
+    cache_hit: Optional[bool] = None
+
+    @property
+    def total_seconds(self) -> float:
+        return sum(self.stage_seconds.values())
+
+    def add_stage_time(self, stage: str, start: float) -> float:
+        """Add the time since start to the stage, and return the current time to start the next stage"""
+        now = perf_counter()
+        self.stage_seconds[stage] = self.stage_seconds.get(stage, 0.0) + now - start
+        return now
+
+    def count_analysis(self, analysis: AmrTreeAnalysis) -> None:
+        nodes = analysis.instance_node_map.values()
+        self.num_nodes = len(nodes)
+        # every branch of a node except its concept, including constant attributes
+        self.num_edges = sum(len(node[1]) - 1 for node in nodes)
+        self.num_instances = len(analysis.instances)
+        self.num_coreferent_instances = len(analysis.coreferent_instances)
+
+    def call_callback(
+        self, name: str, callback: Callable[..., _Result], *args: Any
+    ) -> _Result:
+        start = perf_counter()
+        try:
+            return callback(*args)
+        finally:
+            self.callback_calls[name] = self.callback_calls.get(name, 0) + 1
+            self.callback_seconds[name] = (
+                self.callback_seconds.get(name, 0.0) + perf_counter() - start
+            )
+
+    def wrap_callback(
+        self, name: str, callback: Callable[..., _Result]
+    ) -> Callable[..., _Result]:
+        return lambda *args: self.call_callback(name, callback, *args)
+
+
+class MetricsSink(Protocol):
+    """Receives the metrics of each AMR converted by a converter with a metrics_sink"""
+
+    def record(self, metrics: ConversionMetrics) -> None:
+        ...
+
+
+class MetricsCollector:
+    """
+    A metrics sink adding up the metrics of every conversion, which is safe to share between threads.
+    Worker processes used by `convert_many` each record into their own copy.
+    """
+
+    num_conversions: int
+    num_cache_hits: int
+    totals: ConversionMetrics
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self.reset()
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {key: value for key, value in self.__dict__.items() if key != "_lock"}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = Lock()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.num_conversions = 0
+            self.num_cache_hits = 0
+            self.totals = ConversionMetrics()
+
+    def record(self, metrics: ConversionMetrics) -> None:
+        with self._lock:
+            totals = self.totals
+            self.num_conversions += 1
+            self.num_cache_hits += metrics.cache_hit is True
+            _add_counts(totals.stage_seconds, metrics.stage_seconds)
+            totals.num_nodes += metrics.num_nodes
+            totals.num_edges += metrics.num_edges
+            totals.num_instances += metrics.num_instances
+            totals.num_coreferent_instances += metrics.num_coreferent_instances
+            _add_counts(totals.callback_calls, metrics.callback_calls)
+            _add_counts(totals.callback_seconds, metrics.callback_seconds)
+
+    def summary(self) -> dict[str, Any]:
+        """The totals and the mean time per conversion of each stage, as a JSON-serializable dict"""
+        with self._lock:
+            totals = self.totals
+            num_conversions = max(self.num_conversions, 1)
+            return {
+                "num_conversions": self.num_conversions,
+                "num_cache_hits": self.num_cache_hits,
+                "stage_seconds": dict(totals.stage_seconds),
+                "mean_stage_seconds": {
+                    stage: seconds / num_conversions
+                    for stage, seconds in totals.stage_seconds.items()
+                },
+                "num_nodes": totals.num_nodes,
+                "num_edges": totals.num_edges,
+                "num_instances": totals.num_instances,
+                "num_coreferent_instances": totals.num_coreferent_instances,
+                "callback_calls": dict(totals.callback_calls),
+                "callback_seconds": dict(totals.callback_seconds),
+            }
+
+
+def _add_counts(totals: dict[str, Any], counts: dict[str, Any]) -> None:
+    for key, count in counts.items():
+        totals[key] = totals.get(key, 0) + count
@@ -0,0 +1,194 @@
+from __future__ import annotations
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from itertools import islice
+import pickle
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional, Union
+
+from penman.graph import Graph
+from penman.tree import Tree
+
+from amr_logic_converter.types import Clause
+
+if TYPE_CHECKING:
+    from amr_logic_converter.AmrLogicConverter import AmrLogicConverter
+
+
+AmrInput = Union[str, Tree, Graph]
+
+
+@dataclass
+class ConversionResult:
+    """The outcome of converting a single AMR in a batch: either the logic, or the error raised converting it"""
+
+    index: int
+    logic: Clause | None = None
+    error: Exception | None = None
+
+
+def convert_many(
+    converter: AmrLogicConverter,
+    amrs: Iterable[AmrInput],
+    workers: int = 1,
+    chunksize: int = 64,
+    ordered: bool = True,
+) -> Iterator[ConversionResult]:
+    """
+    Convert many AMRs, parsing and converting in `workers` processes if more than 1.
+    AMRs are sent to workers in chunks of `chunksize`, and only a few chunks per worker are
+    in flight at a time, so `amrs` can be a lazy stream of any length.
+    Results are yielded in input order, or as soon as they finish if `ordered` is False.
+    """
+    if workers < 1:
+        raise ValueError(f"workers must be at least 1, got {workers}")
+    if chunksize < 1:
+        raise ValueError(f"chunksize must be at least 1, got {chunksize}")
+    chunks = _chunk_amrs(amrs, chunksize)
+    if workers == 1:
+        return (
+            result
+            for start_index, chunk in chunks
+            for result in _convert_chunk(converter, start_index, chunk)
+        )
+    return _convert_chunks_in_pool(converter, chunks, workers, ordered)
+
+
+def _convert_chunks_in_pool(
+    converter: AmrLogicConverter,
+    chunks: Iterator[tuple[int, list[AmrInput]]],
+    workers: int,
+    ordered: bool,
+) -> Iterator[ConversionResult]:
+    max_pending = workers * 2
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(converter,)
+    ) as executor:
+        pending: deque[_PendingChunk] = deque()
+        try:
+            for start_index, chunk in chunks:
+                pending.append(
+                    _PendingChunk(
+                        _submit_chunk(executor, start_index, chunk),
+                        start_index,
+                        len(chunk),
+                    )
+                )
+                if len(pending) >= max_pending:
+                    yield from _collect_finished(pending, ordered)
+            while pending:
+                yield from _collect_finished(pending, ordered)
+        finally:
+            # don't keep converting if the caller stops consuming results early
+            for pending_chunk in pending:
+                pending_chunk.future.cancel()
+
+
+def _chunk_amrs(
+    amrs: Iterable[AmrInput], chunksize: int
+) -> Iterator[tuple[int, list[AmrInput]]]:
+    amrs_iter = iter(amrs)
+    start_index = 0
+    while chunk := list(islice(amrs_iter, chunksize)):
+        yield start_index, chunk
+        start_index += len(chunk)
+
+
+@dataclass
+class _PendingChunk:
+    future: Future[list[ConversionResult]]
+    start_index: int
+    size: int
+
+
+def _submit_chunk(
+    executor: ProcessPoolExecutor, start_index: int, chunk: list[AmrInput]
+) -> Future[list[ConversionResult]]:
+    try:
+        return executor.submit(_convert_chunk_in_worker, start_index, chunk)
+    except Exception as error:
+        # a broken pool refuses new chunks, which then fail like the chunks already sent to it
+        future: Future[list[ConversionResult]] = Future()
+        future.set_exception(error)
+        return future
+
+
+def _collect_finished(
+    pending: deque[_PendingChunk], ordered: bool
+) -> Iterator[ConversionResult]:
+    """Wait for at least one pending chunk to finish, and yield its results"""
+    if ordered:
+        yield from _chunk_results(pending.popleft())
+        return
+    done, _not_done = wait(
+        [pending_chunk.future for pending_chunk in pending],
+        return_when=FIRST_COMPLETED,
+    )
+    for pending_chunk in list(pending):
+        if pending_chunk.future in done:
+            pending.remove(pending_chunk)
+            yield from _chunk_results(pending_chunk)
+
+
+def _chunk_results(pending_chunk: _PendingChunk) -> list[ConversionResult]:
+    """
+    The results of a finished chunk, or an error result for each of its AMRs if the whole chunk failed,
+    like when its AMRs can't be sent to the worker or the worker process died
+    """
+    try:
+        return pending_chunk.future.result()
+    except Exception as error:
+        start_index = pending_chunk.start_index
+        return [
+            ConversionResult(index, error=error)
+            for index in range(start_index, start_index + pending_chunk.size)
+        ]
+
+
+def _convert_chunk(
+    converter: AmrLogicConverter, start_index: int, chunk: list[AmrInput]
+) -> list[ConversionResult]:
+    results = []
+    for index, amr in enumerate(chunk, start_index):
+        try:
+            results.append(ConversionResult(index, logic=converter.convert(amr)))
+        except Exception as error:
+            results.append(ConversionResult(index, error=error))
+    return results
+
+
+_worker_converter: Optional[AmrLogicConverter] = None
+
+
+def _init_worker(converter: AmrLogicConverter) -> None:
+    # the converter is sent once per worker process rather than with every chunk
+    global _worker_converter
+    _worker_converter = converter
+
+
+def _convert_chunk_in_worker(
+    start_index: int, chunk: list[AmrInput]
+) -> list[ConversionResult]:
+    assert _worker_converter is not None
+    results = _convert_chunk(_worker_converter, start_index, chunk)
+    for position, result in enumerate(results):
+        if result.error is not None:
+            result.error = _make_picklable(result.error)
+            continue
+        try:
+            pickle.dumps(result.logic)
+        except Exception as error:
+            # so one result that can't be sent back can't fail its whole chunk
+            results[position] = ConversionResult(
+                result.index, error=_make_picklable(error)
+            )
+    return results
+
+
+def _make_picklable(error: Exception) -> Exception:
+    """Make sure the error can be sent back to the main process, so one bad AMR can't fail its whole chunk"""
+    try:
+        pickle.dumps(error)
+        return error
+    except Exception:
+        return RuntimeError(f"{type(error).__name__}: {error}")
@@ -0,0 +1,235 @@
+from __future__ import annotations
+from functools import lru_cache
+import re
+from typing import Collection, Optional, Pattern
+
+from amr_logic_converter.serialize_clause import UNICODE_SYMBOLS, LogicSymbols
+from amr_logic_converter.types import (
+    All,
+    And,
+    Atom,
+    Clause,
+    Constant,
+    Exists,
+    Implies,
+    Not,
+    Or,
+    Predicate,
+    Term,
+    Variable,
+)
+
+
+# a quoted string, which can contain quotes that aren't followed by the end of the term, or a bare name
+_TERM = r'"(?:[^"]|"(?!\s*[,)]))*"|[^\s,()"]+'
+_TERM_PATTERN = re.compile(_TERM)
+
+
+def parse_clause(
+    logic_str: str,
+    symbols: LogicSymbols = UNICODE_SYMBOLS,
+    variables: Optional[Collection[str]] = None,
+    instances: Optional[Collection[str]] = None,
+) -> Clause:
+    """
+    Parse a formula serialized with `str(clause)` or `serialize_clause` back into a clause.
+
+    Names bound by an enclosing quantifier or in `variables` are parsed as Variables, names in
+    `instances` as instance Constants, quoted terms as string Constants, and other names as symbol
+    Constants. Serialized formulas don't include alignments, so the parsed clause has none, and
+    a conjunction of a single clause is only serialized as that clause, outside of parentheses.
+    """
+    parser = _ClauseParser(
+        symbols, frozenset(variables or ()), frozenset(instances or ())
+    )
+    return parser.parse(logic_str)
+
+
+@lru_cache(maxsize=None)
+def _compile_scanner(symbols: LogicSymbols) -> Pattern[str]:
+    quantifiers = "|".join(
+        re.escape(symbol) for symbol in (symbols.exists, symbols.all)
+    )
+    return re.compile(
+        "|".join(
+            [
+                # binary operators take the spaces around them, so they don't need a token of their own
+                rf"\s*(?P<and_>{re.escape(symbols.and_.strip())})\s*",
+                rf"\s*(?P<or_>{re.escape(symbols.or_.strip())})\s*",
+                rf"\s*(?P<implies>{re.escape(symbols.implies.strip())})\s*",
+                r"(?P<space>\s+)",
+                rf"(?P<quantifier>(?P<quantifier_symbol>{quantifiers})(?P<variable>[^\s()]+)\()",
+                rf"(?P<not_>{re.escape(symbols.not_.strip())})",
+                rf"(?P<atom>(?P<predicate>[^\s(),]+)\((?P<terms>\s*(?:(?:{_TERM})(?:\s*,\s*(?:{_TERM}))*)?)\s*\))",
+                r"(?P<open>\()",
+                r"(?P<close>\))",
+            ]
+        )
+    )
+
+
+class _Group:
+    """A parenthesized group being parsed, or the whole formula"""
+
+    __slots__ = ("kind", "param", "operands", "operator", "num_nots")
+
+    def __init__(self, kind: str, param: Optional[Variable] = None) -> None:
+        # "formula", "group", or the quantifier symbol for the body of a quantifier
+        self.kind = kind
+        self.param = param
+        self.operands: list[Clause] = []
+        # the operator between the operands, which must all be the same
+        self.operator: Optional[str] = None
+        # the number of negations to apply to the next operand
+        self.num_nots = 0
+
+
+class _ClauseParser:
+    """
+    Parse a formula token by token with a stack of the groups being parsed,
+    so deeply nested formulas don't hit the recursion limit
+    """
+
+    def __init__(
+        self,
+        symbols: LogicSymbols,
+        variables: frozenset[str],
+        instances: frozenset[str],
+    ) -> None:
+        self.symbols = symbols
+        self.variables = variables
+        self.instances = instances
+        self._predicates: dict[str, Predicate] = {}
+        self._constants: dict[str, Term] = {}
+        self._variables: dict[str, Variable] = {}
+        # the number of enclosing quantifiers binding each name
+        self._bound_names: dict[str, int] = {}
+
+    def parse(self, logic_str: str) -> Clause:
+        match_token = _compile_scanner(self.symbols).match
+        stack: list[_Group] = [_Group("formula")]
+        group = stack[-1]
+        expects_operand = True
+        pos = 0
+        end = len(logic_str)
+        while pos < end:
+            match = match_token(logic_str, pos)
+            if match is None:
+                raise ValueError(
+                    f"Unexpected characters at position {pos}: {logic_str[pos:pos + 20]!r}"
+                )
+            token_type = match.lastgroup
+            if token_type == "space":
+                pos = match.end()
+                continue
+            if token_type in ("and_", "or_", "implies"):
+                if expects_operand:
+                    raise ValueError(f"Missing operand at position {pos}")
+                if group.operator is None:
+                    group.operator = token_type
+                elif group.operator != token_type:
+                    raise ValueError(
+                        f"Mixed operators without parentheses at position {pos}"
+                    )
+                expects_operand = True
+            elif not expects_operand and token_type != "close":
+                raise ValueError(f"Missing operator at position {pos}")
+            elif token_type == "atom":
+                self._add_operand(group, self._parse_atom(match))
+                expects_operand = False
+            elif token_type == "not_":
+                group.num_nots += 1
+            elif token_type == "open":
+                group = _Group("group")
+                stack.append(group)
+            elif token_type == "quantifier":
+                name = match.group("variable")
+                group = _Group(match.group("quantifier_symbol"), self._variable(name))
+                stack.append(group)
+                self._bound_names[name] = self._bound_names.get(name, 0) + 1
+            else:
+                if len(stack) == 1:
+                    raise ValueError(f"Unmatched ) at position {pos}")
+                if expects_operand:
+                    raise ValueError(f"Missing operand at position {pos}")
+                stack.pop()
+                clause = self._close_group(group)
+                group = stack[-1]
+                self._add_operand(group, clause)
+            pos = match.end()
+        if len(stack) > 1:
+            raise ValueError("Missing ) at the end of the formula")
+        if expects_operand:
+            raise ValueError("Missing operand at the end of the formula")
+        return _combine(group)
+
+    def _close_group(self, group: _Group) -> Clause:
+        clause = _combine(group)
+        if group.param is None:
+            # only conjunctions, disjunctions and implications are put in parentheses,
+            # so a single clause in parentheses is a conjunction of one clause
+            return clause if group.operator is not None else And(clause)
+        name = group.param.name
+        self._bound_names[name] -= 1
+        if self._bound_names[name] == 0:
+            del self._bound_names[name]
+        if group.kind == self.symbols.exists:
+            return Exists(group.param, clause)
+        return All(group.param, clause)
+
+    def _add_operand(self, group: _Group, clause: Clause) -> None:
+        for _ in range(group.num_nots):
+            clause = Not(clause)
+        group.num_nots = 0
+        group.operands.append(clause)
+
+    def _parse_atom(self, match: re.Match[str]) -> Atom:
+        predicate_symbol = match.group("predicate")
+        predicate = self._predicates.get(predicate_symbol)
+        if predicate is None:
+            predicate = Predicate(predicate_symbol)
+            self._predicates[predicate_symbol] = predicate
+        return Atom(
+            predicate,
+            tuple(
+                [
+                    self._term(term)
+                    for term in _TERM_PATTERN.findall(match.group("terms"))
+                ]
+            ),
+        )
+
+    def _term(self, term_str: str) -> Term:
+        if term_str in self._bound_names or term_str in self.variables:
+            variable = self._variables.get(term_str)
+            return variable if variable is not None else self._variable(term_str)
+        constant = self._constants.get(term_str)
+        if constant is None:
+            if term_str.startswith('"'):
+                constant = Constant.from_parsed(term_str, "string", None)
+            elif term_str in self.instances:
+                constant = Constant.from_parsed(term_str, "instance", None)
+            else:
+                constant = Constant.from_parsed(term_str, "symbol", None)
+            self._constants[term_str] = constant
+        return constant
+
+    def _variable(self, name: str) -> Variable:
+        variable = self._variables.get(name)
+        if variable is None:
+            variable = Variable(name)
+            self._variables[name] = variable
+        return variable
+
+
+def _combine(group: _Group) -> Clause:
+    operands = group.operands
+    if group.operator is None:
+        return operands[0]
+    if group.operator == "and_":
+        return And(*operands)
+    if group.operator == "or_":
+        return Or(*operands)
+    if len(operands) != 2:
+        raise ValueError("Implications must have exactly 2 sides, use parentheses")
+    return Implies(operands[0], operands[1])
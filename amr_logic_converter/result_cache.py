@@ -0,0 +1,166 @@
+from __future__ import annotations
+from collections import OrderedDict
+from hashlib import sha256
+import json
+import os
+import sqlite3
+from threading import Lock
+from typing import Any, Callable, Optional, Protocol
+
+from penman.tree import Node, Tree
+
+from amr_logic_converter.binary_clause import SymbolTable, decode_clause, encode_clause
+from amr_logic_converter.types import Clause
+
+
+# bump this if the logic produced for the same AMR and options changes, to invalidate on-disk caches
+_CACHE_FORMAT_VERSION = 1
+
+
+class ResultCache(Protocol):
+    """A store of converted logic, keyed by a hash of the AMR tree and the converter options"""
+
+    def get(self, key: str) -> Optional[Clause]:
+        ...
+
+    def set(self, key: str, logic: Clause) -> None:
+        ...
+
+
+class MemoryResultCache:
+    """
+    An in-memory result cache, evicting the least recently used results once `max_size` are stored.
+    Worker processes each get their own copy of the cache, starting with the results stored so far.
+    """
+
+    max_size: int
+
+    def __init__(self, max_size: int = 10_000) -> None:
+        if max_size < 1:
+            raise ValueError(f"max_size must be at least 1, got {max_size}")
+        self.max_size = max_size
+        self._results: OrderedDict[str, Clause] = OrderedDict()
+        self._lock = Lock()
+
+    def __getstate__(self) -> dict[str, Any]:
+        # locks can't be pickled, so copies sent to worker processes get their own
+        with self._lock:
+            return {
+                "max_size": self.max_size,
+                "_results": OrderedDict(self._results),
+            }
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = Lock()
+
+    def get(self, key: str) -> Optional[Clause]:
+        with self._lock:
+            logic = self._results.get(key)
+            if logic is not None:
+                self._results.move_to_end(key)
+            return logic
+
+    def set(self, key: str, logic: Clause) -> None:
+        with self._lock:
+            self._results[key] = logic
+            self._results.move_to_end(key)
+            if len(self._results) > self.max_size:
+                self._results.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._results.clear()
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+
+class SqliteResultCache:
+    """
+    An on-disk result cache in a sqlite database, which persists across runs and can be shared
+    between processes. Logic is stored in the binary encoding of `encode_clause`, with its symbols,
+    which unlike pickle handles formulas of any depth and can't run code when read.
+    """
+
+    path: str
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self.path = os.fspath(path)
+        self._lock = Lock()
+        self._connection = sqlite3.connect(
+            self.path, timeout=30, check_same_thread=False
+        )
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS encoded_results "
+                "(key TEXT PRIMARY KEY, symbols BLOB NOT NULL, logic BLOB NOT NULL)"
+            )
+
+    def get(self, key: str) -> Optional[Clause]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT symbols, logic FROM encoded_results WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        symbols = SymbolTable()
+        symbols.add_from_bytes(row[0])
+        return decode_clause(row[1], symbols)
+
+    def set(self, key: str, logic: Clause) -> None:
+        symbols = SymbolTable()
+        data = encode_clause(logic, symbols)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO encoded_results (key, symbols, logic) VALUES (?, ?, ?)",
+                (key, symbols.to_bytes(), data),
+            )
+
+    def clear(self) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM encoded_results")
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute(
+                "SELECT COUNT(*) FROM encoded_results"
+            ).fetchone()[0]
+
+    def __reduce__(self) -> tuple[Callable[..., SqliteResultCache], tuple[str]]:
+        # connections can't be pickled, so worker processes open the database themselves
+        return (SqliteResultCache, (self.path,))
+
+
+def make_result_cache_key(amr_tree: Tree, options: tuple[Any, ...]) -> str:
+    """Hash the AMR tree, ignoring metadata and formatting, together with the converter options"""
+    digest = sha256()
+    digest.update(
+        json.dumps((_CACHE_FORMAT_VERSION, options), ensure_ascii=False).encode()
+    )
+    digest.update(b"\n")
+    digest.update(_canonicalize_tree(amr_tree).encode())
+    return digest.hexdigest()
+
+
+def _canonicalize_tree(amr_tree: Tree) -> str:
+    """Serialize the tree's nodes and edges as a JSON list of tokens, without recursion"""
+    # entering a node is written as [var], leaving it as null, and roles and leaves as strings
+    tokens: list[list[str] | str | None] = []
+    # a node means entering that node, a string is a role or leaf, and None means leaving the last node
+    stack: list[Node | str | None] = [amr_tree.node]
+    while stack:
+        item = stack.pop()
+        if item is None or isinstance(item, str):
+            tokens.append(item)
+            continue
+        var, branches = item
+        tokens.append([var])
+        stack.append(None)
+        for role, target in reversed(branches):
+            stack.append(target)
+            stack.append(role)
+    return json.dumps(tokens, ensure_ascii=False)
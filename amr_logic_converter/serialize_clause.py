@@ -0,0 +1,126 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Any, Iterator, TextIO
+
+from amr_logic_converter.types import (
+    All,
+    And,
+    Atom,
+    Clause,
+    Exists,
+    Implies,
+    Not,
+    Or,
+    Variable,
+)
+
+
+@dataclass(frozen=True)
+class LogicSymbols:
+    """The operator strings used when serializing a clause"""
+
+    and_: str
+    or_: str
+    not_: str
+    implies: str
+    exists: str
+    all: str
+
+
+UNICODE_SYMBOLS = LogicSymbols(
+    and_=" ∧ ", or_=" ∨ ", not_="¬", implies=" → ", exists="∃", all="∀"
+)
+ASCII_SYMBOLS = LogicSymbols(
+    and_=" & ", or_=" | ", not_="~", implies=" -> ", exists="exists ", all="all "
+)
+
+
+def serialize_clause(clause: Clause, symbols: LogicSymbols = UNICODE_SYMBOLS) -> str:
+    """Serialize a clause to a string, using unicode logic symbols by default"""
+    return "".join(_iter_clause_pieces(clause, symbols))
+
+
+def write_clause(
+    clause: Clause, stream: TextIO, symbols: LogicSymbols = UNICODE_SYMBOLS
+) -> None:
+    """Write a clause to a text stream piece by piece, without building the full string in memory"""
+    stream.writelines(_iter_clause_pieces(clause, symbols))
+
+
+# child clauses of these types need parentheses inside each type of parent
+_AND_PARENTHESIZED: frozenset[type] = frozenset((Or, Implies))
+_OR_PARENTHESIZED: frozenset[type] = frozenset((And, Implies))
+_COMPOUND: frozenset[type] = frozenset((And, Or, Implies))
+
+
+def _iter_clause_pieces(clause: Clause, symbols: LogicSymbols) -> Iterator[str]:
+    """
+    Yield the pieces of the serialized clause in order, in a single pass with an explicit stack
+    so deeply nested clauses don't hit the recursion limit.
+    """
+    # strings are output as-is, anything else is expanded into its parts.
+    # parts are pushed in reverse so they're popped in order.
+    stack: list[Any] = [clause]
+    push = stack.append
+    pop = stack.pop
+    while stack:
+        item = pop()
+        item_type = type(item)
+        if item_type is str:
+            yield item
+        elif item_type is Atom:
+            yield _format_atom(item)
+        elif item_type is And or item_type is Or:
+            if item_type is And:
+                operator, parenthesized = symbols.and_, _AND_PARENTHESIZED
+            else:
+                operator, parenthesized = symbols.or_, _OR_PARENTHESIZED
+            args = item.args
+            for i in range(len(args) - 1, -1, -1):
+                arg = args[i]
+                if type(arg) in parenthesized:
+                    push(")")
+                    push(arg)
+                    push("(")
+                else:
+                    push(arg)
+                if i > 0:
+                    push(operator)
+        elif item_type is Not:
+            body = item.body
+            if type(body) in _COMPOUND:
+                push(")")
+                push(body)
+                yield symbols.not_ + "("
+            else:
+                push(body)
+                yield symbols.not_
+        elif item_type is Implies:
+            for i, arg in enumerate((item.consequent, item.antecedent)):
+                if type(arg) in _COMPOUND:
+                    push(")")
+                    push(arg)
+                    push("(")
+                else:
+                    push(arg)
+                if i == 0:
+                    push(symbols.implies)
+        elif item_type is Exists or item_type is All:
+            quantifier = symbols.exists if item_type is Exists else symbols.all
+            push(")")
+            push(item.body)
+            yield f"{quantifier}{item.param.name}("
+        else:
+            yield str(item)
+
+
+def _format_atom(atom: Atom) -> str:
+    term_strs = []
+    for term in atom.terms:
+        if isinstance(term, Variable):
+            term_strs.append(term.name)
+        elif term.type == "string":
+            term_strs.append(f'"{term.value}"')
+        else:
+            term_strs.append(term.value)
+    return f"{atom.predicate.symbol}({', '.join(term_strs)})"
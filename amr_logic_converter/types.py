@@ -1,6 +1,6 @@
 from __future__ import annotations
-from dataclasses import dataclass
-from typing import Union
+from dataclasses import dataclass, field
+from typing import Any, Callable, Union
 from typing_extensions import Literal
 from penman.surface import Alignment
 
@@ -10,22 +10,189 @@ from .parse_symbol_and_alignment import parse_symbol_and_alignment
 ConstantType = Literal["string", "symbol", "instance"]
 
 
-@dataclass
-class Constant:
+class _LogicNode:
+    """
+    Base for the immutable logic types below. Compound types cache their hash in a `_hash` slot the
+    first time they're hashed, so a formula is only walked once. Leaf types hash their strings, which
+    cache their own hashes, so they skip the extra slot. String hashes differ between processes, so the
+    cached hash is recomputed rather than pickled. Compound types also share an equality check that
+    walks both formulas without recursion, in place of the recursive one dataclasses generate.
+    """
+
+    __slots__ = ()
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if type(other) is not type(self):
+            return NotImplemented
+        return _formulas_equal(self, other)
+
+    def __reduce__(self) -> tuple[Callable[..., Any], tuple[Any, ...]]:
+        if not hasattr(type(self), "_hash"):
+            return (_reconstruct, (type(self), _field_values(self)))
+        return (_rebuild_formula, (_flatten_formula(self),))
+
+
+def _field_values(node: Any) -> tuple[Any, ...]:
+    # __match_args__ lists the dataclass fields except the cached hash, and is much faster than fields()
+    return tuple([getattr(node, name) for name in node.__match_args__])
+
+
+def _reconstruct(cls: type[_LogicNode], field_values: tuple[Any, ...]) -> _LogicNode:
+    node = object.__new__(cls)
+    for name, value in zip(cls.__match_args__, field_values):  # type: ignore
+        object.__setattr__(node, name, value)
+    return node
+
+
+def _flatten_formula(node: Any) -> list[tuple[type[_LogicNode], tuple[Any, ...]]]:
+    """
+    List the compound subformulas of a formula in post-order, each with its field values and its
+    compound children replaced by their index in the list, so pickling doesn't recurse once per
+    nesting level. Compound fields never hold ints themselves, so the indices can't be mistaken for values.
+    """
+    indices: dict[int, int] = {}
+    flattened: list[tuple[type[_LogicNode], tuple[Any, ...]]] = []
+    stack: list[tuple[Any, bool]] = [(node, False)]
+    while stack:
+        current, children_flattened = stack.pop()
+        if id(current) in indices:
+            continue
+        if children_flattened:
+            field_values = tuple(
+                [
+                    tuple([_child_index(child, indices) for child in value])
+                    if isinstance(value, tuple)
+                    else _child_index(value, indices)
+                    for value in _field_values(current)
+                ]
+            )
+            indices[id(current)] = len(flattened)
+            flattened.append((type(current), field_values))
+        else:
+            stack.append((current, True))
+            for value in _field_values(current):
+                for child in value if isinstance(value, tuple) else (value,):
+                    if hasattr(type(child), "_hash"):
+                        stack.append((child, False))
+    return flattened
+
+
+def _child_index(value: Any, indices: dict[int, int]) -> Any:
+    if hasattr(type(value), "_hash"):
+        return indices[id(value)]
+    return value
+
+
+def _rebuild_formula(
+    flattened: list[tuple[type[_LogicNode], tuple[Any, ...]]]
+) -> _LogicNode:
+    """Rebuild a formula listed by _flatten_formula, children first"""
+    nodes: list[_LogicNode] = []
+    for cls, field_values in flattened:
+        node = object.__new__(cls)
+        for name, value in zip(cls.__match_args__, field_values):  # type: ignore
+            if isinstance(value, int):
+                value = nodes[value]
+            elif isinstance(value, tuple):
+                value = tuple(
+                    [nodes[item] if isinstance(item, int) else item for item in value]
+                )
+            object.__setattr__(node, name, value)
+        nodes.append(node)
+    return nodes[-1]
+
+
+def _cached_hash(node: Any) -> int:
+    try:
+        return node._hash
+    except AttributeError:
+        pass
+    # hash uncached subformulas bottom-up, so deeply nested formulas don't hit the recursion limit
+    stack: list[tuple[Any, bool]] = [(node, False)]
+    while stack:
+        current, children_hashed = stack.pop()
+        if children_hashed:
+            object.__setattr__(
+                current, "_hash", hash((type(current), _field_values(current)))
+            )
+        elif not hasattr(current, "_hash"):
+            stack.append((current, True))
+            for value in _field_values(current):
+                for child in value if isinstance(value, tuple) else (value,):
+                    if hasattr(type(child), "_hash"):
+                        stack.append((child, False))
+    return node._hash
+
+
+def _formulas_equal(formula1: Any, formula2: Any) -> bool:
+    """Compare two formulas of the same type field by field, without recursion"""
+    stack: list[tuple[Any, Any]] = [(formula1, formula2)]
+    while stack:
+        node1, node2 = stack.pop()
+        # formulas whose hashes are already cached differ if their hashes do
+        hash1 = getattr(node1, "_hash", None)
+        hash2 = getattr(node2, "_hash", None)
+        if hash1 is not None and hash2 is not None and hash1 != hash2:
+            return False
+        for value1, value2 in zip(_field_values(node1), _field_values(node2)):
+            if isinstance(value1, tuple):
+                if not isinstance(value2, tuple) or len(value1) != len(value2):
+                    return False
+                children = zip(value1, value2)
+            else:
+                children = zip((value1,), (value2,))
+            for child1, child2 in children:
+                if child1 is child2:
+                    continue
+                if type(child1) is not type(child2):
+                    return False
+                if hasattr(type(child1), "_hash"):
+                    stack.append((child1, child2))
+                elif child1 != child2:
+                    return False
+    return True
+
+
+def _alignment_key(alignment: Alignment | None) -> tuple[Any, ...] | None:
+    """penman alignments aren't hashable, so hash them by their contents instead"""
+    if alignment is None:
+        return None
+    return (type(alignment), alignment.indices, alignment.prefix)
+
+
+@dataclass(frozen=True, slots=True)
+class Constant(_LogicNode):
     value: str
     type: ConstantType
     alignment: Alignment | None = None
 
     def __init__(self, element: str, type: ConstantType) -> None:
-        self.type = type
-        self.value, self.alignment = parse_symbol_and_alignment(element)
+        value, alignment = parse_symbol_and_alignment(element)
+        self._set_fields(value, type, alignment)
+
+    @classmethod
+    def from_parsed(
+        cls, value: str, type: ConstantType, alignment: Alignment | None
+    ) -> Constant:
+        """Build a constant from an element already split into its value and alignment"""
+        constant = object.__new__(cls)
+        constant._set_fields(value, type, alignment)
+        return constant
+
+    def _set_fields(
+        self, value: str, type: ConstantType, alignment: Alignment | None
+    ) -> None:
         # remove explicit quotes from string literals
-        if (
-            self.type == "string"
-            and self.value.startswith('"')
-            and self.value.endswith('"')
-        ):
-            self.value = self.value[1:-1]
+        if type == "string" and value.startswith('"') and value.endswith('"'):
+            value = value[1:-1]
+        object.__setattr__(self, "value", value)
+        object.__setattr__(self, "type", type)
+        object.__setattr__(self, "alignment", alignment)
+
+    def __hash__(self) -> int:
+        return hash((Constant, self.value, self.type, _alignment_key(self.alignment)))
 
     def __str__(self) -> str:
         if self.type == "string":
@@ -33,18 +200,25 @@ class Constant:
         return self.value
 
 
-@dataclass
-class Variable:
+@dataclass(frozen=True, slots=True)
+class Variable(_LogicNode):
     name: str
 
+    def __hash__(self) -> int:
+        return hash((Variable, self.name))
+
     def __str__(self) -> str:
         return self.name
 
 
-@dataclass
-class Atom:
+@dataclass(frozen=True, slots=True, eq=False)
+class Atom(_LogicNode):
     predicate: Predicate
     terms: tuple[Term, ...]
+    _hash: int = field(init=False, repr=False, compare=False)
+
+    def __hash__(self) -> int:
+        return _cached_hash(self)
 
     def __str__(self) -> str:
         terms_str = ", ".join([str(term) for term in self.terms])
@@ -61,11 +235,14 @@ class Atom:
         return self.predicate.symbol
 
 
-@dataclass
-class Predicate:
+@dataclass(frozen=True, slots=True)
+class Predicate(_LogicNode):
     symbol: str
     alignment: Alignment | None = None
 
+    def __hash__(self) -> int:
+        return hash((Predicate, self.symbol, _alignment_key(self.alignment)))
+
     @classmethod
     def from_amr_str(cls, amr_str: str) -> Predicate:
         symbol, alignment = parse_symbol_and_alignment(amr_str)
@@ -78,9 +255,10 @@ class Predicate:
         return self.symbol
 
 
-@dataclass
-class And:
+@dataclass(frozen=True, slots=True, eq=False)
+class And(_LogicNode):
     args: tuple["Clause", ...]
+    _hash: int = field(init=False, repr=False, compare=False)
 
     def __init__(self, *args: "Clause") -> None:
         # automatically reduce repeated ANDs
@@ -90,21 +268,19 @@ class And:
                 simplified_args.extend(arg.args)
             else:
                 simplified_args.append(arg)
-        self.args = tuple(simplified_args)
+        object.__setattr__(self, "args", tuple(simplified_args))
+
+    def __hash__(self) -> int:
+        return _cached_hash(self)
 
     def __str__(self) -> str:
-        arg_strs = []
-        for arg in self.args:
-            if type(arg) in [Or, Implies]:
-                arg_strs.append(f"({str(arg)})")
-            else:
-                arg_strs.append(str(arg))
-        return f"{' ∧ '.join(arg_strs)}"
+        return serialize_clause(self)
 
 
-@dataclass
-class Or:
+@dataclass(frozen=True, slots=True, eq=False)
+class Or(_LogicNode):
     args: tuple["Clause", ...]
+    _hash: int = field(init=False, repr=False, compare=False)
 
     def __init__(self, *args: "Clause") -> None:
         # automatically reduce repeated ORs
@@ -114,60 +290,69 @@ class Or:
                 simplified_args.extend(arg.args)
             else:
                 simplified_args.append(arg)
-        self.args = tuple(simplified_args)
+        object.__setattr__(self, "args", tuple(simplified_args))
+
+    def __hash__(self) -> int:
+        return _cached_hash(self)
 
     def __str__(self) -> str:
-        arg_strs = []
-        for arg in self.args:
-            if type(arg) in [And, Implies]:
-                arg_strs.append(f"({str(arg)})")
-            else:
-                arg_strs.append(str(arg))
-        return f"{' ∨ '.join(arg_strs)}"
+        return serialize_clause(self)
 
 
-@dataclass
-class Not:
+@dataclass(frozen=True, slots=True, eq=False)
+class Not(_LogicNode):
     body: "Clause"
+    _hash: int = field(init=False, repr=False, compare=False)
+
+    def __hash__(self) -> int:
+        return _cached_hash(self)
 
     def __str__(self) -> str:
-        if type(self.body) in [And, Or, Implies]:
-            return f"¬({str(self.body)})"
-        return f"¬{str(self.body)}"
+        return serialize_clause(self)
 
 
-@dataclass
-class Implies:
+@dataclass(frozen=True, slots=True, eq=False)
+class Implies(_LogicNode):
     antecedent: "Clause"
     consequent: "Clause"
+    _hash: int = field(init=False, repr=False, compare=False)
+
+    def __hash__(self) -> int:
+        return _cached_hash(self)
 
     def __str__(self) -> str:
-        antecedent_str = str(self.antecedent)
-        consequent_str = str(self.consequent)
-        if type(self.antecedent) in [And, Or, Implies]:
-            antecedent_str = f"({antecedent_str})"
-        if type(self.consequent) in [And, Or, Implies]:
-            consequent_str = f"({consequent_str})"
-        return f"{antecedent_str} → {consequent_str}"
+        return serialize_clause(self)
 
 
-@dataclass
-class Exists:
+@dataclass(frozen=True, slots=True, eq=False)
+class Exists(_LogicNode):
     param: Variable
     body: "Clause"
+    _hash: int = field(init=False, repr=False, compare=False)
+
+    def __hash__(self) -> int:
+        return _cached_hash(self)
 
     def __str__(self) -> str:
-        return f"∃{str(self.param)}({str(self.body)})"
+        return serialize_clause(self)
 
 
-@dataclass
-class All:
+@dataclass(frozen=True, slots=True, eq=False)
+class All(_LogicNode):
     param: Variable
     body: "Clause"
+    _hash: int = field(init=False, repr=False, compare=False)
+
+    def __hash__(self) -> int:
+        return _cached_hash(self)
 
     def __str__(self) -> str:
-        return f"∀{str(self.param)}({str(self.body)})"
+        return serialize_clause(self)
 
 
 Clause = Union[Atom, Not, Exists, All, And, Or, Implies]
 Term = Union[Constant, Variable]
+
+
+# imported last, as the serializer needs the types above
+from .serialize_clause import serialize_clause  # noqa: E402
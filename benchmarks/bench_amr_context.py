@@ -0,0 +1,56 @@
+"""
+Compare the single-pass tree analysis against running the individual helper passes.
+
+usage: python -m benchmarks.bench_amr_context
+"""
+from __future__ import annotations
+from timeit import repeat
+from typing import Callable
+
+from penman.tree import Tree
+
+from amr_logic_converter.analyze_amr_tree import analyze_amr_tree
+from amr_logic_converter.extract_instances_from_amr_tree import (
+    extract_instances_from_amr_tree,
+)
+from amr_logic_converter.find_coreferent_instances import find_coreferent_instances
+from amr_logic_converter.find_instance_depths import find_instance_depths
+from amr_logic_converter.map_instances_lca import map_instances_lca
+from amr_logic_converter.map_instances_to_nodes import map_instances_to_nodes
+from benchmarks.generate_amrs import (
+    generate_deep_amr,
+    generate_reentrant_amr,
+    generate_wide_amr,
+)
+
+
+def run_separate_passes(tree: Tree) -> None:
+    instances = extract_instances_from_amr_tree(tree)
+    find_coreferent_instances(tree, instances)
+    map_instances_to_nodes(tree, instances)
+    find_instance_depths(tree, instances)
+    map_instances_lca(tree, instances)
+
+
+def best_time(func: Callable[[Tree], object], tree: Tree, number: int) -> float:
+    return min(repeat(lambda: func(tree), number=number, repeat=5)) / number
+
+
+def main() -> None:
+    cases = {
+        "wide-1000": generate_wide_amr(1000),
+        "deep-200": generate_deep_amr(200),
+        "deep-800": generate_deep_amr(800),
+        "reentrant-1000": generate_reentrant_amr(1000),
+    }
+    print(f"{'case':<16}{'separate (ms)':>16}{'single pass (ms)':>18}{'speedup':>10}")
+    for name, tree in cases.items():
+        separate = best_time(run_separate_passes, tree, 10)
+        single = best_time(analyze_amr_tree, tree, 10)
+        print(
+            f"{name:<16}{separate * 1000:>16.3f}{single * 1000:>18.3f}{separate / single:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
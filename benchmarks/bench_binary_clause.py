@@ -0,0 +1,76 @@
+"""
+Compare the binary clause encoding against pickle: encode and decode time, and size,
+for many converted formulas, then the time to read single records back from a clause file.
+
+usage: python -m benchmarks.bench_binary_clause
+"""
+from __future__ import annotations
+import os
+import pickle
+from random import Random
+import tempfile
+from timeit import repeat
+from typing import Callable
+
+from amr_logic_converter import AmrLogicConverter, Clause
+from amr_logic_converter.binary_clause import (
+    ClauseFileReader,
+    ClauseFileWriter,
+    SymbolTable,
+    decode_clause,
+    encode_clause,
+)
+from benchmarks.generate_amrs import generate_reentrant_amr
+
+
+def best_time(func: Callable[[], object]) -> float:
+    return min(repeat(func, number=1, repeat=5))
+
+
+def main() -> None:
+    converter = AmrLogicConverter(existentially_quantify_instances=True)
+    clauses = [
+        converter.convert(generate_reentrant_amr(40, seed=seed)) for seed in range(500)
+    ]
+    symbols = SymbolTable()
+    encoded = [encode_clause(clause, symbols) for clause in clauses]
+    pickled = [pickle.dumps(clause) for clause in clauses]
+    symbols_size = len(symbols.to_bytes())
+
+    print(f"{len(clauses)} formulas")
+    print(f"{'format':<10}{'encode (ms)':>14}{'decode (ms)':>14}{'size (KiB)':>14}")
+    print(
+        f"{'pickle':<10}"
+        f"{best_time(lambda: [pickle.dumps(clause) for clause in clauses]) * 1000:>14.1f}"
+        f"{best_time(lambda: [pickle.loads(data) for data in pickled]) * 1000:>14.1f}"
+        f"{sum(map(len, pickled)) / 1024:>14.1f}"
+    )
+    print(
+        f"{'binary':<10}"
+        f"{best_time(lambda: [encode_clause(clause, symbols) for clause in clauses]) * 1000:>14.1f}"
+        f"{best_time(lambda: [decode_clause(data, symbols) for data in encoded]) * 1000:>14.1f}"
+        f"{(sum(map(len, encoded)) + symbols_size) / 1024:>14.1f}"
+    )
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "logic.bin")
+        write_time = best_time(lambda: write_file(path, clauses))
+        rng = Random(0)
+        indices = [rng.randrange(len(clauses)) for _ in range(1000)]
+        with ClauseFileReader(path) as reader:
+            read_time = best_time(lambda: [reader[index] for index in indices])
+        print(f"\nclause file: {os.path.getsize(path) / 1024:.1f} KiB")
+        print(f"write all: {write_time * 1000:.1f} ms")
+        print(f"read 1000 random records: {read_time * 1000:.1f} ms")
+
+
+def write_file(path: str, clauses: list[Clause]) -> None:
+    if os.path.exists(path):
+        os.remove(path)
+    with ClauseFileWriter(path) as writer:
+        for clause in clauses:
+            writer.append(clause)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Time building the conversion context and converting with no hooks, with maximal hoisting of
+coreferences, and with an override_is_projective callback that only reads the instance name.
+
+usage: python -m benchmarks.bench_callbacks
+"""
+from __future__ import annotations
+from timeit import repeat
+from typing import Callable, Optional
+
+from amr_logic_converter import AmrLogicConverter
+from amr_logic_converter.AmrContext import AmrContext, OverrideIsProjectiveCallbackInfo
+from benchmarks.generate_amrs import generate_reentrant_amr
+
+
+def read_instance_name(info: OverrideIsProjectiveCallbackInfo) -> Optional[bool]:
+    return True if info.instance_name == "n0" else None
+
+
+def best_time(func: Callable[[], object], number: int) -> float:
+    return min(repeat(func, number=number, repeat=5)) / number
+
+
+def main() -> None:
+    tree = generate_reentrant_amr(2000)
+    configs: dict[str, AmrLogicConverter] = {
+        "no hooks": AmrLogicConverter(),
+        "maximal hoisting": AmrLogicConverter(maximally_hoist_coreferences=True),
+        "callback": AmrLogicConverter(override_is_projective=read_instance_name),
+    }
+    print(f"{'config':<20}{'context (ms)':>14}{'convert (ms)':>14}")
+    for name, converter in configs.items():
+        context_time = best_time(
+            lambda: AmrContext.from_amr_tree(
+                tree,
+                override_is_projective=converter.override_is_projective,
+                maximally_hoist_coreferences=converter.maximally_hoist_coreferences,
+            ),
+            20,
+        )
+        convert_time = best_time(lambda: converter.convert(tree), 5)
+        print(f"{name:<20}{context_time * 1000:>14.3f}{convert_time * 1000:>14.3f}")
+
+
+if __name__ == "__main__":
+    main()
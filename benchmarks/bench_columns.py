@@ -0,0 +1,63 @@
+"""
+Time converting AMRs straight into columnar tables, against converting them to Clauses and
+walking each formula to write its atoms into rows.
+
+usage: python -m benchmarks.bench_columns
+"""
+from __future__ import annotations
+from timeit import repeat
+import tracemalloc
+from typing import Any, Callable
+
+from penman.tree import Tree
+
+from amr_logic_converter import AmrLogicConverter, Atom, Clause
+from amr_logic_converter.LazyConversion import _iter_subformulas
+from benchmarks.generate_amrs import generate_reentrant_amr
+
+
+def best_time(func: Callable[[], object]) -> float:
+    return min(repeat(func, number=1, repeat=5))
+
+
+def peak_memory(func: Callable[[], object]) -> int:
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def clauses_to_rows(
+    converter: AmrLogicConverter, trees: list[Tree]
+) -> list[tuple[Any, ...]]:
+    rows: list[tuple[Any, ...]] = []
+    for amr_index, tree in enumerate(trees):
+        logic: Clause = converter.convert(tree)
+        for subformula in _iter_subformulas(logic):
+            if isinstance(subformula, Atom):
+                rows.append((amr_index, subformula.predicate, subformula.terms))
+    return rows
+
+
+def main() -> None:
+    trees = [generate_reentrant_amr(40, seed=seed) for seed in range(200)]
+    print(f"{'options':<24}{'mode':<10}{'time (ms)':>12}{'peak (KiB)':>12}")
+    for options_name, converter in [
+        ("default", AmrLogicConverter()),
+        ("existential", AmrLogicConverter(existentially_quantify_instances=True)),
+    ]:
+        modes: dict[str, Callable[[], object]] = {
+            "clauses": lambda: clauses_to_rows(converter, trees),
+            "columns": lambda: converter.convert_to_columns(trees),
+        }
+        for mode, run in modes.items():
+            timing = best_time(run)
+            peak = peak_memory(run)
+            print(
+                f"{options_name:<24}{mode:<10}{timing * 1000:>12.1f}{peak / 1024:>12.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Compare laying out decoded graphs as trees with penman.configure and with configure_graph,
+and converting the graphs to logic, which includes laying them out.
+
+usage: python -m benchmarks.bench_configure_graph
+"""
+from __future__ import annotations
+import sys
+from timeit import repeat
+
+import penman
+
+from amr_logic_converter import AmrLogicConverter
+from amr_logic_converter.configure_graph import configure_graph
+from benchmarks.generate_amrs import (
+    generate_corpus_amrs,
+    generate_deep_amr,
+    generate_reentrant_amr,
+    generate_wide_amr,
+)
+
+
+def main() -> None:
+    # penman decodes and configures the deep AMRs recursively
+    sys.setrecursionlimit(20_000)
+    converter = AmrLogicConverter(existentially_quantify_instances=True)
+    cases = {
+        "corpus-500": generate_corpus_amrs(500),
+        "wide-2000": [penman.format(generate_wide_amr(2000))],
+        "deep-800": [penman.format(generate_deep_amr(800))],
+        "reentrant-2000": [penman.format(generate_reentrant_amr(2000))],
+    }
+    print(
+        f"{'case':<16}{'configure (ms)':>16}{'configure_graph (ms)':>22}{'speedup':>10}{'convert share':>15}"
+    )
+    for name, amr_strs in cases.items():
+        graphs = [penman.decode(amr_str) for amr_str in amr_strs]
+        penman_time = min(
+            repeat(
+                lambda: [penman.configure(graph) for graph in graphs],
+                number=1,
+                repeat=10,
+            )
+        )
+        fast_time = min(
+            repeat(
+                lambda: [configure_graph(graph) for graph in graphs],
+                number=1,
+                repeat=10,
+            )
+        )
+        convert_time = min(
+            repeat(
+                lambda: [converter.convert(graph) for graph in graphs],
+                number=1,
+                repeat=5,
+            )
+        )
+        print(
+            f"{name:<16}{penman_time * 1000:>16.2f}{fast_time * 1000:>22.2f}"
+            f"{penman_time / fast_time:>9.2f}x{fast_time / convert_time:>15.0%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+"""
+Time end-to-end conversion of generated trees of increasing size, to check it scales linearly.
+
+usage: python -m benchmarks.bench_convert
+"""
+from __future__ import annotations
+from timeit import repeat
+
+from amr_logic_converter import AmrLogicConverter
+from benchmarks.generate_amrs import (
+    generate_deep_amr,
+    generate_reentrant_amr,
+    generate_wide_amr,
+)
+
+
+def main() -> None:
+    converter = AmrLogicConverter(existentially_quantify_instances=True)
+    cases = [
+        *((f"wide-{n}", generate_wide_amr(n)) for n in [250, 500, 1000, 2000]),
+        *((f"deep-{n}", generate_deep_amr(n)) for n in [250, 500, 1000, 2000]),
+        *((f"reentrant-{n}", generate_reentrant_amr(n)) for n in [250, 500, 1000]),
+    ]
+    print(f"{'case':<16}{'convert (ms)':>14}{'per node (µs)':>16}")
+    for name, tree in cases:
+        num_nodes = int(name.split("-")[1])
+        timing = min(repeat(lambda: converter.convert(tree), number=3, repeat=3)) / 3
+        print(f"{name:<16}{timing * 1000:>14.3f}{timing / num_nodes * 1e6:>16.2f}")
+
+
+if __name__ == "__main__":
+    main()
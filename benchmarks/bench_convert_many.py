@@ -0,0 +1,43 @@
+"""
+Compare convert_many throughput with a single worker against multiple worker processes.
+
+usage: python -m benchmarks.bench_convert_many [--workers N] [--num-amrs N] [--chunksize N]
+"""
+from __future__ import annotations
+import argparse
+import os
+from random import Random
+from time import perf_counter
+
+import penman
+
+from amr_logic_converter import AmrLogicConverter
+from benchmarks.generate_amrs import generate_reentrant_amr
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--num-amrs", type=int, default=2000)
+    parser.add_argument("--chunksize", type=int, default=64)
+    args = parser.parse_args()
+
+    rng = Random(0)
+    amrs = [
+        penman.format(generate_reentrant_amr(rng.randrange(10, 60), seed=seed))
+        for seed in range(args.num_amrs)
+    ]
+    converter = AmrLogicConverter(existentially_quantify_instances=True)
+    print(f"{'workers':<10}{'seconds':>10}{'AMRs/sec':>12}")
+    for workers in sorted({1, args.workers}):
+        start = perf_counter()
+        for result in converter.convert_many(
+            amrs, workers=workers, chunksize=args.chunksize
+        ):
+            assert result.error is None
+        elapsed = perf_counter() - start
+        print(f"{workers:<10}{elapsed:>10.2f}{len(amrs) / elapsed:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Time the latency from a local edit to the new logic with incremental reconversion, against
+converting the whole edited tree again.
+
+usage: python -m benchmarks.bench_incremental
+"""
+from __future__ import annotations
+from random import Random
+from time import perf_counter
+from typing import Callable
+
+from penman.tree import Tree
+
+from amr_logic_converter import AmrLogicConverter, IncrementalConversion
+from benchmarks.generate_amrs import (
+    generate_deep_amr,
+    generate_document_amr,
+    generate_reentrant_amr,
+)
+
+
+def edit_latencies(
+    tree: Tree, edit: Callable[[IncrementalConversion, Random, int], None]
+) -> tuple[float, float]:
+    """The median time in ms to get the logic after an edit, incrementally and from scratch"""
+    converter = AmrLogicConverter(existentially_quantify_instances=True)
+    conversion = IncrementalConversion(converter, tree)
+    conversion.logic
+    rng = Random(0)
+    incremental_times: list[float] = []
+    full_times: list[float] = []
+    for i in range(50):
+        edit(conversion, rng, i)
+        start = perf_counter()
+        conversion.logic
+        incremental_times.append(perf_counter() - start)
+        start = perf_counter()
+        converter.convert(conversion.tree)
+        full_times.append(perf_counter() - start)
+    return (
+        sorted(incremental_times)[len(incremental_times) // 2] * 1000,
+        sorted(full_times)[len(full_times) // 2] * 1000,
+    )
+
+
+def main() -> None:
+    # 100 sentences of 20 nodes, with re-entrancies within each sentence like real documents
+    document = generate_document_amr(100, 20)
+    document_instances = [f"s{s}n{i}" for s in range(100) for i in range(20)]
+    # re-entrancies anywhere in the tree, so most subtrees share instances with the rest of it
+    size = 2000
+    reentrant = generate_reentrant_amr(size)
+    instances = [f"n{i}" for i in range(size)]
+    edits: dict[
+        str, tuple[Tree, Callable[[IncrementalConversion, Random, int], None]]
+    ] = {
+        "set concept": (
+            document,
+            lambda conversion, rng, i: conversion.set_concept(
+                rng.choice(document_instances), f"edited-{i}"
+            ),
+        ),
+        "set polarity": (
+            document,
+            lambda conversion, rng, i: conversion.set_polarity(
+                rng.choice(document_instances), i % 2 == 0
+            ),
+        ),
+        "add edge": (
+            document,
+            lambda conversion, rng, i: conversion.add_edge(
+                rng.choice(document_instances), ":mod", f'"value {i}"'
+            ),
+        ),
+        "reentrant set concept": (
+            reentrant,
+            lambda conversion, rng, i: conversion.set_concept(
+                rng.choice(instances), f"edited-{i}"
+            ),
+        ),
+        "deep set concept": (
+            generate_deep_amr(size),
+            lambda conversion, rng, i: conversion.set_concept(
+                f"n{rng.randrange(size)}", f"edited-{i}"
+            ),
+        ),
+    }
+    print(f"{'edit':<20}{'incremental (ms)':>18}{'full (ms)':>12}")
+    for name, (tree, edit) in edits.items():
+        incremental_time, full_time = edit_latencies(tree, edit)
+        print(f"{name:<20}{incremental_time:>18.3f}{full_time:>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
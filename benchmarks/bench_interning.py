@@ -0,0 +1,68 @@
+"""
+Compare converting a corpus of AMRs with and without interning symbols and caching symbol parsing,
+measuring the time taken, the memory retained by holding all the converted formulas, and the parse
+cache hit rate.
+
+usage: python -m benchmarks.bench_interning [--num-amrs N]
+"""
+from __future__ import annotations
+import argparse
+from random import Random
+from time import perf_counter
+import tracemalloc
+
+from penman.tree import Tree
+
+from amr_logic_converter import AmrLogicConverter
+from amr_logic_converter.InternTable import InternTable
+from benchmarks.generate_amrs import generate_reentrant_amr
+
+
+def convert_corpus(
+    intern_table: InternTable, corpus: list[Tree]
+) -> tuple[float, int, float]:
+    converter = AmrLogicConverter(
+        existentially_quantify_instances=True, intern_table=intern_table
+    )
+    start = perf_counter()
+    for tree in corpus:
+        converter.convert(tree)
+    elapsed = perf_counter() - start
+    info = intern_table.parse_cache_info()
+    hit_rate = info.hits / max(1, info.hits + info.misses)
+    # measure memory separately, as tracing allocations slows conversion down
+    intern_table.clear()
+    tracemalloc.start()
+    formulas = [converter.convert(tree) for tree in corpus]
+    retained, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del formulas
+    return elapsed, retained, hit_rate
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--num-amrs", type=int, default=2000)
+    args = parser.parse_args()
+
+    rng = Random(0)
+    corpus = [
+        generate_reentrant_amr(rng.randrange(10, 60), seed=seed)
+        for seed in range(args.num_amrs)
+    ]
+    print(
+        f"{'interning':<12}{'parse cache':<14}{'seconds':>10}{'retained (MB)':>16}{'parse hits':>12}"
+    )
+    for interning, parse_cache, intern_table in [
+        ("off", "off", InternTable(max_size=0, parse_cache_size=0)),
+        ("off", "on", InternTable(max_size=0)),
+        ("on", "on", InternTable()),
+    ]:
+        elapsed, retained, hit_rate = convert_corpus(intern_table, corpus)
+        print(
+            f"{interning:<12}{parse_cache:<14}{elapsed:>10.2f}{retained / 1e6:>16.1f}{hit_rate:>11.1%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
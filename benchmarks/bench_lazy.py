@@ -0,0 +1,39 @@
+"""
+Time reading each part of a lazy conversion on its own, against building the full formula.
+
+usage: python -m benchmarks.bench_lazy
+"""
+from __future__ import annotations
+from timeit import repeat
+from typing import Callable
+
+from amr_logic_converter import AmrLogicConverter, LazyConversion
+from benchmarks.generate_amrs import generate_document_amr, generate_reentrant_amr
+
+
+def best_time(func: Callable[[], object]) -> float:
+    return min(repeat(func, number=3, repeat=5)) / 3
+
+
+def main() -> None:
+    converter = AmrLogicConverter(existentially_quantify_instances=True)
+    parts: dict[str, Callable[[LazyConversion], object]] = {
+        "clause": lambda conversion: conversion.clause,
+        "atoms": lambda conversion: conversion.atoms,
+        "predicate_symbols": lambda conversion: conversion.predicate_symbols,
+        "alignments": lambda conversion: conversion.alignments,
+        "quantifier_prefix": lambda conversion: conversion.quantifier_prefix,
+    }
+    for name, tree in [
+        ("document", generate_document_amr(100, 20)),
+        ("reentrant", generate_reentrant_amr(2000)),
+    ]:
+        converter.convert(tree)
+        print(f"{name}\n{'part':<20}{'time (ms)':>12}")
+        for part_name, read_part in parts.items():
+            timing = best_time(lambda: read_part(converter.convert(tree, lazy=True)))
+            print(f"{part_name:<20}{timing * 1000:>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
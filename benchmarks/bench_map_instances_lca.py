@@ -0,0 +1,81 @@
+"""
+Compare how map_instances_lca scales against the previous ancestor-set propagation.
+
+usage: python -m benchmarks.bench_map_instances_lca
+"""
+from __future__ import annotations
+from timeit import repeat
+
+from penman.tree import Node, Tree
+
+from amr_logic_converter.extract_instances_from_amr_tree import (
+    extract_instances_from_amr_tree,
+)
+from amr_logic_converter.map_instances_lca import map_instances_lca
+from benchmarks.generate_amrs import generate_deep_amr, generate_reentrant_amr
+
+
+def legacy_map_instances_lca(tree: Tree, instances: frozenset[str]) -> dict[str, str]:
+    """The previous implementation, intersecting frozensets of ancestors at every node"""
+    ancestors_by_instance = _legacy_map_instances_to_common_ancestors(
+        tree.node, None, instances, frozenset()
+    )
+    return {
+        instance: max(ancestors, key=lambda a: a[0])[2]
+        for instance, ancestors in ancestors_by_instance.items()
+    }
+
+
+def _legacy_map_instances_to_common_ancestors(
+    node: Node,
+    prefix: str | None,
+    instances: frozenset[str],
+    ancestors: frozenset[tuple[int, str | None, str]],
+) -> dict[str, frozenset[tuple[int, str | None, str]]]:
+    instance, instance_info = node
+    _predicate, *edges = instance_info
+    cur_ancestors = ancestors | {(len(ancestors), prefix, instance)}
+    ancestors_by_instance = {instance: cur_ancestors}
+    for i, (role, target) in enumerate(edges):
+        if isinstance(target, tuple):
+            submap = _legacy_map_instances_to_common_ancestors(
+                target, f"{role}_{i}", instances, cur_ancestors
+            )
+        elif target in instances:
+            submap = _legacy_map_instances_to_common_ancestors(
+                (target, [("",)]), f"{role}_{i}", instances, cur_ancestors
+            )
+        else:
+            continue
+        for subinstance, subancestors in submap.items():
+            if subinstance in ancestors_by_instance:
+                ancestors_by_instance[subinstance] &= subancestors
+            else:
+                ancestors_by_instance[subinstance] = subancestors
+    return ancestors_by_instance
+
+
+def main() -> None:
+    cases = [
+        *((f"deep-{n}", generate_deep_amr(n)) for n in [100, 200, 400, 800]),
+        *(
+            (f"reentrant-{n}", generate_reentrant_amr(n))
+            for n in [500, 1000, 2000, 4000]
+        ),
+    ]
+    print(
+        f"{'case':<16}{'ancestor sets (ms)':>20}{'lca tracker (ms)':>18}{'speedup':>10}"
+    )
+    for name, tree in cases:
+        instances = extract_instances_from_amr_tree(tree)
+        timings = [
+            min(repeat(lambda: func(tree, instances), number=5, repeat=3)) / 5
+            for func in [legacy_map_instances_lca, map_instances_lca]
+        ]
+        print(
+            f"{name:<16}{timings[0] * 1000:>20.3f}{timings[1] * 1000:>18.3f}{timings[0] / timings[1]:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Compare converting AMRs under every combination of existentially_quantify_instances,
+maximally_hoist_coreferences and use_implies_for_conditions with a MultiConverter sharing
+the parse and analysis of each AMR, against parsing and converting with each converter separately.
+
+usage: python -m benchmarks.bench_multi_converter
+"""
+from __future__ import annotations
+from itertools import product
+from timeit import repeat
+
+import penman
+
+from amr_logic_converter import AmrLogicConverter, MultiConverter
+from benchmarks.generate_amrs import generate_corpus_amrs, generate_reentrant_amr
+
+OPTIONS = [
+    "existentially_quantify_instances",
+    "maximally_hoist_coreferences",
+    "use_implies_for_conditions",
+]
+
+
+def main() -> None:
+    converters = {}
+    for quantify, hoist, implies in product([False, True], repeat=3):
+        name = ",".join(
+            option
+            for option, value in zip(OPTIONS, [quantify, hoist, implies])
+            if value
+        )
+        converters[name or "default"] = AmrLogicConverter(
+            existentially_quantify_instances=quantify,
+            maximally_hoist_coreferences=hoist,
+            use_implies_for_conditions=implies,
+        )
+    multi_converter = MultiConverter(converters)
+    cases = {
+        "corpus-300": generate_corpus_amrs(300),
+        "reentrant-30x100": [
+            penman.format(generate_reentrant_amr(100, seed=seed)) for seed in range(30)
+        ],
+    }
+    print(
+        f"{len(converters)} configurations\n"
+        f"{'case':<20}{'separate (ms)':>16}{'shared (ms)':>14}{'speedup':>10}"
+    )
+    for name, amr_strs in cases.items():
+        separate_time = min(
+            repeat(
+                lambda: [
+                    converter.convert(amr_str)
+                    for amr_str in amr_strs
+                    for converter in converters.values()
+                ],
+                number=1,
+                repeat=5,
+            )
+        )
+        shared_time = min(
+            repeat(
+                lambda: [multi_converter.convert(amr_str) for amr_str in amr_strs],
+                number=1,
+                repeat=5,
+            )
+        )
+        print(
+            f"{name:<20}{separate_time * 1000:>16.1f}{shared_time * 1000:>14.1f}"
+            f"{separate_time / shared_time:>9.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Time converting a small corpus with every combination of the converter's boolean options.
+
+usage: python -m benchmarks.bench_options [--num-amrs N]
+"""
+from __future__ import annotations
+import argparse
+from itertools import product
+from random import Random
+from timeit import repeat
+
+from penman.tree import Tree
+
+from amr_logic_converter import AmrLogicConverter
+from benchmarks.generate_amrs import generate_reentrant_amr
+
+
+OPTIONS = [
+    "invert_relations",
+    "existentially_quantify_instances",
+    "use_variables_for_instances",
+    "capitalize_variables",
+    "use_implies_for_conditions",
+]
+
+
+def time_options(options: dict[str, bool], corpus: list[Tree]) -> float:
+    converter = AmrLogicConverter()
+    for option, value in options.items():
+        setattr(converter, option, value)
+
+    def convert_corpus() -> None:
+        for tree in corpus:
+            converter.convert(tree)
+
+    return min(repeat(convert_corpus, number=1, repeat=10))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--num-amrs", type=int, default=200)
+    args = parser.parse_args()
+
+    rng = Random(0)
+    corpus = [
+        generate_reentrant_amr(rng.randrange(10, 60), seed=seed)
+        for seed in range(args.num_amrs)
+    ]
+    abbreviations = " ".join(
+        "".join(word[0] for word in option.split("_")) for option in OPTIONS
+    )
+    print(f"{abbreviations:<24}{'ms':>10}{'µs/AMR':>10}")
+    for values in product([False, True], repeat=len(OPTIONS)):
+        options = dict(zip(OPTIONS, values))
+        elapsed = time_options(options, corpus)
+        flags = " ".join(
+            f"{int(value):>{len(a)}}" for value, a in zip(values, abbreviations.split())
+        )
+        print(f"{flags:<24}{elapsed * 1000:>10.2f}{elapsed / len(corpus) * 1e6:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
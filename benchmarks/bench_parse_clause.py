@@ -0,0 +1,45 @@
+"""
+Measure the throughput of parsing multi-megabyte dumps of serialized logic, one formula per line,
+with unicode and ASCII symbols.
+
+usage: python -m benchmarks.bench_parse_clause
+"""
+from __future__ import annotations
+from timeit import repeat
+
+from amr_logic_converter import AmrLogicConverter
+from amr_logic_converter.parse_clause import parse_clause
+from amr_logic_converter.serialize_clause import (
+    ASCII_SYMBOLS,
+    UNICODE_SYMBOLS,
+    serialize_clause,
+)
+from benchmarks.generate_amrs import generate_reentrant_amr
+
+
+def main() -> None:
+    converter = AmrLogicConverter(existentially_quantify_instances=True)
+    clauses = [
+        converter.convert(generate_reentrant_amr(60, seed=seed)) for seed in range(500)
+    ]
+    print(
+        f"{'symbols':<10}{'formulas':>10}{'size (MB)':>12}{'time (s)':>10}{'MB/s':>8}"
+    )
+    for name, symbols in [("unicode", UNICODE_SYMBOLS), ("ascii", ASCII_SYMBOLS)]:
+        # repeat the formulas to get a dump of a few megabytes
+        lines = [serialize_clause(clause, symbols) for clause in clauses] * 4
+        size = len("\n".join(lines).encode()) / 1_000_000
+        timing = min(
+            repeat(
+                lambda: [parse_clause(line, symbols) for line in lines],
+                number=1,
+                repeat=3,
+            )
+        )
+        print(
+            f"{name:<10}{len(lines):>10}{size:>12.1f}{timing:>10.2f}{size / timing:>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
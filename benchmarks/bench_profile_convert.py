@@ -0,0 +1,87 @@
+"""
+Profile converting a large reentrant graph: the number of closures and generators the converter
+creates and enters, the total number of function calls, the most called functions, and the peak
+memory used while converting.
+
+usage: python -m benchmarks.bench_profile_convert
+"""
+from __future__ import annotations
+import cProfile
+from inspect import CO_GENERATOR
+import pstats
+import sys
+import tracemalloc
+from timeit import repeat
+from types import FrameType
+from typing import Any, Callable
+
+
+from amr_logic_converter import AmrLogicConverter
+from benchmarks.generate_amrs import generate_reentrant_amr
+
+
+def count_closures_and_generators(func: Callable[[], object]) -> tuple[int, int]:
+    """
+    Count calls to closures defined in the converter module, which are created on the fly for
+    each edge, node or instance, and the generators it starts, while running func.
+    """
+    filename = AmrLogicConverter.convert.__code__.co_filename
+    closure_calls = 0
+    generator_frames: set[FrameType] = set()
+
+    def profile(frame: FrameType, event: str, _arg: Any) -> None:
+        nonlocal closure_calls
+        code = frame.f_code
+        if event != "call" or code.co_filename != filename:
+            return
+        if code.co_flags & CO_GENERATOR:
+            # resuming a generator reuses its frame, so only new frames are new generators
+            generator_frames.add(frame)
+        elif code.co_freevars or code.co_name == "<lambda>":
+            closure_calls += 1
+
+    sys.setprofile(profile)
+    try:
+        func()
+    finally:
+        sys.setprofile(None)
+    return closure_calls, len(generator_frames)
+
+
+def main() -> None:
+    tree = generate_reentrant_amr(2000)
+    converter = AmrLogicConverter(existentially_quantify_instances=True)
+    # warm up the interned symbols, so only the conversion itself is measured
+    converter.convert(tree)
+
+    timing = min(repeat(lambda: converter.convert(tree), number=5, repeat=5)) / 5
+    print(f"convert: {timing * 1000:.3f} ms")
+
+    closure_calls, num_generators = count_closures_and_generators(
+        lambda: converter.convert(tree)
+    )
+    print(f"closure calls: {closure_calls}, generators: {num_generators}")
+
+    profiler = cProfile.Profile()
+    profiler.runcall(converter.convert, tree)
+    stats = pstats.Stats(profiler)
+    total_calls = stats.total_calls  # type: ignore[attr-defined]
+    print(f"function calls: {total_calls}")
+    print(f"{'calls':>10}  function")
+    rows = sorted(
+        stats.stats.items(),  # type: ignore[attr-defined]
+        key=lambda item: item[1][1],
+        reverse=True,
+    )
+    for (filename, line, name), (_, num_calls, *_) in rows[:12]:
+        print(f"{num_calls:>10}  {name} ({filename.rsplit('/', 1)[-1]}:{line})")
+
+    tracemalloc.start()
+    converter.convert(tree)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"peak memory while converting: {peak / 1024:.1f} KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Compare converting a corpus with many repeated AMRs without a result cache, with an in-memory cache,
+and with a sqlite cache that's already warm from a previous run.
+
+usage: python -m benchmarks.bench_result_cache [--num-amrs N] [--num-unique N]
+"""
+from __future__ import annotations
+import argparse
+from pathlib import Path
+from random import Random
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import Optional
+
+import penman
+
+from amr_logic_converter import (
+    AmrLogicConverter,
+    MemoryResultCache,
+    ResultCache,
+    SqliteResultCache,
+)
+from benchmarks.generate_amrs import generate_reentrant_amr
+
+
+def time_corpus(result_cache: Optional[ResultCache], corpus: list[str]) -> float:
+    converter = AmrLogicConverter(
+        existentially_quantify_instances=True, result_cache=result_cache
+    )
+    start = perf_counter()
+    for amr in corpus:
+        converter.convert(amr)
+    return perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--num-amrs", type=int, default=2000)
+    parser.add_argument("--num-unique", type=int, default=200)
+    args = parser.parse_args()
+
+    rng = Random(0)
+    unique_amrs = [
+        penman.format(generate_reentrant_amr(rng.randrange(10, 60), seed=seed))
+        for seed in range(args.num_unique)
+    ]
+    corpus = [rng.choice(unique_amrs) for _ in range(args.num_amrs)]
+    with TemporaryDirectory() as tmp_dir:
+        sqlite_path = Path(tmp_dir) / "cache.sqlite"
+        time_corpus(SqliteResultCache(sqlite_path), corpus)
+        timings = {
+            "no cache": time_corpus(None, corpus),
+            "memory": time_corpus(MemoryResultCache(), corpus),
+            "sqlite (warm)": time_corpus(SqliteResultCache(sqlite_path), corpus),
+        }
+    print(f"{'cache':<16}{'seconds':>10}{'AMRs/sec':>12}")
+    for name, elapsed in timings.items():
+        print(f"{name:<16}{elapsed:>10.2f}{len(corpus) / elapsed:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
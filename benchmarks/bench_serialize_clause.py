@@ -0,0 +1,100 @@
+"""
+Compare the single-pass clause serializer against the original recursive __str__ methods on large formulas.
+
+usage: python -m benchmarks.bench_serialize_clause
+"""
+from __future__ import annotations
+from io import StringIO
+import sys
+from timeit import repeat
+from typing import Callable
+
+from amr_logic_converter import AmrLogicConverter
+from amr_logic_converter.serialize_clause import serialize_clause, write_clause
+from amr_logic_converter.types import (
+    All,
+    And,
+    Atom,
+    Clause,
+    Exists,
+    Implies,
+    Not,
+    Or,
+)
+from benchmarks.generate_amrs import (
+    generate_deep_amr,
+    generate_reentrant_amr,
+    generate_wide_amr,
+)
+
+
+def recursive_str(clause: Clause) -> str:
+    """The original recursive __str__ implementations of the logic types"""
+    if isinstance(clause, Atom):
+        return str(clause)
+    if isinstance(clause, (And, Or)):
+        operator, parenthesized = (
+            (" ∧ ", [Or, Implies])
+            if isinstance(clause, And)
+            else (" ∨ ", [And, Implies])
+        )
+        arg_strs = []
+        for arg in clause.args:
+            if type(arg) in parenthesized:
+                arg_strs.append(f"({recursive_str(arg)})")
+            else:
+                arg_strs.append(recursive_str(arg))
+        return operator.join(arg_strs)
+    if isinstance(clause, Not):
+        if type(clause.body) in [And, Or, Implies]:
+            return f"¬({recursive_str(clause.body)})"
+        return f"¬{recursive_str(clause.body)}"
+    if isinstance(clause, Implies):
+        antecedent_str = recursive_str(clause.antecedent)
+        consequent_str = recursive_str(clause.consequent)
+        if type(clause.antecedent) in [And, Or, Implies]:
+            antecedent_str = f"({antecedent_str})"
+        if type(clause.consequent) in [And, Or, Implies]:
+            consequent_str = f"({consequent_str})"
+        return f"{antecedent_str} → {consequent_str}"
+    quantifier = "∃" if isinstance(clause, Exists) else "∀"
+    assert isinstance(clause, (Exists, All))
+    return f"{quantifier}{str(clause.param)}({recursive_str(clause.body)})"
+
+
+def write_to_string_io(clause: Clause) -> str:
+    stream = StringIO()
+    write_clause(clause, stream)
+    return stream.getvalue()
+
+
+def best_time(func: Callable[[Clause], str], clause: Clause, number: int) -> float:
+    return min(repeat(lambda: func(clause), number=number, repeat=5)) / number
+
+
+def main() -> None:
+    # the recursive version needs a few stack frames per level of nesting
+    sys.setrecursionlimit(20_000)
+    converter = AmrLogicConverter(existentially_quantify_instances=True)
+    cases = {
+        "wide-2000": converter.convert(generate_wide_amr(2000)),
+        "deep-1000": converter.convert(generate_deep_amr(1000)),
+        "reentrant-2000": converter.convert(generate_reentrant_amr(2000)),
+    }
+    print(
+        f"{'case':<16}{'recursive (ms)':>16}{'serialize (ms)':>16}{'write (ms)':>12}{'speedup':>10}"
+    )
+    for name, clause in cases.items():
+        assert recursive_str(clause) == serialize_clause(clause)
+        assert write_to_string_io(clause) == serialize_clause(clause)
+        recursive = best_time(recursive_str, clause, 10)
+        serialized = best_time(serialize_clause, clause, 10)
+        written = best_time(write_to_string_io, clause, 10)
+        print(
+            f"{name:<16}{recursive * 1000:>16.3f}{serialized * 1000:>16.3f}{written * 1000:>12.3f}"
+            f"{recursive / serialized:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+"""
+Time each stage of converting synthetic and corpus-shaped AMRs separately: parsing the PENMAN
+string, building the AmrContext, converting the tree (which includes building its context),
+and serializing the logic. The results are written as JSON, to compare them across commits.
+
+usage: python -m benchmarks.bench_suite [--output results.json] [--compare baseline.json]
+"""
+from __future__ import annotations
+import argparse
+from datetime import datetime, timezone
+import json
+import platform
+from statistics import median
+import subprocess
+import sys
+from timeit import repeat
+from typing import Any, Callable, Optional, Sequence
+
+import penman
+
+from amr_logic_converter import AmrLogicConverter
+from amr_logic_converter.AmrContext import AmrContext
+from benchmarks.generate_amrs import (
+    generate_conditional_amr,
+    generate_corpus_amrs,
+    generate_deep_amr,
+    generate_document_amr,
+    generate_negated_amr,
+    generate_reentrant_amr,
+    generate_wide_amr,
+)
+
+STAGES = ["parse", "context", "convert", "serialize"]
+
+
+def build_cases() -> dict[str, list[str]]:
+    """The PENMAN strings for each case, converted as a batch"""
+    trees = {
+        "wide-1000": generate_wide_amr(1000),
+        "deep-1000": generate_deep_amr(1000),
+        "reentrant-1000": generate_reentrant_amr(1000),
+        "negated-1000": generate_negated_amr(1000),
+        "conditional-1000": generate_conditional_amr(1000),
+        "document-50x20": generate_document_amr(50, 20),
+    }
+    cases = {name: [penman.format(tree)] for name, tree in trees.items()}
+    cases["corpus-200"] = generate_corpus_amrs(200)
+    return cases
+
+
+def time_stages(
+    converter: AmrLogicConverter, amr_strs: list[str], num_repeats: int
+) -> dict[str, dict[str, float]]:
+    trees = [penman.parse(amr_str) for amr_str in amr_strs]
+    logic = [converter.convert_amr_tree(tree) for tree in trees]
+    plan = converter._get_plan()
+    stages: dict[str, Callable[[], object]] = {
+        "parse": lambda: [penman.parse(amr_str) for amr_str in amr_strs],
+        "context": lambda: [
+            AmrContext.from_amr_tree(
+                tree,
+                edge_priority=plan.edge_priority,
+                maximally_hoist_coreferences=converter.maximally_hoist_coreferences,
+            )
+            for tree in trees
+        ],
+        "convert": lambda: [converter.convert_amr_tree(tree) for tree in trees],
+        "serialize": lambda: [str(clause) for clause in logic],
+    }
+    results: dict[str, dict[str, float]] = {}
+    for stage, run in stages.items():
+        timings = repeat(run, number=1, repeat=num_repeats)
+        results[stage] = {
+            "min_ms": min(timings) * 1000,
+            "median_ms": median(timings) * 1000,
+        }
+    return results
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_suite(num_repeats: int) -> dict[str, Any]:
+    converter = AmrLogicConverter(
+        existentially_quantify_instances=True, use_implies_for_conditions=True
+    )
+    results: dict[str, Any] = {}
+    for name, amr_strs in build_cases().items():
+        results[name] = {
+            "num_amrs": len(amr_strs),
+            "num_nodes": sum(
+                len(penman.parse(amr_str).nodes()) for amr_str in amr_strs
+            ),
+            "stages": time_stages(converter, amr_strs, num_repeats),
+        }
+    return {
+        "metadata": {
+            "commit": git_commit(),
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "num_repeats": num_repeats,
+        },
+        "results": results,
+    }
+
+
+def print_results(suite: dict[str, Any], baseline: Optional[dict[str, Any]]) -> None:
+    header = f"{'case':<20}" + "".join(f"{stage + ' (ms)':>16}" for stage in STAGES)
+    print(header)
+    for name, result in suite["results"].items():
+        cells = []
+        for stage in STAGES:
+            timing = result["stages"][stage]["min_ms"]
+            cell = f"{timing:.2f}"
+            baseline_result = (baseline or {}).get("results", {}).get(name)
+            if baseline_result is not None:
+                baseline_timing = baseline_result["stages"][stage]["min_ms"]
+                cell += f" {timing / baseline_timing:>4.2f}x"
+            cells.append(f"{cell:>16}")
+        print(f"{name:<20}" + "".join(cells))
+    if baseline is not None:
+        print(
+            f"\nratios are against commit {baseline['metadata'].get('commit')}, lower is faster"
+        )
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        description=(__doc__ or "").strip().split("\n\n")[0]
+    )
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    parser.add_argument(
+        "--compare", help="compare against results written by an earlier run"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="times to run each stage (default: 5)"
+    )
+    args = parser.parse_args(argv)
+    # penman formats and parses the deep AMRs recursively
+    sys.setrecursionlimit(20_000)
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as baseline_file:
+            baseline = json.load(baseline_file)
+    suite = run_suite(args.repeat)
+    print_results(suite, baseline)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output_file:
+            json.dump(suite, output_file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Compare the memory used per atom by the slotted, frozen logic types against equivalent plain dataclasses,
+both freshly built and after a pickle round trip (as results come back from convert_many worker processes).
+
+usage: python -m benchmarks.bench_types_memory
+"""
+from __future__ import annotations
+from dataclasses import dataclass
+import pickle
+import tracemalloc
+from typing import Any, Callable
+
+from amr_logic_converter.types import Atom, Constant, Predicate, Variable
+
+
+@dataclass
+class LegacyConstant:
+    value: str
+    type: str
+    alignment: Any = None
+
+
+@dataclass
+class LegacyVariable:
+    name: str
+
+
+@dataclass
+class LegacyPredicate:
+    symbol: str
+    alignment: Any = None
+
+
+@dataclass
+class LegacyAtom:
+    predicate: LegacyPredicate
+    terms: tuple[Any, ...]
+
+
+def make_legacy_atom(i: int) -> LegacyAtom:
+    return LegacyAtom(
+        LegacyPredicate(f"pred-{i}"),
+        (LegacyVariable(f"x{i}"), LegacyConstant(f"c{i}", "symbol")),
+    )
+
+
+def make_atom(i: int) -> Atom:
+    return Atom(
+        Predicate(f"pred-{i}"),
+        (Variable(f"x{i}"), Constant(f"c{i}", "symbol")),
+    )
+
+
+def bytes_per_atom(make: Callable[[int], object], num_atoms: int) -> float:
+    # build the strings up front so only the logic objects themselves are measured
+    make(0)
+    tracemalloc.start()
+    before, _peak = tracemalloc.get_traced_memory()
+    atoms = [make(i) for i in range(num_atoms)]
+    after, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del atoms
+    return (after - before) / num_atoms
+
+
+def unpickled(make: Callable[[int], object]) -> Callable[[int], object]:
+    def make_unpickled(i: int) -> object:
+        return pickle.loads(pickle.dumps(make(i)))
+
+    return make_unpickled
+
+
+def main() -> None:
+    num_atoms = 100_000
+    print(f"{'case':<12}{'dataclass':>12}{'slotted':>12}{'saving':>10}")
+    for case, wrap in [("built", lambda make: make), ("unpickled", unpickled)]:
+        legacy = bytes_per_atom(wrap(make_legacy_atom), num_atoms)
+        slotted = bytes_per_atom(wrap(make_atom), num_atoms)
+        print(
+            f"{case:<12}{legacy:>12.1f}{slotted:>12.1f}{(1 - slotted / legacy) * 100:>9.1f}%"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+from __future__ import annotations
+from random import Random
+from typing import Callable, cast
+
+import penman
+from penman.tree import Branch, Node, Tree
+
+
+def _node(instance: str, concept: str, edges: list[Branch]) -> Node:
+    return cast(Node, (instance, [("/", concept), *edges]))
+
+
+def generate_deep_amr(depth: int) -> Tree:
+    """A single chain of nodes, each referring back to the root"""
+    node = _node(f"n{depth}", "thing", [(":mod", "n0")])
+    for i in reversed(range(depth)):
+        node = _node(f"n{i}", f"event-{i % 10:02d}", [(":ARG0", node)])
+    return Tree(node)
+
+
+def generate_wide_amr(width: int) -> Tree:
+    """A root node with many small children"""
+    children: list[Branch] = [
+        (f":op{i + 1}", _node(f"c{i}", "person", [(":named", f'"Name {i}"')]))
+        for i in range(width)
+    ]
+    return Tree(_node("r", "and", children))
+
+
+def generate_reentrant_amr(size: int, seed: int = 0) -> Tree:
+    """A random tree of the given size where roughly a third of edges are re-entrancies"""
+    rng = Random(seed)
+    child_ids: list[list[int]] = [[] for _ in range(size)]
+    for i in range(1, size):
+        child_ids[rng.randrange(i)].append(i)
+    preorder: list[int] = []
+    stack = [0]
+    while stack:
+        i = stack.pop()
+        preorder.append(i)
+        stack.extend(reversed(child_ids[i]))
+    # re-entrancies only refer back to nodes that are already defined earlier in the tree
+    references: list[list[str]] = [[] for _ in range(size)]
+    for pos in range(1, size):
+        if rng.random() < 0.5:
+            references[preorder[pos]].append(f"n{preorder[rng.randrange(pos)]}")
+    # build nodes bottom up, children always have a higher index than their parent
+    nodes: list[Node | None] = [None] * size
+    for i in reversed(range(size)):
+        edges: list[Branch] = [
+            (f":ARG{child % 3}", nodes[child]) for child in child_ids[i]
+        ]
+        edges.extend((":mod", reference) for reference in references[i])
+        if i % 7 == 3:
+            edges.append((":polarity", "-"))
+        nodes[i] = _node(f"n{i}", f"concept-{i % 20:02d}", edges)
+    return Tree(cast(Node, nodes[0]))
+
+
+def generate_document_amr(
+    num_sentences: int, sentence_size: int, seed: int = 0
+) -> Tree:
+    """A multi-sentence AMR of random sentences, where re-entrancies stay within each sentence"""
+    sentences: list[Branch] = []
+    for s in range(num_sentences):
+        sentence = generate_reentrant_amr(sentence_size, seed=seed + s)
+        # prefix instances with the sentence number so they're unique across the document
+        prefix = f"s{s}"
+        nodes: list[Node] = []
+        stack: list[Node] = [sentence.node]
+        while stack:
+            node = stack.pop()
+            nodes.append(node)
+            stack.extend(target for _role, target in node[1] if type(target) is tuple)
+        renamed: dict[str, Node] = {}
+        for instance, branches in reversed(nodes):
+            edges: list[Branch] = []
+            for role, target in branches[1:]:
+                if type(target) is tuple:
+                    edges.append((role, renamed[target[0]]))
+                elif target.startswith("n"):
+                    edges.append((role, prefix + target))
+                else:
+                    edges.append((role, target))
+            renamed[instance] = _node(prefix + instance, branches[0][1], edges)
+        sentences.append((f":snt{s + 1}", renamed[sentence.node[0]]))
+    return Tree(_node("m", "multi-sentence", sentences))
+
+
+def generate_negated_amr(size: int, seed: int = 0) -> Tree:
+    """A random re-entrant tree where roughly half the nodes have :polarity -"""
+    rng = Random(seed)
+
+    def negate(node: Node) -> Node:
+        instance, branches = node
+        if (":polarity", "-") in branches or rng.random() < 0.5:
+            return node
+        return _node(instance, branches[0][1], [*branches[1:], (":polarity", "-")])
+
+    return Tree(_map_nodes(generate_reentrant_amr(size, seed=seed).node, negate))
+
+
+def generate_conditional_amr(size: int, seed: int = 0) -> Tree:
+    """A random re-entrant tree where roughly a third of the edges between nodes are :condition edges"""
+    rng = Random(seed)
+    return _relabel_edges(
+        generate_reentrant_amr(size, seed=seed),
+        lambda role: ":condition" if rng.random() < 0.33 else role,
+    )
+
+
+_FRAMES = ["say-01", "want-01", "go-02", "see-01", "make-01", "know-01", "give-01"]
+_CONCEPTS = ["person", "country", "city", "thing", "government", "year", "problem"]
+_NAMES = ["Obama", "China", "New York", "Mary", "Toyota", "United Nations"]
+
+
+def generate_corpus_amrs(count: int, seed: int = 0) -> list[str]:
+    """
+    PENMAN strings shaped like sentences in an AMR corpus: mostly small graphs of PropBank frames
+    with some named entities, quantities, negations, alignments and a few re-entrancies
+    """
+    rng = Random(seed)
+    return [penman.format(_generate_sentence_amr(rng)) for _ in range(count)]
+
+
+def _generate_sentence_amr(rng: Random) -> Tree:
+    # sentence lengths in AMR corpora are skewed, with many short sentences and a long tail
+    size = min(int(rng.lognormvariate(2.7, 0.6)) + 2, 80)
+    instances: list[str] = []
+    token = 0
+
+    def new_instance(concept: str) -> str:
+        instance = f"{concept[0]}{len(instances)}"
+        instances.append(instance)
+        return instance
+
+    def build(depth: int) -> Node:
+        nonlocal token
+        token += 1
+        node_token = token
+        if depth > 0 and rng.random() < 0.2:
+            name_instance = new_instance("name")
+            name = rng.choice(_NAMES)
+            ops: list[Branch] = [
+                (f":op{i + 1}", f'"{part}"') for i, part in enumerate(name.split())
+            ]
+            name_node = _node(name_instance, "name", ops)
+            concept = rng.choice(_CONCEPTS[:3])
+            return _node(
+                new_instance(concept),
+                f"{concept}~e.{node_token}",
+                [(":name", name_node)],
+            )
+        concept = rng.choice(_FRAMES if depth == 0 or rng.random() < 0.5 else _CONCEPTS)
+        instance = new_instance(concept)
+        edges: list[Branch] = []
+        num_children = rng.choice([0, 1, 1, 2, 2, 3]) if len(instances) < size else 0
+        for i in range(num_children):
+            if len(instances) > 2 and rng.random() < 0.1:
+                edges.append((f":ARG{i}", rng.choice(instances[:-1])))
+            else:
+                edges.append((f":ARG{i}", build(depth + 1)))
+        if rng.random() < 0.1:
+            edges.append((":polarity", "-"))
+        if rng.random() < 0.1:
+            edges.append((":quant", str(rng.randrange(1, 1000))))
+        return _node(instance, f"{concept}~e.{node_token}", edges)
+
+    return Tree(build(0))
+
+
+def _relabel_edges(tree: Tree, relabel: Callable[[str], str]) -> Tree:
+    def relabel_node(node: Node) -> Node:
+        instance, branches = node
+        edges: list[Branch] = [
+            (relabel(role) if type(target) is tuple else role, target)
+            for role, target in branches[1:]
+        ]
+        return _node(instance, branches[0][1], edges)
+
+    return Tree(_map_nodes(tree.node, relabel_node))
+
+
+def _map_nodes(root: Node, map_node: Callable[[Node], Node]) -> Node:
+    """Rebuild the tree bottom up, mapping each node after its children are rebuilt"""
+    nodes: list[Node] = []
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        nodes.append(node)
+        stack.extend(target for _role, target in node[1] if type(target) is tuple)
+    mapped: dict[str, Node] = {}
+    for instance, branches in reversed(nodes):
+        rebuilt = cast(
+            Node,
+            (
+                instance,
+                [
+                    (role, mapped[target[0]] if type(target) is tuple else target)
+                    for role, target in branches
+                ],
+            ),
+        )
+        mapped[instance] = map_node(rebuilt)
+    return mapped[root[0]]
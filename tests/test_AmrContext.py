@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import penman
+from penman.tree import Branch
+
+from amr_logic_converter.AmrContext import AmrContext, SharedAmrAnalysis
+
+
+AMR = """
+(g / give-01
+    :polarity -
+    :ARG0 (x / person)
+    :condition (r / rain-01 :polarity -)
+    :ARG1 (b / book))
+"""
+
+
+def test_from_amr_tree_orders_edges_without_negations() -> None:
+    ctx = AmrContext.from_amr_tree(penman.parse(AMR))
+    assert [role for role, _target in ctx.get_edges_for_instance("g")] == [
+        ":ARG0",
+        ":condition",
+        ":ARG1",
+    ]
+    assert ctx.get_edges_for_instance("r") == []
+    assert ctx.negated_instances == frozenset({"g", "r"})
+    assert ctx.is_instance_negated("g")
+    assert not ctx.is_instance_negated("x")
+
+
+def test_from_amr_tree_orders_edges_by_descending_priority() -> None:
+    def condition_first(edge: Branch) -> int:
+        return 1 if edge[0] == ":condition" else 0
+
+    ctx = AmrContext.from_amr_tree(penman.parse(AMR), edge_priority=condition_first)
+    assert [role for role, _target in ctx.get_edges_for_instance("g")] == [
+        ":condition",
+        ":ARG0",
+        ":ARG1",
+    ]
+
+
+def test_shared_analysis_only_recomputes_option_dependent_parts() -> None:
+    def condition_first(edge: Branch) -> int:
+        return 1 if edge[0] == ":condition" else 0
+
+    shared_analysis = SharedAmrAnalysis(penman.parse(AMR))
+    ctx = shared_analysis.context()
+    prioritized_ctx = shared_analysis.context(edge_priority=condition_first)
+    hoisted_ctx = shared_analysis.context(maximally_hoist_coreferences=True)
+    assert prioritized_ctx.instance_node_map is ctx.instance_node_map
+    assert prioritized_ctx.scope_instance_map is ctx.scope_instance_map
+    assert prioritized_ctx.instance_edges_map is not ctx.instance_edges_map
+    assert hoisted_ctx.scope_instance_map is not ctx.scope_instance_map
+    assert hoisted_ctx.instance_edges_map is ctx.instance_edges_map
+    # contexts track what's been rendered and quantified in each conversion separately
+    ctx.mark_instance_rendered("g")
+    assert not hoisted_ctx.is_instance_rendered("g")
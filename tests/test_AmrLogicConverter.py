@@ -2,13 +2,16 @@ from __future__ import annotations
 from typing import cast
 
 import penman
+from penman.tree import Node
 import pytest
 from syrupy.assertion import SnapshotAssertion
 
 from amr_logic_converter import AmrLogicConverter
+from amr_logic_converter.AmrContext import OverrideIsProjectiveCallbackInfo
 from amr_logic_converter.AmrLogicConverter import (
     OverrideConjunctionCallbackInfo,
     OverrideQuantificationCallbackInfo,
+    determine_const_type,
 )
 from amr_logic_converter.types import All, And, Clause, Implies, Not, Variable
 from tests.test_utils import fmt_logic
@@ -395,3 +398,111 @@ def test_convert_amr_with_conditionals() -> None:
     )
     logic = implication_converter.convert(amr_str)
     assert fmt_logic(str(logic)) == fmt_logic(expected)
+
+
+def test_convert_handles_very_deep_amrs_without_recursion() -> None:
+    depth = 5000
+    node: Node = ("x5000", [("/", "thing"), (":mod", "x0")])
+    for i in reversed(range(depth)):
+        node = (f"x{i}", [("/", "thing"), (":ARG0", node)])
+    logic_str = str(converter.convert(penman.Tree(node)))
+    assert logic_str.startswith(
+        "∃x0(thing(x0) ∧ ∃x1(:ARG0(x0, x1) ∧ thing(x1) ∧ ∃x2(:ARG0(x1, x2) ∧ thing(x2) ∧ "
+    )
+    assert logic_str.endswith(
+        "∃x5000(:ARG0(x4999, x5000) ∧ thing(x5000) ∧ :mod(x5000, x0))" + ")" * depth
+    )
+
+
+def test_callback_infos_have_the_details_of_the_node_being_processed() -> None:
+    amr_str = "(b / bad-07 :polarity - :ARG1 (e / dry-01 :ARG0 (x / person) :ARG1 x))"
+    projective_infos = {}
+    quantification_infos = {}
+    conjunction_infos = {}
+
+    def override_is_projective(info: OverrideIsProjectiveCallbackInfo) -> None:
+        projective_infos[info.instance_name] = (
+            info.node[0],
+            info.depth,
+            info.is_coreferent,
+            info.is_default_hoisted,
+        )
+
+    def override_quantification(
+        _clause: Clause, info: OverrideQuantificationCallbackInfo
+    ) -> None:
+        quantification_infos[info.instance_name] = (
+            info.node[0],
+            info.depth,
+            info.is_negated,
+            str(info.bound_instance),
+        )
+
+    def override_conjunction(info: OverrideConjunctionCallbackInfo) -> None:
+        conjunction_infos[info.instance_name] = (
+            info.node[0],
+            info.depth,
+            str(info.predicate_term),
+            len(info.subterms),
+        )
+
+    callbacks_converter = AmrLogicConverter(
+        existentially_quantify_instances=True,
+        override_is_projective=override_is_projective,
+        override_quantification=override_quantification,
+        override_conjunction=override_conjunction,
+    )
+    logic = callbacks_converter.convert(amr_str)
+    assert logic == AmrLogicConverter(existentially_quantify_instances=True).convert(
+        amr_str
+    )
+    assert projective_infos == {
+        "b": ("b", 0, False, False),
+        "e": ("e", 1, False, False),
+        "x": ("x", 2, True, True),
+    }
+    assert quantification_infos == {
+        "b": ("b", 0, True, "B"),
+        "e": ("e", 1, False, "E"),
+        "x": ("x", 2, False, "X"),
+    }
+    assert conjunction_infos == {
+        "b": ("b", 0, "bad-07(B)", 1),
+        "e": ("e", 1, "dry-01(E)", 2),
+        "x": ("x", 2, "person(X)", 0),
+    }
+
+
+def test_callback_infos_can_be_compared_and_printed() -> None:
+    amr_str = "(e / giggle-01 :ARG0 (x / boy))"
+    infos: list[OverrideIsProjectiveCallbackInfo] = []
+    amr_tree = penman.parse(amr_str)
+    AmrLogicConverter(override_is_projective=infos.append).convert(amr_tree)
+    assert infos[1] == OverrideIsProjectiveCallbackInfo(
+        amr_tree=amr_tree,
+        instance_name="x",
+        node=amr_tree.node[1][1][1],
+        depth=1,
+        is_coreferent=False,
+        is_default_hoisted=False,
+    )
+    assert "instance_name='x'" in repr(infos[1])
+
+
+def test_changing_options_after_construction_changes_the_conversion() -> None:
+    amr_str = "(x / boy :ARG0-of (e / giggle-01))"
+    options_converter = AmrLogicConverter()
+    assert (
+        str(options_converter.convert(amr_str)) == "boy(x) ∧ :ARG0(e, x) ∧ giggle-01(e)"
+    )
+    options_converter.existentially_quantify_instances = True
+    options_converter.invert_relations = False
+    assert (
+        str(options_converter.convert(amr_str))
+        == "∃X(boy(X) ∧ ∃E(:ARG0-of(X, E) ∧ giggle-01(E)))"
+    )
+
+
+def test_determine_const_type() -> None:
+    assert determine_const_type('"Ms Ribble"') == "string"
+    assert determine_const_type("-") == "symbol"
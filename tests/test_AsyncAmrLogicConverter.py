@@ -0,0 +1,133 @@
+from __future__ import annotations
+import asyncio
+from threading import Event, Lock
+from typing import Any
+
+import pytest
+
+from amr_logic_converter import AmrLogicConverter, AsyncAmrLogicConverter
+from amr_logic_converter.types import Clause
+
+
+AMRS = [
+    "(e / giggle-01 :polarity - :ARG0 (x / boy))",
+    "(y / book :ARG1-of (e / read-01 :ARG0 (x / girl)))",
+    "(e / dry-01 :ARG0 (x / person) :ARG1 x)",
+]
+
+
+class BlockingConverter(AmrLogicConverter):
+    """A converter whose conversions wait until they're released, counting the AMRs converted"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.released = Event()
+        self.started: list[Any] = []
+        self._lock = Lock()
+
+    def convert(self, amr: Any, lazy: Any = False) -> Any:
+        with self._lock:
+            self.started.append(amr)
+        self.released.wait(timeout=10)
+        return super().convert(amr)
+
+
+def test_convert_matches_sync_converter() -> None:
+    converter = AmrLogicConverter(existentially_quantify_instances=True)
+
+    async def convert_all() -> list[Clause]:
+        async with AsyncAmrLogicConverter(converter) as async_converter:
+            return await asyncio.gather(*map(async_converter.convert, AMRS))
+
+    assert asyncio.run(convert_all()) == [converter.convert(amr) for amr in AMRS]
+
+
+def test_convert_in_process_pool() -> None:
+    converter = AmrLogicConverter(capitalize_variables=False)
+
+    async def convert_all() -> list[Clause]:
+        async with AsyncAmrLogicConverter(
+            converter, executor="process", max_workers=2
+        ) as async_converter:
+            return await asyncio.gather(*map(async_converter.convert, AMRS))
+
+    assert asyncio.run(convert_all()) == [converter.convert(amr) for amr in AMRS]
+
+
+def test_convert_raises_conversion_errors() -> None:
+    async def convert_invalid() -> None:
+        async with AsyncAmrLogicConverter() as async_converter:
+            await async_converter.convert("(e / giggle-01 :ARG0 (x / boy)")
+
+    with pytest.raises(Exception):
+        asyncio.run(convert_invalid())
+
+
+def test_identical_amrs_in_flight_share_a_conversion() -> None:
+    converter = BlockingConverter()
+
+    async def convert_all() -> list[Clause]:
+        async with AsyncAmrLogicConverter(converter) as async_converter:
+            calls = [async_converter.convert(AMRS[0]) for _ in range(5)]
+            calls.append(async_converter.convert(AMRS[1]))
+            results = asyncio.gather(*calls)
+            await asyncio.sleep(0.05)
+            assert async_converter.num_in_flight == 2
+            converter.released.set()
+            logic = await results
+            assert async_converter.num_in_flight == 0
+            return logic
+
+    logic = asyncio.run(convert_all())
+    assert sorted(converter.started) == sorted(AMRS[:2])
+    assert all(clause is logic[0] for clause in logic[:5])
+
+
+def test_concurrency_is_bounded() -> None:
+    converter = BlockingConverter()
+
+    async def convert_all() -> None:
+        async with AsyncAmrLogicConverter(
+            converter, max_workers=4, max_concurrency=1
+        ) as async_converter:
+            results = asyncio.gather(*map(async_converter.convert, AMRS))
+            await asyncio.sleep(0.05)
+            assert len(converter.started) == 1
+            converter.released.set()
+            await results
+
+    asyncio.run(convert_all())
+    assert sorted(converter.started) == sorted(AMRS)
+
+
+def test_timeouts_only_give_up_on_their_own_call() -> None:
+    converter = BlockingConverter()
+
+    async def convert_with_timeouts() -> None:
+        async with AsyncAmrLogicConverter(converter) as async_converter:
+            patient_call = asyncio.ensure_future(async_converter.convert(AMRS[0]))
+            with pytest.raises(asyncio.TimeoutError):
+                await async_converter.convert(AMRS[0], timeout=0.05)
+            converter.released.set()
+            assert await patient_call == AmrLogicConverter().convert(AMRS[0])
+
+    asyncio.run(convert_with_timeouts())
+    assert converter.started == [AMRS[0]]
+
+
+def test_conversions_waiting_for_a_slot_are_cancelled_after_timeouts() -> None:
+    converter = BlockingConverter()
+
+    async def convert_with_timeouts() -> None:
+        async with AsyncAmrLogicConverter(
+            converter, max_concurrency=1, timeout=0.05
+        ) as async_converter:
+            for amr in AMRS:
+                with pytest.raises(asyncio.TimeoutError):
+                    await async_converter.convert(amr)
+            converter.released.set()
+            assert await async_converter.convert(AMRS[2], timeout=None) is not None
+
+    asyncio.run(convert_with_timeouts())
+    # only the first AMR started before timing out, and the last was converted again
+    assert converter.started == [AMRS[0], AMRS[2]]
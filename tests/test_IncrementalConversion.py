@@ -0,0 +1,122 @@
+from __future__ import annotations
+from random import Random
+
+import penman
+import pytest
+
+from amr_logic_converter import AmrLogicConverter, IncrementalConversion
+
+
+AMR = """
+(m / multi-sentence
+    :snt1 (g / give-01
+        :ARG0 (x / person :named "Ms Ribble")
+        :ARG2 (y / child)
+        :ARG1 (z / envelope :poss x))
+    :snt2 (r / read-01
+        :ARG0 (c / child)
+        :ARG1 (b / book
+            :condition (s / sun :polarity -))))
+"""
+
+REENTRANT_AMR = """
+(w / want-01
+    :ARG0 (b / boy)
+    :ARG1 (b2 / believe-01
+        :ARG0 (g / girl
+            :ARG0-of (l / like-01 :ARG1 b))
+        :ARG1 (h / have-03
+            :ARG0 b
+            :ARG1 (d / dog :poss g))))
+"""
+
+
+def assert_matches_full_conversion(conversion: IncrementalConversion) -> None:
+    assert conversion.logic == conversion.converter.convert(conversion.tree)
+
+
+@pytest.mark.parametrize(
+    "converter",
+    [
+        AmrLogicConverter(),
+        AmrLogicConverter(existentially_quantify_instances=True),
+        AmrLogicConverter(maximally_hoist_coreferences=True),
+        AmrLogicConverter(use_implies_for_conditions=True, invert_relations=False),
+    ],
+)
+def test_edits_match_full_conversion(converter: AmrLogicConverter) -> None:
+    conversion = IncrementalConversion(converter, AMR)
+    assert_matches_full_conversion(conversion)
+    conversion.set_concept("y", "adult")
+    assert_matches_full_conversion(conversion)
+    conversion.set_polarity("b", False)
+    assert_matches_full_conversion(conversion)
+    conversion.set_polarity("s", True)
+    assert_matches_full_conversion(conversion)
+    conversion.add_edge("c", ":ARG0-of", "r")
+    assert_matches_full_conversion(conversion)
+    conversion.add_edge("b", ":mod", ("n", [("/", "new"), (":poss", "c")]))
+    assert_matches_full_conversion(conversion)
+    conversion.remove_edge("z", ":poss")
+    assert_matches_full_conversion(conversion)
+    conversion.remove_edge("m", ":snt1", "g")
+    assert_matches_full_conversion(conversion)
+
+
+def test_edits_update_the_tree() -> None:
+    conversion = IncrementalConversion(
+        AmrLogicConverter(), "(d / dog :ARG0-of (b / bark-01))"
+    )
+    conversion.set_concept("d", "cat")
+    conversion.set_polarity("b", False)
+    conversion.add_edge("d", ":mod", '"black"')
+    assert conversion.tree == penman.parse(
+        '(d / cat :ARG0-of (b / bark-01 :polarity -) :mod "black")'
+    )
+    conversion.remove_edge("d", ":mod", '"black"')
+    conversion.set_polarity("b", True)
+    assert conversion.tree == penman.parse("(d / cat :ARG0-of (b / bark-01))")
+
+
+def test_unedited_subtrees_are_not_converted_again() -> None:
+    conversion = IncrementalConversion(AmrLogicConverter(), AMR)
+    old_logic = conversion.logic
+    snt2_logic = conversion._subtree_results["r"].logic
+    conversion.set_concept("y", "adult")
+    assert conversion.logic != old_logic
+    assert conversion._subtree_results["r"].logic is snt2_logic
+    assert_matches_full_conversion(conversion)
+
+
+def test_random_edits_match_full_conversion() -> None:
+    rng = Random(0)
+    for amr in [AMR, REENTRANT_AMR]:
+        converter = AmrLogicConverter(existentially_quantify_instances=True)
+        conversion = IncrementalConversion(converter, amr)
+        instances = [instance for instance, _branches in conversion.tree.nodes()]
+        for i in range(30):
+            instance_name = rng.choice(instances)
+            edit = i % 3
+            if edit == 0:
+                conversion.set_concept(instance_name, f"edited-{i}")
+            elif edit == 1:
+                conversion.set_polarity(instance_name, rng.random() < 0.5)
+            else:
+                conversion.add_edge(instance_name, ":mod", f'"value {i}"')
+            assert_matches_full_conversion(conversion)
+
+
+def test_rejects_converters_with_callbacks() -> None:
+    converter = AmrLogicConverter(override_quantification=lambda clause, info: None)
+    with pytest.raises(ValueError):
+        IncrementalConversion(converter, AMR)
+
+
+def test_edits_to_missing_instances_or_edges_raise() -> None:
+    conversion = IncrementalConversion(AmrLogicConverter(), AMR)
+    with pytest.raises(ValueError):
+        conversion.set_concept("q", "thing")
+    with pytest.raises(ValueError):
+        conversion.remove_edge("y", ":ARG0")
+    with pytest.raises(ValueError):
+        conversion.add_edge("y", ":ARG0", ("x", [("/", "person")]))
@@ -0,0 +1,117 @@
+from __future__ import annotations
+import pickle
+
+from penman.surface import Alignment
+import pytest
+
+from amr_logic_converter import AmrLogicConverter
+from amr_logic_converter.InternTable import InternTable, ParseCacheInfo
+from amr_logic_converter.types import (
+    And,
+    Atom,
+    Clause,
+    Constant,
+    Exists,
+    Predicate,
+    Variable,
+)
+
+
+def test_intern_table_shares_equal_symbols() -> None:
+    table = InternTable()
+    assert table.predicate(":ARG0~2") is table.predicate(":ARG0~2")
+    assert table.predicate(":ARG0~2") == Predicate(":ARG0", Alignment((2,)))
+    assert table.predicate(":ARG0~2") is not table.predicate(":ARG0")
+    assert table.variable("X") is table.variable("X")
+    assert table.constant('"Bob"', "string") is table.constant('"Bob"', "string")
+    assert table.constant('"Bob"', "string") == Constant('"Bob"', "string")
+    assert table.constant("b", "instance") is not table.constant("b", "symbol")
+
+
+def test_intern_table_inverts_predicates() -> None:
+    table = InternTable()
+    assert table.inverted_predicate(":ARG0-of~3") == Predicate(":ARG0", Alignment((3,)))
+    assert table.inverted_predicate(":ARG0-of~3") is table.inverted_predicate(
+        ":ARG0-of~3"
+    )
+
+
+def test_intern_table_evicts_oldest_symbols_when_full() -> None:
+    table = InternTable(max_size=2)
+    x = table.variable("X")
+    table.variable("Y")
+    table.variable("Z")
+    assert len(table) == 2
+    assert table.variable("X") is not x
+    assert table.variable("X") == x
+
+
+def test_intern_table_with_max_size_0_never_interns() -> None:
+    table = InternTable(max_size=0)
+    assert table.variable("X") is not table.variable("X")
+    assert len(table) == 0
+
+
+def test_intern_table_rejects_negative_max_size() -> None:
+    with pytest.raises(ValueError):
+        InternTable(max_size=-1)
+
+
+def test_intern_table_is_pickled_empty() -> None:
+    table = InternTable(max_size=10)
+    table.variable("X")
+    unpickled = pickle.loads(pickle.dumps(table))
+    assert unpickled.max_size == 10
+    assert len(unpickled) == 0
+
+
+def test_converter_shares_symbols_between_conversions() -> None:
+    converter = AmrLogicConverter(existentially_quantify_instances=True)
+    logic1 = converter.convert("(x / boy :ARG0-of (e / giggle-01))")
+    logic2 = converter.convert("(x / boy :ARG0-of (e / sing-01))")
+    # ∃X(boy(X) ∧ ∃E(:ARG0(E, X) ∧ giggle-01(E)))
+    boy1, role1, _giggle = _atoms(logic1)
+    boy2, role2, _sing = _atoms(logic2)
+    assert boy1.predicate is boy2.predicate
+    assert boy1.terms[0] is boy2.terms[0]
+    assert role1.predicate is role2.predicate
+    assert role1.predicate == Predicate(":ARG0")
+    assert role1.terms == (Variable("E"), Variable("X"))
+
+
+def _atoms(logic: Clause) -> list[Atom]:
+    if isinstance(logic, Atom):
+        return [logic]
+    if isinstance(logic, And):
+        return [atom for arg in logic.args for atom in _atoms(arg)]
+    assert isinstance(logic, Exists)
+    return _atoms(logic.body)
+
+
+def test_intern_table_caches_parsed_symbols() -> None:
+    table = InternTable(max_size=0, parse_cache_size=2)
+    table.predicate(":ARG0~2")
+    table.predicate(":ARG0~2")
+    table.constant("b~3", "instance")
+    table.constant("b~3", "symbol")
+    info = table.parse_cache_info()
+    assert info == ParseCacheInfo(hits=2, misses=2, maxsize=2, currsize=2)
+    table.clear()
+    assert table.parse_cache_info().currsize == 0
+
+
+def test_intern_table_only_parses_symbols_that_arent_interned() -> None:
+    table = InternTable()
+    table.predicate(":ARG0")
+    table.predicate(":ARG0")
+    info = table.parse_cache_info()
+    assert (info.hits, info.misses) == (0, 1)
+
+
+def test_converter_exposes_parse_cache_info() -> None:
+    converter = AmrLogicConverter(intern_table=InternTable(max_size=0))
+    converter.convert("(x / boy :ARG0-of (e / giggle-01 :ARG1 (y / boy)))")
+    info = converter.parse_cache_info()
+    # boy, x, :ARG0-of, e, giggle-01, :ARG1 and y are each parsed once
+    assert info.misses == 7
+    assert info.hits > 0
@@ -0,0 +1,126 @@
+from __future__ import annotations
+from collections import Counter
+
+import pytest
+
+from amr_logic_converter import AmrLogicConverter, LazyConversion, Quantification
+from amr_logic_converter.types import Atom, Clause, Constant, Predicate, Variable
+
+
+AMR = """
+(w / want-01~2
+    :polarity -
+    :ARG0 (b / boy~1)
+    :ARG1 (b2 / believe-01
+        :ARG0 (g / girl~4 :named "Mary")
+        :ARG1 b
+        :condition (r / rain-01)))
+"""
+
+
+def clause_atoms(clause: Clause) -> list[Atom]:
+    atoms: list[Atom] = []
+    clauses = [clause]
+    while clauses:
+        current = clauses.pop()
+        if isinstance(current, Atom):
+            atoms.append(current)
+        elif hasattr(current, "args"):
+            clauses.extend(current.args)
+        elif hasattr(current, "body"):
+            clauses.append(current.body)
+        else:
+            clauses.extend([current.antecedent, current.consequent])
+    return atoms
+
+
+@pytest.mark.parametrize(
+    "converter",
+    [
+        AmrLogicConverter(),
+        AmrLogicConverter(existentially_quantify_instances=True),
+        AmrLogicConverter(use_implies_for_conditions=True, invert_relations=False),
+    ],
+)
+def test_lazy_parts_match_the_full_formula(converter: AmrLogicConverter) -> None:
+    conversion = converter.convert(AMR, lazy=True)
+    assert isinstance(conversion, LazyConversion)
+    full_logic = converter.convert(AMR)
+    assert Counter(conversion.atoms) == Counter(clause_atoms(full_logic))
+    assert conversion.predicate_symbols == frozenset(
+        atom.symbol for atom in clause_atoms(full_logic)
+    )
+    assert conversion.clause == full_logic
+
+
+def test_atoms_are_built_without_the_formula() -> None:
+    conversion = AmrLogicConverter().convert(AMR, lazy=True)
+    assert conversion.atoms[:3] == [
+        Predicate.from_amr_str("want-01~2")(Constant("w", "instance")),
+        Predicate.from_amr_str(":ARG0")(
+            Constant("w", "instance"), Constant("b", "instance")
+        ),
+        Predicate.from_amr_str(":ARG1")(
+            Constant("w", "instance"), Constant("b2", "instance")
+        ),
+    ]
+    assert conversion._clause is None
+
+
+def test_alignments() -> None:
+    conversion = AmrLogicConverter().convert(AMR, lazy=True)
+    assert [
+        (str(symbol), str(alignment)) for symbol, alignment in conversion.alignments
+    ] == [("want-01", "~2"), ("boy", "~1"), ("girl", "~4")]
+
+
+def test_quantifier_prefix() -> None:
+    converter = AmrLogicConverter(existentially_quantify_instances=True)
+    prefix = converter.convert(AMR, lazy=True).quantifier_prefix
+    # ¬∃W(∃B(... ∃B2(... ∃R(...) ... ∃G(...) ...)))
+    assert prefix[:2] == [
+        Quantification(
+            instance_name="w",
+            bound_instance=Variable("W"),
+            scope="w",
+            is_existential=True,
+            is_negated=True,
+        ),
+        Quantification(
+            instance_name="b",
+            bound_instance=Variable("B"),
+            scope="w",
+            is_existential=True,
+            is_negated=False,
+        ),
+    ]
+    assert [quantification.instance_name for quantification in prefix] == [
+        "w",
+        "b",
+        "b2",
+        "g",
+        "r",
+    ]
+
+
+def test_quantifier_prefix_only_includes_negations_without_existentials() -> None:
+    prefix = AmrLogicConverter().convert(AMR, lazy=True).quantifier_prefix
+    assert [quantification.instance_name for quantification in prefix] == ["w"]
+
+
+def test_atoms_and_quantifiers_skip_dropped_conditions() -> None:
+    # only the last :condition of an instance is kept in the formula
+    amr = "(w / want-01 :condition (r / rain-01) :condition (s / snow-01 :polarity -))"
+    converter = AmrLogicConverter(existentially_quantify_instances=True)
+    conversion = converter.convert(amr, lazy=True)
+    full_logic = converter.convert(amr)
+    assert Counter(conversion.atoms) == Counter(clause_atoms(full_logic))
+    assert {
+        quantification.instance_name for quantification in conversion.quantifier_prefix
+    } == {"w", "s"}
+
+
+def test_lazy_conversion_rejects_conjunction_and_quantification_callbacks() -> None:
+    converter = AmrLogicConverter(override_conjunction=lambda info: None)
+    with pytest.raises(ValueError):
+        converter.convert(AMR, lazy=True)
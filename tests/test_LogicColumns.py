@@ -0,0 +1,140 @@
+from __future__ import annotations
+import csv
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from amr_logic_converter import AmrLogicConverter, LogicColumns
+
+
+AMRS = [
+    "(e / giggle-01~2 :polarity - :ARG0 (x / boy~1))",
+    '(e / give-01 :ARG0 (x / person :named "Ms Ribble") :ARG2 (y / child))',
+]
+
+
+def atom_rows(columns: LogicColumns) -> list[tuple[Any, ...]]:
+    tables = columns.to_dict()
+    symbols = tables["predicates"]["symbol"]
+    values = tables["terms"]["value"]
+    atoms = tables["atoms"]
+    return [
+        (
+            amr_index,
+            symbols[predicate_id],
+            tuple(values[term_id] for term_id in (arg0, arg1)[:arity]),
+            scope_id,
+            is_negated,
+        )
+        for amr_index, predicate_id, arity, arg0, arg1, scope_id, is_negated in zip(
+            atoms["amr_index"],
+            atoms["predicate_id"],
+            atoms["arity"],
+            atoms["arg0_term_id"],
+            atoms["arg1_term_id"],
+            atoms["scope_id"],
+            atoms["is_negated"],
+        )
+    ]
+
+
+def test_convert_to_columns() -> None:
+    converter = AmrLogicConverter(existentially_quantify_instances=True)
+    columns = converter.convert_to_columns(AMRS)
+    assert columns.num_amrs == 2
+    tables = columns.to_dict()
+    # ¬∃E(giggle-01(E) ∧ ∃X(:ARG0(E, X) ∧ boy(X)))
+    assert tables["scopes"]["kind"][:3] == ["exists", "exists", "not"]
+    assert list(tables["scopes"]["parent_scope_id"][:3]) == [1, 2, -1]
+    assert atom_rows(columns)[:3] == [
+        (0, "boy", ("X",), 0, True),
+        (0, ":ARG0", ("E", "X"), 0, True),
+        (0, "giggle-01", ("E",), 1, True),
+    ]
+    assert (1, "give-01", ("E",), 5, False) in atom_rows(columns)
+    assert tables["terms"]["kind"][tables["terms"]["value"].index("Ms Ribble")] == (
+        "string"
+    )
+    assert ("giggle-01", "~2") in zip(
+        tables["predicates"]["symbol"], tables["predicates"]["alignment"]
+    )
+
+
+def test_convert_to_columns_with_implications() -> None:
+    converter = AmrLogicConverter(use_implies_for_conditions=True)
+    columns = converter.convert_to_columns(
+        ["(g / go-02 :ARG0 (b / boy) :condition (r / rain-01 :polarity -))"]
+    )
+    assert columns.to_dict()["scopes"]["kind"] == [
+        "not",
+        "antecedent",
+        "consequent",
+        "implies",
+    ]
+    # ¬(rain-01(r)) → (go-02(g) ∧ :ARG0(g, b) ∧ boy(b))
+    assert list(columns.to_dict()["scopes"]["parent_scope_id"]) == [1, 3, 3, -1]
+    assert atom_rows(columns) == [
+        (0, "rain-01", ("r",), 0, True),
+        (0, "boy", ("b",), 2, False),
+        (0, ":ARG0", ("g", "b"), 2, False),
+        (0, "go-02", ("g",), 2, False),
+    ]
+
+
+def test_convert_to_columns_leaves_out_dropped_conditions() -> None:
+    converter = AmrLogicConverter()
+    columns = converter.convert_to_columns(
+        ["(w / want-01 :condition (r / rain-01 :polarity -) :condition (s / snow-01))"]
+    )
+    # only the last :condition of an instance is kept in the formula
+    assert atom_rows(columns) == [
+        (0, "snow-01", ("s",), -1, False),
+        (0, ":condition", ("w", "s"), -1, False),
+        (0, "want-01", ("w",), -1, False),
+    ]
+    assert columns.num_scopes == 0
+
+
+def test_convert_to_columns_appends_and_discards_failed_amrs() -> None:
+    converter = AmrLogicConverter()
+    columns = converter.convert_to_columns(AMRS[:1])
+    with pytest.raises(IndexError):
+        # :ARG1 references x before its node
+        converter.convert_to_columns(
+            [AMRS[1], "(e / see-01 :ARG1 x :ARG0 (x / boy))"], columns
+        )
+    assert columns.num_amrs == 2
+    converter.convert_to_columns(AMRS[1:], columns)
+    assert columns.num_amrs == 3
+    assert [row[0] for row in atom_rows(columns)] == [0] * 3 + [1] * 6 + [2] * 6
+
+
+def test_write_csv(tmp_path: Path) -> None:
+    columns = AmrLogicConverter().convert_to_columns(AMRS)
+    columns.write_csv(tmp_path)
+    with open(tmp_path / "atoms.csv", newline="") as csv_file:
+        rows = list(csv.reader(csv_file))
+    assert rows[0] == [
+        "atom_id",
+        "amr_index",
+        "scope_id",
+        "predicate_id",
+        "arity",
+        "arg0_term_id",
+        "arg1_term_id",
+        "is_negated",
+    ]
+    assert len(rows) == columns.num_atoms + 1
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "atoms.csv",
+        "predicates.csv",
+        "scopes.csv",
+        "terms.csv",
+    ]
+
+
+def test_convert_to_columns_rejects_callbacks() -> None:
+    converter = AmrLogicConverter(override_conjunction=lambda info: None)
+    with pytest.raises(ValueError):
+        converter.convert_to_columns(AMRS)
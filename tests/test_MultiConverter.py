@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import penman
+import pytest
+
+from amr_logic_converter import (
+    AmrLogicConverter,
+    ConversionMetrics,
+    MemoryResultCache,
+    MultiConverter,
+)
+
+
+AMRS = [
+    "(e / giggle-01 :polarity - :ARG0 (x / boy))",
+    """
+    (b / bad-07
+        :polarity -
+        :ARG1 (e / dry-01
+            :ARG0 (x / person :named "Mr Krupp")
+            :ARG1 x))
+    """,
+    "(g / go-02 :ARG0 (b / boy) :condition (r / rain-01 :polarity -))",
+]
+
+
+def make_converters() -> dict[str, AmrLogicConverter]:
+    return {
+        "default": AmrLogicConverter(),
+        "quantified": AmrLogicConverter(existentially_quantify_instances=True),
+        "hoisted": AmrLogicConverter(
+            existentially_quantify_instances=True, maximally_hoist_coreferences=True
+        ),
+        "implies": AmrLogicConverter(use_implies_for_conditions=True),
+    }
+
+
+@pytest.mark.parametrize("amr", AMRS)
+def test_multi_converter_matches_each_converter(amr: str) -> None:
+    converters = make_converters()
+    logic = MultiConverter(converters).convert(amr)
+    assert list(logic) == list(converters)
+    for name, converter in converters.items():
+        assert logic[name] == converter.convert(amr)
+
+
+def test_multi_converter_accepts_trees_and_graphs() -> None:
+    converter = MultiConverter(make_converters())
+    assert converter.convert(penman.parse(AMRS[1])) == converter.convert(AMRS[1])
+    assert converter.convert(penman.decode(AMRS[1])) == converter.convert(AMRS[1])
+
+
+def test_multi_converter_uses_result_caches_and_metrics_sinks() -> None:
+    recorded: list[ConversionMetrics] = []
+
+    class ListSink:
+        def record(self, metrics: ConversionMetrics) -> None:
+            recorded.append(metrics)
+
+    cache = MemoryResultCache()
+    converter = MultiConverter(
+        {
+            "cached": AmrLogicConverter(result_cache=cache),
+            "measured": AmrLogicConverter(metrics_sink=ListSink()),
+        }
+    )
+    logic = converter.convert(AMRS[0])
+    assert len(cache) == 1
+    assert converter.convert(AMRS[0])["cached"] is logic["cached"]
+    # the AMR is analyzed once for all converters, outside of any converter's metrics
+    assert "analyze" not in recorded[0].stage_seconds
+    assert recorded[0].num_instances == 2
+
+
+def test_multi_converter_requires_converters() -> None:
+    with pytest.raises(ValueError):
+        MultiConverter({})
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import pytest
+from penman import parse
+
+from amr_logic_converter.analyze_amr_tree import analyze_amr_tree
+from amr_logic_converter.extract_instances_from_amr_tree import (
+    extract_instances_from_amr_tree,
+)
+from amr_logic_converter.find_coreferent_instances import find_coreferent_instances
+from amr_logic_converter.find_instance_depths import find_instance_depths
+from amr_logic_converter.map_instances_lca import map_instances_lca
+from amr_logic_converter.map_instances_to_nodes import map_instances_to_nodes
+
+
+@pytest.mark.parametrize(
+    "amr_str",
+    [
+        """
+    (e / give-01
+        :ARG0 (x / person :named "Ms Ribble")
+        :ARG2 (y / child)
+        :ARG1 (z / envelope))
+    """,
+        """
+    (e / dry-01
+        :ARG0 (x / person
+            :ARG0-of (g / giggle-01
+                :polarity - ))
+        :ARG1 (
+            z / dog
+                :ARG0-of (w / wash-01
+                    :ARG1 z)))
+    """,
+        """
+    (s / smurf
+        :ARG0 s
+        :ARG1 s)
+    """,
+        """
+    (s / sing-01
+        :ARG0 (b / boy)
+        :condition (g / give-01
+            :ARG1 (m / money)
+            :ARG2 b))
+    """,
+        """
+    (p3 / possible-01~2
+        :ARG1 (u / understand-01~2
+            :ARG1 (u2 / upset-01~8
+                :ARG0 (g / get-01~13
+                    :ARG0 (y / you~4)
+                    :ARG1 (p4 / present~18
+                        :mod (f / festival~17
+                            :name (n / name~17
+                                :op1 "Christmas"~17)))
+                    :ARG4 (p2 / person~15
+                        :ARG0-of (h2 / have-rel-role-91~15
+                            :ARG1 y
+                            :ARG2 (n2 / nephew~15)))
+                    :polarity -~12)
+                :ARG1 (p / person~5
+                    :ARG0-of (h / have-rel-role-91~5
+                        :ARG1 y
+                        :ARG2 (s / sibling~5))))))
+    """,
+    ],
+)
+def test_analyze_amr_tree_matches_individual_passes(amr_str: str) -> None:
+    tree = parse(amr_str)
+    instances = extract_instances_from_amr_tree(tree)
+    analysis = analyze_amr_tree(tree)
+    assert analysis.instances == instances
+    assert analysis.coreferent_instances == find_coreferent_instances(tree, instances)
+    assert analysis.instance_node_map == map_instances_to_nodes(tree, instances)
+    assert analysis.instance_depths_map == find_instance_depths(tree, instances)
+    assert analysis.instance_lca_map == map_instances_lca(tree, instances)
+
+
+def test_analyze_amr_tree_finds_lca_of_references_in_sibling_branches() -> None:
+    amr_str = """
+    (a / and
+        :op1 (b / bark-01
+            :ARG0 (d / dog))
+        :op2 (w / wag-01
+            :ARG0 (t / tail
+                :part-of d)))
+    """
+    analysis = analyze_amr_tree(parse(amr_str))
+    assert analysis.instance_lca_map["d"] == "a"
+    assert analysis.instance_lca_map["t"] == "t"
+    assert analysis.instance_depths_map["d"] == 2
+    assert analysis.coreferent_instances == frozenset({"d"})
@@ -0,0 +1,109 @@
+from __future__ import annotations
+from pathlib import Path
+
+import pytest
+
+from amr_logic_converter import AmrLogicConverter
+from amr_logic_converter.binary_clause import (
+    ClauseFileReader,
+    ClauseFileWriter,
+    SymbolTable,
+    decode_clause,
+    encode_clause,
+)
+from amr_logic_converter.types import (
+    All,
+    And,
+    Constant,
+    Implies,
+    Not,
+    Or,
+    Predicate,
+    Variable,
+)
+
+
+converter = AmrLogicConverter(existentially_quantify_instances=True)
+
+CLAUSES = [
+    converter.convert(
+        '(w / want-01~e.2 :polarity - :ARG0~e.5 (b / boy~1) :ARG1 (g / girl :named "Mary"~4 :quant 5))'
+    ),
+    AmrLogicConverter(use_implies_for_conditions=True).convert(
+        "(g / go-02 :ARG0 (b / boy) :condition (r / rain-01 :polarity -))"
+    ),
+    All(
+        Variable("X"),
+        Or(
+            Predicate("P")(Variable("X")),
+            Not(Predicate("Q")(Constant('"a"', "string"))),
+        ),
+    ),
+    Implies(And(), Or()),
+]
+
+
+def test_encode_and_decode_clauses() -> None:
+    symbols = SymbolTable()
+    for clause in CLAUSES:
+        assert decode_clause(encode_clause(clause, symbols), symbols) == clause
+
+
+def test_symbols_are_shared_between_clauses() -> None:
+    symbols = SymbolTable()
+    encode_clause(CLAUSES[0], symbols)
+    num_symbols = len(symbols)
+    encode_clause(CLAUSES[0], symbols)
+    assert len(symbols) == num_symbols
+    copied_symbols = SymbolTable()
+    copied_symbols.add_from_bytes(symbols.to_bytes())
+    assert copied_symbols.symbols == symbols.symbols
+    assert [str(alignment) for alignment in copied_symbols.alignments] == [
+        "~e.2",
+        "~e.5",
+        "~1",
+        "~4",
+    ]
+
+
+def test_encode_wide_symbol_ids() -> None:
+    symbols = SymbolTable()
+    for i in range(70_000):
+        symbols.symbol_id(Variable(f"X{i}"))
+    clause = Predicate("P")(Variable("X69999"))
+    data = encode_clause(clause, symbols)
+    assert decode_clause(data, symbols) == clause
+
+
+def test_write_and_read_clause_file(tmp_path: Path) -> None:
+    path = tmp_path / "logic.bin"
+    with ClauseFileWriter(path) as writer:
+        assert writer.append(CLAUSES[0]) == 0
+        assert writer.append(CLAUSES[1]) == 1
+    # opening an existing file appends to it
+    with ClauseFileWriter(path) as writer:
+        assert writer.append(CLAUSES[2]) == 2
+        writer.append(CLAUSES[3])
+    with ClauseFileReader(path) as reader:
+        assert len(reader) == 4
+        assert reader[2] == CLAUSES[2]
+        assert reader[0] == CLAUSES[0]
+        assert list(reader) == CLAUSES
+
+
+def test_read_clause_file_that_was_not_closed(tmp_path: Path) -> None:
+    path = tmp_path / "logic.bin"
+    writer = ClauseFileWriter(path)
+    writer.append(CLAUSES[0])
+    writer.append(CLAUSES[1])
+    writer._file.flush()
+    with ClauseFileReader(path) as reader:
+        assert list(reader) == CLAUSES[:2]
+    writer.close()
+
+
+def test_read_rejects_other_files(tmp_path: Path) -> None:
+    path = tmp_path / "logic.txt"
+    path.write_text("not a clause file")
+    with pytest.raises(ValueError):
+        ClauseFileReader(path)
@@ -0,0 +1,107 @@
+from __future__ import annotations
+import json
+from pathlib import Path
+
+import pytest
+
+from amr_logic_converter.cli import main
+
+
+AMRS = """
+# ::id a1
+(e / giggle-01
+    :polarity -
+    :ARG0 (x / boy))
+
+# ::id a2
+(y / book
+    :ARG1-of (e / read-01
+        :ARG0 (x / girl)))
+"""
+
+
+def test_main_writes_one_logic_line_per_amr(tmp_path: Path) -> None:
+    input_path = tmp_path / "input.amr"
+    output_path = tmp_path / "output.txt"
+    input_path.write_text(AMRS)
+    assert main([str(input_path), "-o", str(output_path), "--progress-every", "0"]) == 0
+    assert output_path.read_text().splitlines() == [
+        "¬(giggle-01(e) ∧ :ARG0(e, x) ∧ boy(x))",
+        "book(y) ∧ :ARG1(e, y) ∧ read-01(e) ∧ :ARG0(e, x) ∧ girl(x)",
+    ]
+
+
+def test_main_writes_ascii_logic(tmp_path: Path) -> None:
+    input_path = tmp_path / "input.amr"
+    output_path = tmp_path / "output.txt"
+    input_path.write_text(AMRS)
+    exit_code = main(
+        [str(input_path), "-o", str(output_path), "--ascii", "--progress-every", "0"]
+    )
+    assert exit_code == 0
+    assert output_path.read_text().splitlines() == [
+        "~(giggle-01(e) & :ARG0(e, x) & boy(x))",
+        "book(y) & :ARG1(e, y) & read-01(e) & :ARG0(e, x) & girl(x)",
+    ]
+
+
+def test_main_writes_jsonl_with_converter_options(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    input_path = tmp_path / "input.amr"
+    input_path.write_text(AMRS)
+    exit_code = main(
+        [str(input_path), "--format", "jsonl", "--existentially-quantify-instances"]
+    )
+    assert exit_code == 0
+    captured = capsys.readouterr()
+    records = [json.loads(line) for line in captured.out.splitlines()]
+    assert records == [
+        {
+            "index": 0,
+            "id": "a1",
+            "logic": "¬∃E(giggle-01(E) ∧ ∃X(:ARG0(E, X) ∧ boy(X)))",
+        },
+        {
+            "index": 1,
+            "id": "a2",
+            "logic": "∃Y(book(Y) ∧ ∃E(:ARG1(E, Y) ∧ read-01(E) ∧ ∃X(:ARG0(E, X) ∧ girl(X))))",
+        },
+    ]
+    assert "converted 2 AMRs (0 errors)" in captured.err
+
+
+def test_main_reports_errors_and_keeps_going(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    input_path = tmp_path / "input.amr"
+    input_path.write_text("(x / broken :ARG0 )\n\n(s / smurf :ARG0 s)\n")
+    exit_code = main([str(input_path), "--workers", "2", "--progress-every", "0"])
+    assert exit_code == 1
+    captured = capsys.readouterr()
+    assert captured.out.splitlines() == ["", "smurf(s) ∧ :ARG0(s, s)"]
+    assert "error converting AMR 0" in captured.err
+
+
+def test_main_reports_graphs_that_fail_to_parse_and_keeps_going(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    input_path = tmp_path / "input.amr"
+    input_path.write_text(
+        '# ::id b1\n(b / boy :name "Mr (B)")\n'
+        "# ::id x1\n(x / broken :ARG0 (y / \n"
+        "# ::id c1\n(c / cat) (d / dog)\n"
+    )
+    exit_code = main([str(input_path), "--format", "jsonl", "--progress-every", "0"])
+    assert exit_code == 1
+    captured = capsys.readouterr()
+    records = [json.loads(line) for line in captured.out.splitlines()]
+    assert [record["id"] for record in records] == ["b1", "x1", "c1", None]
+    assert [record["logic"] for record in records] == [
+        'boy(b) ∧ :name(b, "Mr (B)")',
+        None,
+        "cat(c)",
+        "dog(d)",
+    ]
+    assert "error" in records[1]
+    assert "error converting AMR x1" in captured.err
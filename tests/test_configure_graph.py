@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import penman
+from penman.graph import Graph
+from penman.layout import POP, Push
+import pytest
+
+from amr_logic_converter import AmrLogicConverter
+from amr_logic_converter.configure_graph import configure_graph
+
+
+AMRS = [
+    "(e / giggle-01 :polarity - :ARG0 (x / boy))",
+    "(c / chase-01~4 :ARG0~5 (d / dog~7) :ARG1~3 (c2 / cat~2))",
+    "(y / book :ARG1-of (e / read-01 :ARG0 (x / girl)))",
+    "(a / alpha :consist-of (b / beta) :ARG0-of (c / gamma :ARG1 b~3))",
+    '(e / give-01 :ARG0 (x / person :named "Ms Ribble"~e.4) :ARG2 (y / child))',
+    "(a :ARG0 (b / beta :ARG1 a))",
+]
+
+
+@pytest.mark.parametrize("amr", AMRS)
+def test_configure_graph_matches_penman(amr: str) -> None:
+    graph = penman.decode(amr)
+    assert configure_graph(graph).node == penman.configure(graph).node
+    assert configure_graph(graph).metadata == graph.metadata
+
+
+def test_configure_graph_without_layout_markers() -> None:
+    graph = penman.decode(AMRS[2])
+    # penman has to improvise where to put each triple without the markers
+    unmarked_graph = Graph(list(reversed(graph.triples)), top=graph.top)
+    assert configure_graph(unmarked_graph).node == (
+        penman.configure(unmarked_graph).node
+    )
+
+
+def test_convert_graph() -> None:
+    converter = AmrLogicConverter(existentially_quantify_instances=True)
+    # the last AMR has a node without a concept, which can't be converted
+    for amr in AMRS[:-1]:
+        assert converter.convert(penman.decode(amr)) == converter.convert(amr)
+
+
+def test_configure_deep_graph() -> None:
+    depth = 5000
+    triples = [("n0", ":instance", "node")]
+    epidata: dict[tuple[str, str, str], list[object]] = {}
+    for index in range(1, depth):
+        edge = (f"n{index - 1}", ":ARG0", f"n{index}")
+        instance = (f"n{index}", ":instance", "node")
+        triples += [edge, instance]
+        epidata[edge] = [Push(f"n{index}")]
+        epidata[instance] = [POP] if index == depth - 1 else []
+    tree = configure_graph(Graph(triples, epidata=epidata))
+    node = tree.node
+    for _ in range(depth - 1):
+        node = node[1][1][1]
+    assert node == (f"n{depth - 1}", [("/", "node")])
@@ -0,0 +1,118 @@
+from __future__ import annotations
+import pickle
+
+import penman
+
+from amr_logic_converter import (
+    AmrLogicConverter,
+    ConversionMetrics,
+    MemoryResultCache,
+    MetricsCollector,
+)
+
+
+AMR = """
+(b / bad-07~1
+    :polarity -
+    :ARG1 (e / dry-01
+        :ARG0 (x / person :named "Mr Krupp")
+        :ARG1 x))
+"""
+
+
+class ListSink:
+    def __init__(self) -> None:
+        self.metrics: list[ConversionMetrics] = []
+
+    def record(self, metrics: ConversionMetrics) -> None:
+        self.metrics.append(metrics)
+
+
+def test_records_stages_and_counts() -> None:
+    sink = ListSink()
+    converter = AmrLogicConverter(metrics_sink=sink)
+    logic = converter.convert(AMR)
+    assert logic == AmrLogicConverter().convert(AMR)
+    [metrics] = sink.metrics
+    assert set(metrics.stage_seconds) == {
+        "parse",
+        "analyze",
+        "scope",
+        "edges",
+        # x is hoisted to the scope of e, so instances at the same scope are ordered
+        "projection_order",
+        "convert",
+    }
+    assert metrics.total_seconds > 0
+    assert metrics.num_nodes == 3
+    assert metrics.num_edges == 5
+    assert metrics.num_instances == 3
+    assert metrics.num_coreferent_instances == 1
+    assert metrics.callback_calls == {}
+    assert metrics.cache_hit is None
+
+
+def test_trees_are_recorded_without_parse_stage() -> None:
+    sink = ListSink()
+    converter = AmrLogicConverter(metrics_sink=sink, maximally_hoist_coreferences=True)
+    converter.convert(penman.parse(AMR))
+    [metrics] = sink.metrics
+    assert "parse" not in metrics.stage_seconds
+    # x is hoisted to the top scope by itself, so no instances need ordering
+    assert "projection_order" not in metrics.stage_seconds
+
+
+def test_graphs_are_recorded_with_configure_stage() -> None:
+    sink = ListSink()
+    converter = AmrLogicConverter(metrics_sink=sink)
+    converter.convert(penman.decode(AMR))
+    [metrics] = sink.metrics
+    assert "configure" in metrics.stage_seconds
+    assert "parse" not in metrics.stage_seconds
+    assert metrics.num_nodes == 3
+
+
+def test_records_callbacks() -> None:
+    sink = ListSink()
+    converter = AmrLogicConverter(
+        metrics_sink=sink,
+        override_is_projective=lambda info: None,
+        override_quantification=lambda clause, info: None,
+        override_conjunction=lambda info: None,
+    )
+    converter.convert(AMR)
+    [metrics] = sink.metrics
+    assert metrics.callback_calls == {
+        "override_is_projective": 3,
+        "override_quantification": 3,
+        "override_conjunction": 3,
+    }
+    assert set(metrics.callback_seconds) == set(metrics.callback_calls)
+
+
+def test_records_cache_hits() -> None:
+    sink = ListSink()
+    converter = AmrLogicConverter(metrics_sink=sink, result_cache=MemoryResultCache())
+    converter.convert(AMR)
+    converter.convert(AMR)
+    assert [metrics.cache_hit for metrics in sink.metrics] == [False, True]
+    assert "cache_set" in sink.metrics[0].stage_seconds
+    assert "convert" not in sink.metrics[1].stage_seconds
+
+
+def test_metrics_collector() -> None:
+    collector = MetricsCollector()
+    converter = AmrLogicConverter(metrics_sink=collector)
+    converter.convert(AMR)
+    converter.convert(AMR)
+    summary = collector.summary()
+    assert summary["num_conversions"] == 2
+    assert summary["num_nodes"] == 6
+    assert summary["mean_stage_seconds"]["convert"] == (
+        summary["stage_seconds"]["convert"] / 2
+    )
+    # collectors can be sent to worker processes
+    copied_collector = pickle.loads(pickle.dumps(collector))
+    assert copied_collector.summary() == summary
+    collector.reset()
+    assert collector.summary()["num_conversions"] == 0
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from penman.tree import Tree
+import pytest
+
+from amr_logic_converter import AmrLogicConverter
+
+
+converter = AmrLogicConverter(
+    existentially_quantify_instances=True, capitalize_variables=False
+)
+
+AMRS = [
+    "(e / giggle-01 :polarity - :ARG0 (x / boy))",
+    "(y / book :ARG1-of (e / read-01 :ARG0 (x / girl)))",
+    "(e / dry-01 :ARG0 (x / person) :ARG1 x)",
+    "(s / smurf :ARG0 s :ARG1 s)",
+    '(e / give-01 :ARG0 (x / person :named "Ms Ribble") :ARG2 (y / child))',
+]
+
+
+def test_convert_many_matches_convert_in_input_order() -> None:
+    results = list(converter.convert_many(AMRS, chunksize=2))
+    assert [result.index for result in results] == list(range(len(AMRS)))
+    assert [result.logic for result in results] == [
+        converter.convert(amr) for amr in AMRS
+    ]
+    assert all(result.error is None for result in results)
+
+
+def test_convert_many_reports_errors_without_aborting_the_batch() -> None:
+    amrs = [AMRS[0], "(e / giggle-01 :ARG0 (x / boy)", AMRS[1]]
+    results = list(converter.convert_many(amrs))
+    assert results[0].logic == converter.convert(AMRS[0])
+    assert results[1].logic is None
+    assert results[1].error is not None
+    assert results[2].logic == converter.convert(AMRS[1])
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_convert_many_with_multiple_workers(ordered: bool) -> None:
+    amrs = [*AMRS, "(x / broken", *AMRS] * 3
+    results = list(
+        converter.convert_many(amrs, workers=2, chunksize=3, ordered=ordered)
+    )
+    if ordered:
+        assert [result.index for result in results] == list(range(len(amrs)))
+    results.sort(key=lambda result: result.index)
+    for amr, result in zip(amrs, results):
+        if amr == "(x / broken":
+            assert result.error is not None
+        else:
+            assert str(result.logic) == str(converter.convert(amr))
+
+
+def test_convert_many_validates_arguments() -> None:
+    with pytest.raises(ValueError):
+        converter.convert_many(AMRS, workers=0)
+    with pytest.raises(ValueError):
+        converter.convert_many(AMRS, chunksize=0)
+
+
+def test_convert_many_with_multiple_workers_reports_amrs_that_cant_be_sent() -> None:
+    class UnpicklableTree(Tree):
+        pass
+
+    # formulas nested this deeply used to hit the recursion limit when pickled
+    deep_amr = (
+        "(x0 / thing"
+        + "".join(f" :ARG0 (x{i} / thing" for i in range(1, 300))
+        + ")" * 300
+    )
+    amrs = [AMRS[0], deep_amr, AMRS[1], UnpicklableTree(("x", [("/", "boy")])), AMRS[2]]
+    results = list(converter.convert_many(amrs, workers=2, chunksize=1))
+    assert [result.index for result in results] == list(range(len(amrs)))
+    assert str(results[1].logic) == str(converter.convert(deep_amr))
+    assert results[3].logic is None
+    assert results[3].error is not None
+    for index in [0, 2, 4]:
+        assert results[index].logic == converter.convert(amrs[index])
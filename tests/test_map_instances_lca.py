@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from penman import parse
+from penman.tree import Node, Tree
 from amr_logic_converter.extract_instances_from_amr_tree import (
     extract_instances_from_amr_tree,
 )
@@ -60,3 +61,55 @@ def test_map_instances_lca_with_coreference_across_branch() -> None:
         "x": "e",
         "g": "g",
     }
+
+
+def test_map_instances_lca_with_coreference_at_same_depth_and_role_in_different_branches() -> None:
+    amr_str = """
+    (a / and
+        :op1 (b / bark-01
+            :ARG0 d)
+        :op2 (w / wag-01
+            :ARG0 (d / dog)))
+    """
+    tree = parse(amr_str)
+    instances = extract_instances_from_amr_tree(tree)
+    assert map_instances_lca(tree, instances) == {
+        "a": "a",
+        "b": "b",
+        "w": "w",
+        "d": "a",
+    }
+
+
+def test_map_instances_lca_with_deeply_nested_coreference() -> None:
+    amr_str = """
+    (a / a
+        :ARG0 (b / b
+            :ARG0 (c / c
+                :ARG0 (d / d
+                    :ARG0 (e / e
+                        :ARG0 b)))
+            :ARG1 (f / f
+                :ARG0 c)))
+    """
+    tree = parse(amr_str)
+    instances = extract_instances_from_amr_tree(tree)
+    assert map_instances_lca(tree, instances) == {
+        "a": "a",
+        "b": "b",
+        "c": "b",
+        "d": "d",
+        "e": "e",
+        "f": "f",
+    }
+
+
+def test_map_instances_lca_handles_very_deep_trees_without_recursion() -> None:
+    depth = 5000
+    node: Node = ("x5000", [("/", "thing"), (":mod", "x1")])
+    for i in reversed(range(depth)):
+        node = (f"x{i}", [("/", "thing"), (":ARG0", node)])
+    tree = Tree(node)
+    lca_map = map_instances_lca(tree, extract_instances_from_amr_tree(tree))
+    assert lca_map["x1"] == "x1"
+    assert lca_map["x4000"] == "x4000"
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import pytest
+
+from amr_logic_converter import AmrLogicConverter
+from amr_logic_converter.parse_clause import parse_clause
+from amr_logic_converter.serialize_clause import ASCII_SYMBOLS, serialize_clause
+from amr_logic_converter.types import (
+    All,
+    And,
+    Clause,
+    Constant,
+    Exists,
+    Implies,
+    Not,
+    Or,
+    Predicate,
+    Variable,
+)
+
+
+P = Predicate("P")
+X = Variable("X")
+
+CLAUSE = All(
+    X,
+    Implies(
+        And(
+            P(X), Or(P(Constant('"a, (b)"', "string")), Not(P(Constant("c", "symbol"))))
+        ),
+        Not(Exists(Variable("Y"), And(P(Variable("Y")), P(X, Variable("Y"))))),
+    ),
+)
+
+
+def test_parse_clause_round_trips() -> None:
+    assert parse_clause(str(CLAUSE)) == CLAUSE
+    assert parse_clause(serialize_clause(CLAUSE, ASCII_SYMBOLS), ASCII_SYMBOLS) == (
+        CLAUSE
+    )
+
+
+def test_parse_converted_logic() -> None:
+    converter = AmrLogicConverter(use_implies_for_conditions=True)
+    logic = converter.convert(
+        """
+        (w / want-01 :polarity -
+            :ARG0 (b / boy)
+            :ARG1 (g / girl :named "Ms Ribble" :quant 5)
+            :condition (r / rain-01))
+        """
+    )
+    assert parse_clause(str(logic), instances=["w", "b", "g", "r"]) == logic
+
+
+def test_parse_clause_variables_and_instances() -> None:
+    clause = parse_clause("P(X, y, z) ∧ ∃z(Q(z))", variables=["X"], instances=["y"])
+    assert clause == And(
+        P(X, Constant("y", "instance"), Constant("z", "symbol")),
+        Exists(Variable("z"), Predicate("Q")(Variable("z"))),
+    )
+
+
+def test_parse_clause_handles_deeply_nested_clauses_without_recursion() -> None:
+    clause: Clause = P(Constant("a", "symbol"))
+    for _ in range(10000):
+        clause = Not(Implies(P(X), Or(P(X), clause)))
+    serialized = serialize_clause(clause)
+    assert serialize_clause(parse_clause(serialized, variables=["X"])) == serialized
+
+
+@pytest.mark.parametrize(
+    "logic_str",
+    ["", "P(a) ∧", "P(a) ∧ Q(b) ∨ R(c)", "(P(a)", "P(a))", "P(a) Q(b)", "¬", "P(a, "],
+)
+def test_parse_clause_rejects_invalid_logic(logic_str: str) -> None:
+    with pytest.raises(ValueError):
+        parse_clause(logic_str)
@@ -0,0 +1,150 @@
+from __future__ import annotations
+from pathlib import Path
+import pickle
+from typing import Optional, cast
+
+import penman
+from penman.tree import Node, Tree
+import pytest
+
+from amr_logic_converter import (
+    AmrLogicConverter,
+    MemoryResultCache,
+    SqliteResultCache,
+)
+from amr_logic_converter.result_cache import make_result_cache_key
+from amr_logic_converter.types import Clause
+
+
+AMR = "(e / giggle-01 :polarity - :ARG0 (x / boy))"
+
+
+class CountingCache(MemoryResultCache):
+    def __init__(self) -> None:
+        super().__init__()
+        self.hits = 0
+
+    def get(self, key: str) -> Optional[Clause]:
+        logic = super().get(key)
+        if logic is not None:
+            self.hits += 1
+        return logic
+
+
+def test_converter_reuses_cached_results() -> None:
+    cache = CountingCache()
+    converter = AmrLogicConverter(result_cache=cache)
+    logic = converter.convert(AMR)
+    assert converter.convert(AMR) is logic
+    # metadata and formatting don't change the cache key
+    reformatted_amr = """
+    # ::id 1
+    (e / giggle-01
+        :polarity -
+        :ARG0 (x / boy))
+    """
+    assert converter.convert(reformatted_amr) is logic
+    assert cache.hits == 2
+    assert logic == AmrLogicConverter().convert(AMR)
+
+
+def test_converters_with_different_options_dont_share_results() -> None:
+    cache = MemoryResultCache()
+    logic1 = AmrLogicConverter(result_cache=cache).convert(AMR)
+    logic2 = AmrLogicConverter(
+        result_cache=cache, existentially_quantify_instances=True
+    ).convert(AMR)
+    assert logic1 != logic2
+    assert len(cache) == 2
+
+
+def test_cache_key_depends_on_the_tree_layout() -> None:
+    tree1 = penman.parse("(e / read-01 :ARG0 (x / girl))")
+    tree2 = penman.parse("(x / girl :ARG0-of (e / read-01))")
+    assert make_result_cache_key(tree1, ()) != make_result_cache_key(tree2, ())
+    assert make_result_cache_key(tree1, ()) != make_result_cache_key(tree1, (True,))
+
+
+def test_cache_key_handles_deeply_nested_trees() -> None:
+    node = cast(Node, ("x0", [("/", "thing")]))
+    for i in range(1, 5000):
+        node = cast(Node, (f"x{i}", [("/", "thing"), (":ARG0", node)]))
+    assert len(make_result_cache_key(Tree(node), ())) == 64
+
+
+def test_memory_result_cache_evicts_least_recently_used_results() -> None:
+    converter = AmrLogicConverter()
+    logic = converter.convert(AMR)
+    cache = MemoryResultCache(max_size=2)
+    cache.set("a", logic)
+    cache.set("b", logic)
+    cache.get("a")
+    cache.set("c", logic)
+    assert cache.get("a") is logic
+    assert cache.get("b") is None
+    assert cache.get("c") is logic
+
+
+def test_memory_result_cache_can_be_pickled() -> None:
+    cache = MemoryResultCache(max_size=2)
+    logic = AmrLogicConverter().convert(AMR)
+    cache.set("key", logic)
+    unpickled = pickle.loads(pickle.dumps(cache))
+    assert unpickled.max_size == 2
+    assert unpickled.get("key") == logic
+    unpickled.set("other", logic)
+    assert len(unpickled) == 2
+    assert len(cache) == 1
+    converter = AmrLogicConverter(result_cache=cache)
+    assert pickle.loads(pickle.dumps(converter)).convert(AMR) == logic
+
+
+def test_sqlite_result_cache_persists_results(tmp_path: Path) -> None:
+    path = tmp_path / "cache.sqlite"
+    logic = AmrLogicConverter(result_cache=SqliteResultCache(path)).convert(AMR)
+    reopened_cache = SqliteResultCache(path)
+    assert len(reopened_cache) == 1
+    assert AmrLogicConverter(result_cache=reopened_cache).convert(AMR) == logic
+    reopened_cache.clear()
+    assert len(reopened_cache) == 0
+
+
+def test_sqlite_result_cache_can_be_pickled(tmp_path: Path) -> None:
+    cache = SqliteResultCache(tmp_path / "cache.sqlite")
+    logic = AmrLogicConverter().convert(AMR)
+    cache.set("key", logic)
+    unpickled = pickle.loads(pickle.dumps(cache))
+    assert unpickled.get("key") == logic
+
+
+def test_callbacks_require_a_cache_key() -> None:
+    with pytest.raises(ValueError):
+        AmrLogicConverter(
+            result_cache=MemoryResultCache(),
+            override_conjunction=lambda _info: None,
+        )
+    converter = AmrLogicConverter(
+        result_cache=MemoryResultCache(),
+        override_conjunction=lambda _info: None,
+        cache_key="no-op-conjunction-v1",
+    )
+    assert converter.convert(AMR) == AmrLogicConverter().convert(AMR)
+
+
+def test_callbacks_set_after_construction_require_a_cache_key() -> None:
+    converter = AmrLogicConverter(result_cache=MemoryResultCache())
+    converter.override_quantification = lambda _clause, _info: None
+    with pytest.raises(ValueError):
+        converter.convert(AMR)
+
+
+def test_sqlite_result_cache_stores_deeply_nested_logic(tmp_path: Path) -> None:
+    node = cast(Node, ("x0", [("/", "thing")]))
+    for i in range(1, 3000):
+        node = cast(Node, (f"x{i}~e.{i}", [("/", "thing"), (":ARG0", node)]))
+    logic = AmrLogicConverter(existentially_quantify_instances=True).convert(Tree(node))
+    cache = SqliteResultCache(tmp_path / "cache.sqlite")
+    cache.set("key", logic)
+    cached_logic = SqliteResultCache(cache.path).get("key")
+    assert str(cached_logic) == str(logic)
+    assert hash(cached_logic) == hash(logic)
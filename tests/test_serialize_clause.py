@@ -0,0 +1,65 @@
+from __future__ import annotations
+from io import StringIO
+
+from amr_logic_converter.serialize_clause import (
+    ASCII_SYMBOLS,
+    serialize_clause,
+    write_clause,
+)
+from amr_logic_converter.types import (
+    All,
+    And,
+    Clause,
+    Constant,
+    Exists,
+    Implies,
+    Not,
+    Or,
+    Predicate,
+    Variable,
+)
+
+
+P = Predicate("P")
+X = Variable("X")
+
+CLAUSE = All(
+    X,
+    Implies(
+        And(P(X), Or(P(Constant('"a b"', "string")), Not(P(Constant("c", "symbol"))))),
+        Not(Exists(Variable("Y"), And(P(Variable("Y")), P(X, Variable("Y"))))),
+    ),
+)
+
+
+def test_serialize_clause_matches_str() -> None:
+    assert (
+        serialize_clause(CLAUSE)
+        == str(CLAUSE)
+        == '∀X((P(X) ∧ (P("a b") ∨ ¬P(c))) → ¬∃Y(P(Y) ∧ P(X, Y)))'
+    )
+
+
+def test_serialize_clause_with_ascii_symbols() -> None:
+    assert (
+        serialize_clause(CLAUSE, ASCII_SYMBOLS)
+        == 'all X((P(X) & (P("a b") | ~P(c))) -> ~exists Y(P(Y) & P(X, Y)))'
+    )
+
+
+def test_write_clause_writes_to_a_stream() -> None:
+    stream = StringIO()
+    write_clause(CLAUSE, stream)
+    write_clause(CLAUSE, stream, ASCII_SYMBOLS)
+    assert stream.getvalue() == serialize_clause(CLAUSE) + serialize_clause(
+        CLAUSE, ASCII_SYMBOLS
+    )
+
+
+def test_serialize_clause_handles_deeply_nested_clauses_without_recursion() -> None:
+    clause: Clause = P(Constant("a", "symbol"))
+    for _ in range(10000):
+        clause = Not(Implies(P(X), Or(P(X), clause)))
+    serialized = serialize_clause(clause, ASCII_SYMBOLS)
+    assert serialized.startswith("~(P(X) -> (P(X) | ~(P(X) -> (P(X) | ")
+    assert serialized.endswith("P(a)" + "))" * 10000)
@@ -1,4 +1,20 @@
-from amr_logic_converter.types import Constant, And, Implies, Or, Predicate
+from dataclasses import FrozenInstanceError
+import pickle
+
+from penman.surface import Alignment
+import pytest
+
+from amr_logic_converter.types import (
+    And,
+    Clause,
+    Constant,
+    Exists,
+    Implies,
+    Not,
+    Or,
+    Predicate,
+    Variable,
+)
 
 
 P = Predicate("P")
@@ -73,3 +89,89 @@ def test_imples_adds_parens_to_nested_clauses_when_printing() -> None:
         P(Constant("d", "symbol")),
     )
     assert str(implies) == "((P(a) ∨ P(b)) ∧ P(c)) → P(d)"
+
+
+def test_str_handles_deeply_nested_clauses_without_recursion() -> None:
+    clause: Clause = P(Constant("a", "symbol"))
+    for _ in range(10000):
+        clause = Not(Exists(Variable("X"), And(P(Variable("X")), clause)))
+    clause_str = str(clause)
+    assert clause_str.startswith("¬∃X(P(X) ∧ ¬∃X(P(X) ∧ ")
+    assert clause_str.endswith("¬∃X(P(X) ∧ P(a))" + ")" * 9999)
+
+
+def test_logic_types_are_hashable_and_equal_by_value() -> None:
+    clause1 = Exists(
+        Variable("X"), And(P(Variable("X")), Not(Predicate("Q", Alignment((1,)))()))
+    )
+    clause2 = Exists(
+        Variable("X"), And(P(Variable("X")), Not(Predicate("Q", Alignment((1,)))()))
+    )
+    assert clause1 == clause2
+    assert hash(clause1) == hash(clause2)
+    assert len({clause1, clause2}) == 1
+    assert clause1 != Exists(Variable("X"), And(P(Variable("X")), P(Variable("X"))))
+
+
+def test_logic_types_are_immutable() -> None:
+    atom = P(Constant("a", "symbol"))
+    with pytest.raises(FrozenInstanceError):
+        atom.terms = ()  # type: ignore
+    with pytest.raises(FrozenInstanceError):
+        atom.predicate.symbol = "Q"  # type: ignore
+
+
+def test_logic_types_can_be_pickled() -> None:
+    clause = Implies(
+        And(P(Constant('"foo"', "string")), P(Constant("b~e.2", "instance"))),
+        Or(Not(P(Variable("X"))), P(Variable("Y"))),
+    )
+    unpickled = pickle.loads(pickle.dumps(clause))
+    assert unpickled == clause
+    assert hash(unpickled) == hash(clause)
+    assert str(unpickled) == str(clause)
+
+
+def test_hash_handles_deeply_nested_clauses_without_recursion() -> None:
+    clause1: Clause = P(Constant("a", "symbol"))
+    clause2: Clause = P(Constant("a", "symbol"))
+    for _ in range(10000):
+        clause1 = Not(And(P(Variable("X")), clause1))
+        clause2 = Not(And(P(Variable("X")), clause2))
+    assert hash(clause1) == hash(clause2)
+
+
+def _deep_clause(depth: int, innermost: str = "a") -> Clause:
+    clause: Clause = P(Constant(innermost, "symbol"))
+    for _ in range(depth):
+        clause = Exists(Variable("X"), Not(And(P(Variable("X")), clause)))
+    return clause
+
+
+def test_eq_handles_deeply_nested_clauses_without_recursion() -> None:
+    assert _deep_clause(3000) == _deep_clause(3000)
+    assert _deep_clause(3000) != _deep_clause(3000, innermost="b")
+    assert _deep_clause(3000) != _deep_clause(2999)
+    clause1 = _deep_clause(3000)
+    clause2 = _deep_clause(3000, innermost="b")
+    hash(clause1)
+    hash(clause2)
+    assert clause1 != clause2
+
+
+def test_deeply_nested_clauses_can_be_set_members() -> None:
+    clauses = {_deep_clause(3000), _deep_clause(3000), _deep_clause(3000, "b")}
+    assert len(clauses) == 2
+    assert _deep_clause(3000) in clauses
+
+
+def test_pickle_handles_deeply_nested_clauses_without_recursion() -> None:
+    shared = P(Variable("X"))
+    clause: Clause = P(Constant("a", "symbol"))
+    for _ in range(10000):
+        clause = Not(And(shared, clause, shared))
+    unpickled = pickle.loads(pickle.dumps(clause))
+    assert str(unpickled) == str(clause)
+    assert hash(unpickled) == hash(clause)
+    assert isinstance(unpickled, Not) and isinstance(unpickled.body, And)
+    assert unpickled.body.args[0] is unpickled.body.args[2]